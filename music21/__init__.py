@@ -125,6 +125,7 @@ __all__ = [
     'tempo',
     'text', 
     'tie',
+    'timespans',
     'tinyNotation', 
     'variant',
     'voiceLeading',
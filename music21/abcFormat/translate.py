@@ -297,14 +297,11 @@ def abcToStreamPart(abcHandler, inputM21=None, spannerBundle=None):
             environLocal.warn("Error in beaming...ignoring: %s" % str(e))
 
     # copy spanners into topmost container; here, a part
-    rm = []
-    for sp in spannerBundle.getByCompleteStatus(True):
-        p._insertCore(0, sp)
-        rm.append(sp)
+    rm = spannerBundle.getByCompleteStatus(True)
+    p._insertManyCore([(0, sp) for sp in rm])
     # remove from original spanner bundle
     for sp in rm:
         spannerBundle.remove(sp)
-    p._elementsChanged()
     return p
 
 
@@ -376,9 +373,7 @@ def abcToStreamScore(abcHandler, inputM21=None):
         p = abcToStreamPart(partHandler)
         partList.append(p)
 
-    for p in partList:
-        s._insertCore(0, p)
-    s._elementsChanged()
+    s._insertManyCore([(0, p) for p in partList])
     return s
 
 
@@ -345,6 +345,18 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         ''' Takes in a list of probably key results in points and returns a
             list of keys in letters, sorted from most likely to least likely
         '''
+        likelyKeys = self._getLikelyKeyPitchClasses(keyResults, differences)
+        # case of empty data
+        if likelyKeys == None:
+            return None
+        # pitch objects created here
+        return [(pitch.Pitch(pc), coefficient)
+                for pc, coefficient in likelyKeys]
+
+    def _getLikelyKeyPitchClasses(self, keyResults, differences):
+        ''' As _getLikelyKeys, but returns pitch classes rather than Pitch
+            objects.
+        '''
         # case of empty data
         if keyResults == None:
             return None
@@ -355,9 +367,8 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         
         #Return pairs, the pitch class and the correlation value, in order by point value
         for i in range(len(a)):
-            # pitch objects created here
-            likelyKeys[i] = (pitch.Pitch(keyResults.index(a[i])),
-                             differences[keyResults.index(a[i])])
+            pc = keyResults.index(a[i])
+            likelyKeys[i] = (pc, differences[pc])
             #environLocal.printDebug(['added likely key', likelyKeys[i]])
         return likelyKeys
         
@@ -379,23 +390,82 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         profileAverage = float(sum(toneWeights)) / len(toneWeights)
         histogramAverage = float(sum(pcDistribution)) / len(pcDistribution) 
             
+        # deviations from the average do not depend on i
+        toneDeviations = [w - profileAverage for w in toneWeights]
+        histogramDeviations = [x - histogramAverage for x in pcDistribution]
+
         for i in range(len(soln)):
             for j in range(len(toneWeights)):
-                top[i] = top[i] + ((
-                    toneWeights[(j - i) % 12]-profileAverage) * (
-                    pcDistribution[j]-histogramAverage))
+                top[i] = top[i] + (
+                    toneDeviations[(j - i) % 12] * histogramDeviations[j])
 
-                bottomRight[i] = bottomRight[i] + ((
-                    toneWeights[(j-i)%12]-profileAverage)**2)
-                bottomLeft[i] = bottomLeft[i] + ((
-                    pcDistribution[j]-histogramAverage)**2)
+                bottomRight[i] = bottomRight[i] + (
+                    toneDeviations[(j - i) % 12]**2)
+                bottomLeft[i] = bottomLeft[i] + (histogramDeviations[j]**2)
 
-                if (bottomRight[i] == 0 or bottomLeft[i] == 0):
-                    soln[i] = 0
-                else:
-                    soln[i] = float(top[i]) / ((bottomRight[i]*bottomLeft[i])**.5)
+            if (bottomRight[i] == 0 or bottomLeft[i] == 0):
+                soln[i] = 0
+            else:
+                soln[i] = float(top[i]) / ((bottomRight[i]*bottomLeft[i])**.5)
         return soln    
 
+    def _getCorrelationMatrix(self, pcDistributions):
+        ''' Takes in a list of pitch class distributions and returns, for
+            each, a list of the correlation coefficients of the 12 major
+            keys (from C) and then the 12 minor keys, as _getDifference
+            would return them; the parts of the computation that depend
+            only on the key weights are done once for all distributions.
+            Distributions that are None get None.
+
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> dist = [9, 0, 3, 0, 2, 5, 0, 2, 0, 2, 2, 0]
+        >>> rows = p._getCorrelationMatrix([dist, None])
+        >>> len(rows[0]), rows[1]
+        (24, None)
+        >>> rows[0][:12] == p._getDifference(True, dist, 'major')
+        True
+        '''
+        weightData = []
+        for weightType in ('major', 'minor'):
+            toneWeights = self._getWeights(weightType)
+            profileAverage = float(sum(toneWeights)) / len(toneWeights)
+            toneDeviations = [w - profileAverage for w in toneWeights]
+            # the rotations of the profile, and their sums of squares,
+            # summed in the order used by _getDifference
+            rotations = []
+            bottomRights = []
+            for i in range(12):
+                rotation = [toneDeviations[(j - i) % 12] for j in range(12)]
+                bottomRight = 0
+                for x in rotation:
+                    bottomRight = bottomRight + (x**2)
+                rotations.append(rotation)
+                bottomRights.append(bottomRight)
+            weightData.append((rotations, bottomRights))
+
+        matrix = []
+        for pcDistribution in pcDistributions:
+            if pcDistribution is None:
+                matrix.append(None)
+                continue
+            histogramAverage = float(sum(pcDistribution)) / len(pcDistribution)
+            histogramDeviations = [x - histogramAverage for x in pcDistribution]
+            bottomLeft = 0
+            for x in histogramDeviations:
+                bottomLeft = bottomLeft + (x**2)
+            row = []
+            for rotations, bottomRights in weightData:
+                for i in range(12):
+                    top = 0
+                    for w, x in zip(rotations[i], histogramDeviations):
+                        top = top + (w * x)
+                    if bottomRights[i] == 0 or bottomLeft == 0:
+                        row.append(0)
+                    else:
+                        row.append(float(top) / ((bottomRights[i] * bottomLeft)**.5))
+            matrix.append(row)
+        return matrix
+
     def solutionLegend(self, compress=False):
         ''' Returns a list of lists of possible results for the creation of a legend.
 
@@ -569,9 +639,23 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         
         # this is the distribution for the melody of "happy birthday"
         #pcDistribution = [9,0,3,0,2,5,0,2,0,2,2,0]
-    
-        likelyKeysMajor, likelyKeysMinor = self._likelyKeys(sStream)
+        pcDistribution = self._getPitchClassDistribution(sStream)
+        return self.processPitchClassDistribution(pcDistribution,
+            storeAlternatives=storeAlternatives)
 
+    def processPitchClassDistribution(self, pcDistribution,
+        storeAlternatives=False):
+        '''
+        Perform the analysis of :meth:`process` given a pitch class
+        distribution, as returned by `_getPitchClassDistribution`, rather
+        than a Stream; this is used by
+        :class:`~music21.analysis.windowed.WindowedAnalysis` to analyze
+        many windows without creating a Stream for each.
+
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> p.processPitchClassDistribution([9, 0, 3, 0, 2, 5, 0, 2, 0, 2, 2, 0])
+        ((<music21.pitch.Pitch F>, 'major', 0.824...), '#c8ffff')
+        '''
         #find the largest correlation value to use to select major or minor as the resulting key
         # values are the result of _getLikelyKeys
         # each first index is the sorted results; there will be 12
@@ -585,14 +669,18 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
 
         # see which has a higher correlation coefficient, the first major or the
         # the first minor
-        if likelyKeysMajor is not None:
-            sortList = [(coefficient, p, 'major') for 
-                        (p, coefficient) in likelyKeysMajor]
-        else:
-            sortList = []
-        if likelyKeysMinor is not None:
-            sortList += [(coefficient, p, 'minor') for 
-                         (p, coefficient) in likelyKeysMinor]
+        # pitch classes are used in place of Pitch objects, which are only
+        # created for the solutions; they sort in the same order
+        sortList = []
+        for mode in ('major', 'minor'):
+            keyResults = self._convoluteDistribution(pcDistribution, mode)
+            differences = self._getDifference(keyResults, pcDistribution,
+                mode)
+            likelyKeys = self._getLikelyKeyPitchClasses(keyResults,
+                differences)
+            if likelyKeys is not None:
+                sortList += [(coefficient, pc, mode) for
+                             (pc, coefficient) in likelyKeys]
         if len(sortList) == 0:
             raise DiscreteAnalysisException('failed to get likely keys for Stream component')
 
@@ -600,8 +688,8 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         sortList.reverse()
         #environLocal.printDebug(['sortList', sortList])
 
-        coefficient, p, mode = sortList[0]
-        p = self._bestKeyEnharmonic(p, mode, sStream)
+        coefficient, pc, mode = sortList[0]
+        p = self._bestKeyEnharmonic(pitch.Pitch(pc), mode)
         solution = (p, mode, coefficient)
 
         color = self.solutionToColor(solution)
@@ -610,9 +698,9 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         if storeAlternatives:
             self._alternativeSolutions = []
             # get all but first
-            for coefficient, p, mode in sortList[1:]:
+            for coefficient, pc, mode in sortList[1:]:
                 # adjust enharmonic spelling
-                p = self._bestKeyEnharmonic(p, mode, sStream)
+                p = self._bestKeyEnharmonic(pitch.Pitch(pc), mode)
                 self._alternativeSolutions.append((p, mode, coefficient))
 
         # store solutions for compressed legend generation
@@ -1270,6 +1358,26 @@ def analyzeStream(streamObj, *args, **keywords):
     >>> s.analyze('range')
     <music21.interval.Interval m21>
 
+    '''
+    if 'method' in keywords:
+        method = keywords['method']
+    if len(args) > 0:
+        method = args[0]
+    analysisClass = _getAnalysisClass(method)
+    obj = analysisClass()
+    #environLocal.printDebug(['analysis method used:', obj])
+    return obj.getSolution(streamObj)
+
+
+def _getAnalysisClass(method):
+    '''
+    Return the analysis class matching `method`, as described in
+    :func:`~music21.analysis.discrete.analyzeStream`.
+
+    >>> analysis.discrete._getAnalysisClass('krumhansl')
+    <class 'music21.analysis.discrete.KrumhanslSchmuckler'>
+    >>> analysis.discrete._getAnalysisClass('aarden')
+    <class 'music21.analysis.discrete.AardenEssen'>
     '''
     analysisClasses = [
         Ambitus,
@@ -1281,10 +1389,6 @@ def analyzeStream(streamObj, *args, **keywords):
         TemperleyKostkaPayne,
     ]
 
-    if 'method' in keywords:
-        method = keywords['method']
-    if len(args) > 0:
-        method = args[0]
     match = None
     for analysisClassName in analysisClasses:    
         # this is a very loose matching, as there are few classes now
@@ -1302,13 +1406,69 @@ def analyzeStream(streamObj, *args, **keywords):
             if match != None:
                 break
     if match != None:
-        obj = analysisClassName()
-        #environLocal.printDebug(['analysis method used:', obj])
-        return obj.getSolution(streamObj)
+        return match
 
     # if no match raise error
     raise DiscreteAnalysisException('no such analysis method: %s' % method)
 
+
+def analyzeMany(streams, method='KrumhanslSchmuckler'):
+    '''
+    Find the key of each of a list of Streams with a key-weight method
+    (any :class:`~music21.analysis.discrete.KeyWeightKeyAnalysis` subclass,
+    found from `method` as in
+    :func:`~music21.analysis.discrete.analyzeStream`).
+
+    Returns a list of :class:`~music21.key.Key` objects, the same as those
+    found by :func:`~music21.analysis.discrete.analyzeStream`, and a list of
+    the correlation coefficients of all keys for each Stream: 24 values,
+    for the major keys on C, C#, D, ..., B and then the minor keys. For a
+    Stream without notes, both are None.
+
+    The pitch class distribution of each Stream is found without creating
+    new Streams, and the key weights are prepared once for all of them.
+
+    >>> from music21 import corpus
+    >>> streams = [corpus.parse('bwv66.6'), corpus.parse('bwv57.8'),
+    ...     stream.Stream()]
+    >>> keys, correlations = analysis.discrete.analyzeMany(streams, 'key')
+    >>> keys
+    [<music21.key.Key of f# minor>, <music21.key.Key of B- major>, None]
+    >>> len(correlations[0])
+    24
+    >>> correlations[0][12 + 6] == keys[0].correlationCoefficient
+    True
+
+    >>> keys, correlations = analysis.discrete.analyzeMany(streams[:1], 'aarden')
+    >>> keys
+    [<music21.key.Key of f# minor>]
+    '''
+    analysisClass = _getAnalysisClass(method)
+    if not issubclass(analysisClass, KeyWeightKeyAnalysis):
+        raise DiscreteAnalysisException(
+            'analyzeMany() requires a key-weight analysis method, not: %s' % method)
+    processor = analysisClass()
+
+    pcDistributions = []
+    for streamObj in streams:
+        # a view, like .flat, but without creating a new Stream
+        pcDistributions.append(processor._getPitchClassDistribution(
+            streamObj.flatView.notesAndRests))
+    correlations = processor._getCorrelationMatrix(pcDistributions)
+
+    keys = []
+    for pcDistribution in pcDistributions:
+        if pcDistribution is None:
+            keys.append(None)
+            continue
+        solution, unused_color = processor.processPitchClassDistribution(
+            pcDistribution, storeAlternatives=True)
+        k = processor._solutionToObject(solution)
+        for sol in processor._alternativeSolutions:
+            k.alternateInterpretations.append(processor._solutionToObject(sol))
+        keys.append(k)
+    return keys, correlations
+
 #------------------------------------------------------------------------------
 class TestExternal(unittest.TestCase):
 
@@ -1477,9 +1637,32 @@ class Test(unittest.TestCase):
         #s.plot('grid', 'KrumhanslSchmuckler')
         #s.plot('windowed', 'aarden')
 
+    def testAnalyzeMany(self):
+        from music21 import corpus, note, stream
+        s = stream.Stream()
+        s.repeatAppend(note.Note('c'), 6)
+        s.repeatAppend(note.Note('g'), 4)
+        s.repeatAppend(note.Note('a'), 2)
+        streams = [s, corpus.parse('bwv66.6'), corpus.parse('bwv57.8')]
+        for method in ['KrumhanslSchmuckler', 'AardenEssen', 'BellmanBudge',
+            'TemperleyKostkaPayne', 'SimpleWeights']:
+            keys, correlations = analyzeMany(streams, method)
+            for i, streamObj in enumerate(streams):
+                k = analyzeStream(streamObj, method)
+                self.assertEqual(str(keys[i]), str(k))
+                self.assertEqual(keys[i].correlationCoefficient,
+                    k.correlationCoefficient)
+                self.assertEqual(str(keys[i].alternateInterpretations),
+                    str(k.alternateInterpretations))
+                self.assertEqual(max(correlations[i]),
+                    k.correlationCoefficient)
+
+        self.assertRaises(DiscreteAnalysisException, analyzeMany, streams,
+            'ambitus')
+
 
 # define presented order in documentation
-_DOC_ORDER = [analyzeStream, DiscreteAnalysis, Ambitus, MelodicIntervalDiversity, KeyWeightKeyAnalysis, SimpleWeights, AardenEssen, BellmanBudge, KrumhanslSchmuckler, KrumhanslKessler, TemperleyKostkaPayne]
+_DOC_ORDER = [analyzeStream, analyzeMany, DiscreteAnalysis, Ambitus, MelodicIntervalDiversity, KeyWeightKeyAnalysis, SimpleWeights, AardenEssen, BellmanBudge, KrumhanslSchmuckler, KrumhanslKessler, TemperleyKostkaPayne]
 
 #------------------------------------------------------------------------------
 
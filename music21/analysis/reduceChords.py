@@ -20,6 +20,7 @@ from music21 import meter
 from music21 import note
 from music21 import stream
 from music21 import tie
+from music21 import timespans
 from music21 import environment
 
 environLocal = environment.Environment('reduceChords')
@@ -115,73 +116,25 @@ class Verticality(object):
                     New: (<music21.note.Note C>,)
 
         '''
-        leafLists = []
+        timespanList = []
         for part in expr:
             innerMeasure = part.getElementsByClass('Measure')[0]
-            leaves = innerMeasure.notesAndRests
-            leafLists.append(leaves)
-        currentIndices = [0 for _ in leafLists]
-        currentStartOffset = None
-        earliestStopOffset = None
-        latestStopOffset = None
-        for i, index in enumerate(currentIndices):
-            leaf = leafLists[i][index]
-            startOffset = leaf.offset
-            stopOffset = leaf.offset + leaf.quarterLength
-            if currentStartOffset is None or startOffset < currentStartOffset:
-                currentStartOffset = startOffset
-            if earliestStopOffset is None or stopOffset < earliestStopOffset:
-                earliestStopOffset = stopOffset
-            if latestStopOffset is None or latestStopOffset < stopOffset:
-                latestStopOffset = stopOffset
-        overlapElements = []
-        startElements = []
-        for leaves, i in zip(leafLists, currentIndices):
-            leaf = leaves[i]
-            if leaf.offset == currentStartOffset:
-                startElements.append(leaf)
-            else:
-                overlapElements.append(leaf)
-        yield Verticality(
-            startElements=startElements,
-            overlapElements=overlapElements,
-            )
-        while True:
-            indexIsLast = []
-            for i, index in enumerate(currentIndices):
-                if (index + 1) == len(leafLists[i]):
-                    indexIsLast.append(True)
-                    continue
-                indexIsLast.append(False)
-                thisLeaf = leafLists[i][index]
-                nextLeaf = leafLists[i][index + 1]
-                if nextLeaf.offset == earliestStopOffset:
-                    currentIndices[i] = index + 1
-            currentStartOffset = earliestStopOffset
-            earliestStopOffset = None
-            for i, index in enumerate(currentIndices):
-                thisLeaf = leafLists[i][index]
-                stopOffset = thisLeaf.offset + thisLeaf.quarterLength
-                if latestStopOffset < stopOffset:
-                    latestStopOffset = stopOffset
-                if earliestStopOffset is None or \
-                    stopOffset < earliestStopOffset:
-                    earliestStopOffset = stopOffset
-            if all(indexIsLast):
-                break
-            overlapElements = []
-            startElements = []
-            for leaves, i in zip(leafLists, currentIndices):
-                leaf = leaves[i]
-                if leaf.offset == currentStartOffset:
-                    startElements.append(leaf)
-                else:
-                    overlapElements.append(leaf)
+            for leaf in innerMeasure.notesAndRests:
+                startOffset = leaf.getOffsetBySite(innerMeasure)
+                timespanList.append(timespans.ElementTimespan(
+                    leaf, (innerMeasure, part), startOffset,
+                    startOffset + leaf.quarterLength, part))
+        # timespans are added part by part, so their order in timespanList
+        # is the order of the parts
+        partOrder = dict((id(x), i) for i, x in enumerate(timespanList))
+        tree = timespans.TimespanCollection(timespanList)
+        for verticality in tree.iterateVerticalities():
+            overlapTimespans = sorted(verticality.overlapTimespans,
+                key=lambda x: partOrder[id(x)])
             yield Verticality(
-                startElements=startElements,
-                overlapElements=overlapElements,
+                startElements=[x.element for x in verticality.startTimespans],
+                overlapElements=[x.element for x in overlapTimespans],
                 )
-        raise StopIteration
 
     @staticmethod
     def iterateVerticalitiesNwise(expr, n=2):
@@ -51,6 +51,10 @@ class WindowedAnalysis(object):
         self._srcStream = streamObj
         # store a windowed Stream, partitioned into bars of 1/4
         self._windowedStream = self._getMinimumWindowStream() 
+        # for processors that work on pitch class distributions, cumulative
+        # sums of the distributions of the minimum windows, created when
+        # first needed
+        self._pcDistributionSums = None
 
     def _getMinimumWindowStream(self, timeSignature='1/4'):
         ''' Take the loaded stream and restructure it into measures of 1 quarter note duration.
@@ -112,6 +116,10 @@ class WindowedAnalysis(object):
         (33, 33)
 
         '''
+        if hasattr(self.processor, 'processPitchClassDistribution'):
+            return self._analyzePitchClassDistributions(windowSize,
+                windowType=windowType)
+
         maxWindowCount = len(self._windowedStream)
         # assuming that this is sorted
 
@@ -180,6 +188,106 @@ class WindowedAnalysis(object):
 
         return data, color
 
+
+    def _getPitchClassDistributionSums(self):
+        '''
+        Return a list of cumulative sums of the pitch class distributions of
+        the minimum windows, and a list of cumulative counts of their notes;
+        the first entry of each is for no windows, so that the distribution
+        of windows i through j - 1 is the difference of entries j and i.
+
+        >>> s = converter.parse("c4 e g c' d e", '4/4')
+        >>> wa = analysis.windowed.WindowedAnalysis(s,
+        ...     analysis.discrete.KrumhanslSchmuckler())
+        >>> sums, counts = wa._getPitchClassDistributionSums()
+        >>> sums[2]
+        [1.0, 0, 0, 0, 1.0, 0, 0, 0, 0, 0, 0, 0]
+        >>> counts
+        [0, 1, 2, 3, 4, 5, 6]
+        '''
+        if self._pcDistributionSums is None:
+            total = [0] * 12
+            sums = [list(total)]
+            count = 0
+            counts = [0]
+            for m in self._windowedStream:
+                mFlat = m.flat.notesAndRests
+                pcDistribution = self.processor._getPitchClassDistribution(
+                    mFlat)
+                if pcDistribution is not None:
+                    total = [x + y for x, y in zip(total, pcDistribution)]
+                    count += len(mFlat.notes)
+                sums.append(total)
+                counts.append(count)
+            self._pcDistributionSums = (sums, counts)
+        return self._pcDistributionSums
+
+    def _analyzePitchClassDistributions(self, windowSize, windowType='overlap'):
+        '''
+        Do the same as :meth:`_analyze`, for a processor that can process a
+        pitch class distribution (such as
+        :class:`~music21.analysis.discrete.KrumhanslSchmuckler`), without
+        creating a Stream for each window: the distribution of each window
+        is found from the cumulative sums of the distributions of the
+        minimum windows, which are computed only once.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> wa = analysis.windowed.WindowedAnalysis(s, p)
+        >>> a, b = wa._analyzePitchClassDistributions(4)
+        >>> len(a), len(b)
+        (33, 33)
+        >>> a[0]
+        (<music21.pitch.Pitch A>, 'major', 0.83...)
+        '''
+        sums, counts = self._getPitchClassDistributionSums()
+        maxWindowCount = len(self._windowedStream)
+
+        def windowDistribution(start, end):
+            # the distribution of minimum windows start through end - 1
+            if counts[end] == counts[start]: # no notes
+                return None
+            return [x - y for x, y in zip(sums[end], sums[start])]
+
+        distributions = []
+        if windowType == 'overlap':
+            for i in range(maxWindowCount - windowSize + 1):
+                distributions.append(windowDistribution(i, i + windowSize))
+
+        elif windowType == 'noOverlap':
+            windowCount = (maxWindowCount / windowSize) + 1
+            for i in range(windowCount):
+                start = min(i * windowSize, maxWindowCount)
+                end = min(start + windowSize, maxWindowCount)
+                distributions.append(windowDistribution(start, end))
+
+        elif windowType == 'adjacentAverage':
+            overlapped = []
+            for i in range(maxWindowCount - windowSize + 1):
+                overlapped.append(windowDistribution(i, i + windowSize))
+            # each minimum window combines all overlapping windows
+            # in which it participates
+            for i in range(maxWindowCount):
+                total = None
+                for j in range(max(0, i - windowSize + 1),
+                    min(i + 1, len(overlapped))):
+                    if overlapped[j] is None:
+                        continue
+                    if total is None:
+                        total = overlapped[j]
+                    else:
+                        total = [x + y for x, y in zip(total, overlapped[j])]
+                distributions.append(total)
+
+        data = []
+        color = []
+        for pcDistribution in distributions:
+            solution, solutionColor = \
+                self.processor.processPitchClassDistribution(pcDistribution)
+            data.append(solution)
+            color.append(solutionColor)
+        return data, color
+
         
     def process(self, minWindow=1, maxWindow=1, windowStepSize=1, 
                 windowType='overlap', includeTotalWindow=True):
@@ -376,6 +484,39 @@ class Test(unittest.TestCase):
 
 
 
+    def testPitchClassDistributionWindowing(self):
+        '''Test that key analysis of pitch class distributions matches
+        key analysis of a Stream for each window
+        '''
+        from music21.analysis import discrete
+        from music21 import corpus
+
+        class StreamProcessor(object):
+            # hides processPitchClassDistribution from WindowedAnalysis
+            def __init__(self, processor):
+                self.processor = processor
+            def process(self, subStream):
+                return self.processor.process(subStream)
+
+        s = corpus.parse('bach/bwv66.6')
+        for pClass in [discrete.KrumhanslSchmuckler, discrete.AardenEssen]:
+            wa1 = WindowedAnalysis(s, pClass())
+            wa2 = WindowedAnalysis(s, StreamProcessor(pClass()))
+            for windowType, minWindow, maxWindow in [('overlap', 1, 6),
+                ('adjacentAverage', 1, 1), ('noOverlap', 5, 5)]:
+                a1, b1, c1 = wa1.process(minWindow, maxWindow,
+                    windowType=windowType, includeTotalWindow=False)
+                a2, b2, c2 = wa2.process(minWindow, maxWindow,
+                    windowType=windowType, includeTotalWindow=False)
+                self.assertEqual(b1, b2)
+                self.assertEqual(c1, c2)
+                for row1, row2 in zip(a1, a2):
+                    self.assertEqual(
+                        [(p.name, mode) for p, mode, unused_c in row1],
+                        [(p.name, mode) for p, mode, unused_c in row2])
+                    for solution1, solution2 in zip(row1, row2):
+                        self.assertAlmostEqual(solution1[2], solution2[2])
+
     def testVariableWindowing(self):
         from music21.analysis import discrete
         from music21 import corpus, graph
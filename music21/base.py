@@ -251,6 +251,63 @@ class Groups(SlottedObject, list):
 #------------------------------------------------------------------------------
 
 
+# number of references a Sites object stores before dead references are
+# first purged; see Sites.add()
+_SITES_PURGE_SIZE = 8
+
+
+class SiteRef(SlottedObject):
+    '''
+    A single reference stored in a :class:`~music21.base.Sites` object.
+
+    `obj` is a weak reference to the site or context, or None; `offset` is
+    the offset of the object in the site, or None for a context;
+    `classString` is the name of the class of the site; `time` is the value
+    of the Sites counter when the reference was last added; `isDead` is
+    set when the referenced object no longer exists; and `isLocation` is
+    True if the id of the site is stored in the location keys of the Sites.
+
+    >>> s = stream.Stream()
+    >>> n = note.Note()
+    >>> s.insert(2, n)
+    >>> siteRef = n.sites._definedContexts[id(s)]
+    >>> siteRef
+    <music21.base.SiteRef Stream, offset 2.0>
+    >>> siteRef.isLocation
+    True
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        'classString',
+        'isDead',
+        'isLocation',
+        'obj',
+        'offset',
+        'time',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, obj=None, offset=None, classString=None, time=0):
+        self.obj = obj
+        self.offset = offset
+        self.classString = classString
+        self.time = time
+        self.isDead = False
+        self.isLocation = False
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        return '<%s.%s %s, offset %r>' % (self.__module__,
+            self.__class__.__name__, self.classString, self.offset)
+
+
+#------------------------------------------------------------------------------
+
+
 class Sites(SlottedObject):
     '''
     An object, stored within a Music21Object, that stores (weak) references to
@@ -260,8 +317,9 @@ class Sites(SlottedObject):
     contain this object. In this case the Sites object stores an offset value,
     used for determining position within a Stream.
 
-    All defined contexts are stored as dictionaries in a dictionary. The
-    outermost dictionary stores objects.
+    All defined contexts are stored as
+    :class:`~music21.base.SiteRef` objects in a dictionary keyed by the
+    id() of the referenced object.
     '''
 
     ### CLASS VARIABLES ###
@@ -271,6 +329,7 @@ class Sites(SlottedObject):
         '_lastID',
         '_lastOffset',
         '_locationKeys',
+        '_purgeSize',
         '_timeIndex',
         'containedById',
         )
@@ -278,7 +337,7 @@ class Sites(SlottedObject):
     ### INITIALIZER ###
 
     def __init__(self, containedById=None):
-        # a dictionary of dictionaries
+        # a dictionary of SiteRef objects, keyed by the id() of the object
         self._definedContexts = {}
         # store idKeys in lists for easy access
         # the same key may be both in locationKeys and contextKeys
@@ -291,6 +350,8 @@ class Sites(SlottedObject):
         # cache for performance
         self._lastID = -1  # cannot be None
         self._lastOffset = None
+        # number of stored references at which dead sites are next purged
+        self._purgeSize = _SITES_PURGE_SIZE
 
     ## SPECIAL METHODS ###
 
@@ -336,24 +397,21 @@ class Sites(SlottedObject):
         locations = []  # self._locationKeys[:]
         #environLocal.printDebug(['Sites.__deepcopy__', 'self._definedContexts.keys()', self._definedContexts.keys()])
         for idKey in self._definedContexts:
-            singleContextDict = self._definedContexts[idKey]
-            if singleContextDict['isDead']:
+            siteRef = self._definedContexts[idKey]
+            if siteRef.isDead:
                 continue  # do not copy dead references
-            post = {}
-            post['obj'] = singleContextDict['obj']  # already a weak ref
 
             # not copying the offset in deepcopying means that
             # the old site becomes a context, not a site
             # this is still experimental
             # post['offset'] = None
 
-            post['offset'] = singleContextDict['offset']
-            if post['offset'] is not None:
+            # obj is already a weak ref; time is assumed still valid
+            post = SiteRef(siteRef.obj, siteRef.offset, siteRef.classString,
+                siteRef.time)
+            if post.offset is not None:
                 locations.append(idKey)  # if offset not None, a location
-
-            post['time'] = singleContextDict['time']  # assume still valid
-            post['class'] = singleContextDict['class']
-            post['isDead'] = False
+                post.isLocation = True
             new._definedContexts[idKey] = post
 
         new._locationKeys = locations
@@ -398,18 +456,31 @@ class Sites(SlottedObject):
             >>> aSites.add(aObj)
             >>> aSites.add(bObj)
             >>> k = aSites._keysByTime()
-            >>> aSites._definedContexts[k[0]]['time'] > aSites._definedContexts[k[1]]['time'] > aSites._definedContexts[k[2]]['time']
+            >>> aSites._definedContexts[k[0]].time > aSites._definedContexts[k[1]].time > aSites._definedContexts[k[2]].time
             True
 
         '''
         post = []
         for key in self._definedContexts:
-            post.append((self._definedContexts[key]['time'], key))
+            post.append((self._definedContexts[key].time, key))
         post.sort()
         if newFirst:
             post.reverse()
         return [k for unused_time, k in post]
 
+    def _offsetChanged(self, siteRef):
+        '''
+        Called when the offset stored for a site changes: a Stream site
+        must discard any index of its elements' offsets, and its highest
+        offset and time, if it has cached them.
+        '''
+        site = common.unwrapWeakref(siteRef.obj)
+        if site is not None and getattr(site, 'isStream', False):
+            siteCache = site._cache
+            siteCache.pop('offsetIndex', None)
+            siteCache.pop('HighestOffset', None)
+            siteCache.pop('HighestTime', None)
+
     def _prepareObject(self, obj):
         '''
         Prepare an object for storage.
@@ -467,13 +538,7 @@ class Sites(SlottedObject):
         if idKey is None and obj is not None:
             idKey = id(obj)
 
-        updateNotAdd = False
-        if idKey in self._definedContexts:
-            updateNotAdd = True
-
-        if offset is not None:  # a location, not a context
-            if idKey not in self._locationKeys:
-                self._locationKeys.append(idKey)
+        siteRef = self._definedContexts.get(idKey)
         #environLocal.printDebug(['adding obj', obj, idKey])
         # weak refs were being passed in __deepcopy__ calling this method
         # __deepcopy__ no longer call this method, so we can assume that
@@ -486,23 +551,33 @@ class Sites(SlottedObject):
                 classString = obj.classes[0]  # get most current class
             objRef = self._prepareObject(obj)
 
-        if updateNotAdd is True:
-            singleContextDict = self._definedContexts[idKey]
-        else:
-            singleContextDict = {}
-
-        singleContextDict['obj'] = objRef  # a weak ref
-        singleContextDict['offset'] = offset  # offset can be None for contexts
-        singleContextDict['class'] = classString
-        singleContextDict['isDead'] = False  # store to access w/o unwrapping
         # time is a numeric count, not a real time measure
         if timeValue is None:
-            singleContextDict['time'] = self._timeIndex
+            timeValue = self._timeIndex
             self._timeIndex += 1  # increment for next usage
+
+        if siteRef is not None:  # update
+            if siteRef.offset != offset:
+                self._offsetChanged(siteRef)
+            siteRef.obj = objRef  # a weak ref
+            siteRef.offset = offset  # offset can be None for contexts
+            siteRef.classString = classString
+            siteRef.isDead = False  # store to access w/o unwrapping
+            siteRef.time = timeValue
         else:
-            singleContextDict['time'] = timeValue
-        if not updateNotAdd:  # add new/missing information to dictionary
-            self._definedContexts[idKey] = singleContextDict
+            if len(self._definedContexts) >= self._purgeSize:
+                # remove dead sites before the storage grows; as the
+                # threshold doubles, this costs O(1) per added site
+                self.purgeLocations(rescanIsDead=True)
+                self._purgeSize = max(_SITES_PURGE_SIZE,
+                    2 * len(self._definedContexts))
+            siteRef = SiteRef(objRef, offset, classString, timeValue)
+            self._definedContexts[idKey] = siteRef
+
+        if offset is not None and not siteRef.isLocation:
+            # a location, not a context
+            siteRef.isLocation = True
+            self._locationKeys.append(idKey)
 
     def clear(self):
         '''
@@ -579,19 +654,19 @@ class Sites(SlottedObject):
 
         # get each dict from all defined contexts
         for key in keys:
-            singleContextDict = self._definedContexts[key]
+            siteRef = self._definedContexts[key]
             # check for None object; default location, not a weakref, keep
-            if singleContextDict['obj'] is None:
+            if siteRef.obj is None:
                 if not excludeNone:
-                    post.append(singleContextDict['obj'])
+                    post.append(siteRef.obj)
             elif WEAKREF_ACTIVE:
-                obj = common.unwrapWeakref(singleContextDict['obj'])
+                obj = common.unwrapWeakref(siteRef.obj)
                 if obj is None:  # dead ref
-                    singleContextDict['isDead'] = True
+                    siteRef.isDead = True
                 else:
                     post.append(obj)
             else:
-                post.append(singleContextDict['obj'])
+                post.append(siteRef.obj)
 
         # remove dead references
 #         if autoPurge:
@@ -838,13 +913,13 @@ class Sites(SlottedObject):
         Return the object specified by an id.
         Used for testing and debugging.
         '''
-        singleContextDict = self._definedContexts[id]
+        siteRef = self._definedContexts[id]
         # need to check if these is weakref
         #if common.isWeakref(dict['obj']):
         if WEAKREF_ACTIVE:
-            return common.unwrapWeakref(singleContextDict['obj'])
+            return common.unwrapWeakref(siteRef.obj)
         else:
-            return singleContextDict['obj']
+            return siteRef.obj
 
     def getOffsetByObjectMatch(self, obj):
         '''
@@ -875,17 +950,17 @@ class Sites(SlottedObject):
 
         '''
         for idKey in self._definedContexts:
-            singleContextDict = self._definedContexts[idKey]
-            if singleContextDict['isDead']: # cal alway skip
+            siteRef = self._definedContexts[idKey]
+            if siteRef.isDead: # cal alway skip
                 continue
             # must unwrap references before comparison
             #if common.isWeakref(dict['obj']):
             if WEAKREF_ACTIVE:
-                compareObj = common.unwrapWeakref(singleContextDict['obj'])
+                compareObj = common.unwrapWeakref(siteRef.obj)
             else:
-                compareObj = singleContextDict['obj']
+                compareObj = siteRef.obj
             if compareObj is None: # mark isDead for later removal
-                singleContextDict['isDead'] = True
+                siteRef.isDead = True
                 continue
             if id(compareObj) == id(obj):
                 #environLocal.printDebug(['found object as site', obj, id(obj), 'idKey', idKey])
@@ -961,17 +1036,17 @@ class Sites(SlottedObject):
 
             >>> idBSite = id(bSite)
             >>> del(bSite)
-            >>> aLocations._definedContexts[idBSite]['obj']
+            >>> aLocations._definedContexts[idBSite].obj
             <weakref at 0x...; dead>
 
         ::
 
-            >>> aLocations._definedContexts[idBSite]['obj'] is None
+            >>> aLocations._definedContexts[idBSite].obj is None
             False
 
         ::
 
-            >>> common.unwrapWeakref(aLocations._definedContexts[idBSite]['obj']) is None
+            >>> common.unwrapWeakref(aLocations._definedContexts[idBSite].obj) is None
             True
 
         ::
@@ -994,9 +1069,9 @@ class Sites(SlottedObject):
 #        if idKey == self._lastID:
 #            return self._lastOffset
         try:
-            value = self._definedContexts[idKey]['offset']
-            if WEAKREF_ACTIVE and strictDeadCheck is True and self._definedContexts[idKey]['obj'] is not None:
-                obj = common.unwrapWeakref(self._definedContexts[idKey]['obj'])
+            value = self._definedContexts[idKey].offset
+            if WEAKREF_ACTIVE and strictDeadCheck is True and self._definedContexts[idKey].obj is not None:
+                obj = common.unwrapWeakref(self._definedContexts[idKey].obj)
                 if obj is None:
                     #if self._definedContexts[idKey]['isDead'] is True: # not good enough
                     errorMsg = "Could not find the object with id %s in the Site marked with idKey %s (was there, now site is dead). " % (id(self), idKey)
@@ -1014,9 +1089,9 @@ class Sites(SlottedObject):
             if value not in ['highestTime', 'lowestOffset', 'highestOffset']:
                 raise SitesException('attempted to set a bound offset with a string attribute that is not supported: %s' % value)
             if WEAKREF_ACTIVE:
-                obj = common.unwrapWeakref(self._definedContexts[idKey]['obj'])
+                obj = common.unwrapWeakref(self._definedContexts[idKey].obj)
             else:
-                obj = self._definedContexts[idKey]['obj']
+                obj = self._definedContexts[idKey].obj
             # offset value is an attribute string
             # canot cache these values as may change outside of definedcontexts
             return getattr(obj, value)
@@ -1079,10 +1154,10 @@ class Sites(SlottedObject):
         match = None
         for siteId in self._definedContexts:
             # might need to use almost equals here
-            if self._definedContexts[siteId]['offset'] == offset:
-                if self._definedContexts[siteId]['isDead']:
+            if self._definedContexts[siteId].offset == offset:
+                if self._definedContexts[siteId].isDead:
                     return None
-                match = self._definedContexts[siteId]['obj']
+                match = self._definedContexts[siteId].obj
                 break
         if WEAKREF_ACTIVE:
             if match is None: # this is a dead erfs
@@ -1100,7 +1175,7 @@ class Sites(SlottedObject):
         '''
         count = 0
         for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 continue
             count += 1
         return count
@@ -1161,11 +1236,11 @@ class Sites(SlottedObject):
                 if idKey in idExclude:
                     continue
             try:
-                objRef = self._definedContexts[idKey]['obj']
+                objRef = self._definedContexts[idKey].obj
             except KeyError:
                 raise SitesException('no such site: %s' % idKey)
             # skip dead references
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 continue
             if idKey is None:
                 if not excludeNone:
@@ -1175,7 +1250,7 @@ class Sites(SlottedObject):
             else:
                 obj = common.unwrapWeakref(objRef)
                 if obj is None:
-                    self._definedContexts[idKey]['isDead'] = True
+                    self._definedContexts[idKey].isDead = True
                     continue
                 post.append(obj)
         return post
@@ -1212,11 +1287,11 @@ class Sites(SlottedObject):
             className = common.classToClassStr(className)
 
         for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 continue
-            classStr = self._definedContexts[idKey]['class']
+            classStr = self._definedContexts[idKey].classString
             if classStr == className:
-                objRef = self._definedContexts[idKey]['obj']
+                objRef = self._definedContexts[idKey].obj
                 if not WEAKREF_ACTIVE: # leave None alone
                     obj = objRef
                 else:
@@ -1249,7 +1324,8 @@ class Sites(SlottedObject):
             False
 
         '''
-        if siteId in self._locationKeys:
+        siteRef = self._definedContexts.get(siteId)
+        if siteRef is not None and siteRef.isLocation:
             return True
         return False
 
@@ -1259,9 +1335,9 @@ class Sites(SlottedObject):
         by looking for a SpannerStorage Stream class as a Site.
         '''
         for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 continue
-            if self._definedContexts[idKey]['class'] == 'SpannerStorage':
+            if self._definedContexts[idKey].classString == 'SpannerStorage':
                 return True
         return False
 
@@ -1271,9 +1347,9 @@ class Sites(SlottedObject):
         by looking for a VariantStorage Stream class as a Site.
         '''
         for idKey in self._locationKeys:
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 continue
-            if self._definedContexts[idKey]['class'] == 'VariantStorage':
+            if self._definedContexts[idKey].classString == 'VariantStorage':
                 return True
         return False
 
@@ -1302,7 +1378,8 @@ class Sites(SlottedObject):
             False
 
         '''
-        if id(obj) in self._locationKeys:
+        siteRef = self._definedContexts.get(id(obj))
+        if siteRef is not None and siteRef.isLocation:
             return True
         return False
 
@@ -1344,22 +1421,22 @@ class Sites(SlottedObject):
             for idKey in self._locationKeys:
                 if idKey is None:
                     continue
-                if self._definedContexts[idKey]['isDead']:
+                if self._definedContexts[idKey].isDead:
                     continue  # already marked
                 if WEAKREF_ACTIVE:
                     obj = common.unwrapWeakref(
-                        self._definedContexts[idKey]['obj'])
+                        self._definedContexts[idKey].obj)
                 else:
-                    obj = self._definedContexts[idKey]['obj']
+                    obj = self._definedContexts[idKey].obj
                 if obj is None: # if None, it no longer exists
-                    self._definedContexts[idKey]['isDead'] = True
+                    self._definedContexts[idKey].isDead = True
         # use previously set isDead entry, so as not to
         # unwrap all references
         remove = []
         for idKey in self._locationKeys:
             if idKey is None:
                 continue
-            if self._definedContexts[idKey]['isDead']:
+            if self._definedContexts[idKey].isDead:
                 remove.append(idKey)
         for idKey in remove:
             # this call changes the ._locationKeys list, and thus must be
@@ -1429,13 +1506,13 @@ class Sites(SlottedObject):
         if site is not None:
             siteId = id(site)
         try:
-            del self._definedContexts[siteId]
+            siteRef = self._definedContexts.pop(siteId)
             #environLocal.printDebug(['removed site w/o exception:', siteId, 'self._definedContexts.keys()', self._definedContexts.keys()])
         except:
             raise SitesException('an entry for this object (%s) is not stored in this Sites object' % site)
         # also delete from location keys
-        if siteId in self._locationKeys:
-            self._locationKeys.pop(self._locationKeys.index(siteId))
+        if siteRef.isLocation:
+            self._locationKeys.remove(siteId)
 
     def removeById(self, idKey):
         '''
@@ -1450,9 +1527,9 @@ class Sites(SlottedObject):
             raise SitesException('trying to remove None idKey is not allowed')
 
         #environLocal.printDebug(['removeById', idKey, 'self._definedContexts.keys()', self._definedContexts.keys()])
-        del self._definedContexts[idKey]
-        if idKey in self._locationKeys:
-            self._locationKeys.pop(self._locationKeys.index(idKey))
+        siteRef = self._definedContexts.pop(idKey)
+        if siteRef.isLocation:
+            self._locationKeys.remove(idKey)
 
     def setAttrByName(self, attrName, value):
         '''
@@ -1519,11 +1596,14 @@ class Sites(SlottedObject):
             siteId = id(site)
         # will raise an index error if the siteId does not exist
         try:
-            self._definedContexts[siteId]['offset'] = value
-            self._lastID = siteId
-            self._lastOffset = value
+            siteRef = self._definedContexts[siteId]
         except KeyError:
             raise SitesException('an entry for this object (%s) is not stored in Sites' % site)
+        if siteRef.offset != value:
+            self._offsetChanged(siteRef)
+        siteRef.offset = value
+        self._lastID = siteId
+        self._lastOffset = value
 
     def setOffsetBySiteId(self, siteId, value):
         '''
@@ -1533,11 +1613,14 @@ class Sites(SlottedObject):
         The `siteId` parameter can be None.
         '''
         try:
-            self._definedContexts[siteId]['offset'] = value
-            self._lastID = siteId
-            self._lastOffset = value
+            siteRef = self._definedContexts[siteId]
         except KeyError:
             raise SitesException('an entry for this object (%s) is not stored in Sites' % siteId)
+        if siteRef.offset != value:
+            self._offsetChanged(siteRef)
+        siteRef.offset = value
+        self._lastID = siteId
+        self._lastOffset = value
 
     def unwrapWeakref(self, purgeLocations=True):
         '''
@@ -1557,18 +1640,18 @@ class Sites(SlottedObject):
 
         ::
 
-            >>> common.isWeakref(aSites._definedContexts[id(aObj)]['obj'])
+            >>> common.isWeakref(aSites._definedContexts[id(aObj)].obj)
             True
 
         ::
 
             >>> aSites.unwrapWeakref()
-            >>> common.isWeakref(aSites._definedContexts[id(aObj)]['obj'])
+            >>> common.isWeakref(aSites._definedContexts[id(aObj)].obj)
             False
 
         ::
 
-            >>> common.isWeakref(aSites._definedContexts[id(bObj)]['obj'])
+            >>> common.isWeakref(aSites._definedContexts[id(bObj)].obj)
             False
 
         '''
@@ -1580,13 +1663,13 @@ class Sites(SlottedObject):
         for idKey in self._definedContexts:
             if WEAKREF_ACTIVE:
             #if common.isWeakref(self._definedContexts[idKey]['obj']):
-                target = self._definedContexts[idKey]['obj']
+                target = self._definedContexts[idKey].obj
                 if target is None:
                     continue
                 if common.isWeakref(target):
                     #environLocal.printDebug(['unwrapping:', self._definedContexts[idKey]['obj']])
                     target = common.unwrapWeakref(target)
-                    self._definedContexts[idKey]['obj'] = target
+                    self._definedContexts[idKey].obj = target
 
     def wrapWeakref(self):
         '''
@@ -1604,22 +1687,22 @@ class Sites(SlottedObject):
             >>> aSites.add(bObj)
             >>> aSites.unwrapWeakref()
             >>> aSites.wrapWeakref()
-            >>> common.isWeakref(aSites._definedContexts[id(aObj)]['obj'])
+            >>> common.isWeakref(aSites._definedContexts[id(aObj)].obj)
             True
 
         ::
 
-            >>> common.isWeakref(aSites._definedContexts[id(bObj)]['obj'])
+            >>> common.isWeakref(aSites._definedContexts[id(bObj)].obj)
             True
 
         '''
         for idKey in self._definedContexts:
-            if self._definedContexts[idKey]['obj'] is None:
+            if self._definedContexts[idKey].obj is None:
                 continue  # always skip None
-            if not common.isWeakref(self._definedContexts[idKey]['obj']):
+            if not common.isWeakref(self._definedContexts[idKey].obj):
                 #environLocal.printDebug(['wrapping:', self._definedContexts[idKey]['obj']])
-                post = common.wrapWeakref(self._definedContexts[idKey]['obj'])
-                self._definedContexts[idKey]['obj'] = post
+                post = common.wrapWeakref(self._definedContexts[idKey].obj)
+                self._definedContexts[idKey].obj = post
 
 
 #------------------------------------------------------------------------------
@@ -3242,7 +3325,15 @@ class Music21Object(object):
         # lazy duration creation
         if self._duration is None:
             self._duration = duration.Duration(0)
-        return self._duration
+        # the Duration tells the object it was last gotten from when its
+        # length changes; see Duration._informClient
+        durationObj = self._duration
+        try:
+            if durationObj.client is None or durationObj.client() is not self:
+                durationObj.client = common.wrapWeakref(self)
+        except AttributeError: # not a Duration
+            pass
+        return durationObj
 
     def _setDuration(self, durationObj):
         '''
@@ -3252,6 +3343,8 @@ class Music21Object(object):
             # we cannot directly test to see isInstance(duration.DurationCommon) because of
             # circular imports; so we instead just take any object with a quarterLength as a
             # duration
+            if self._duration is not None:
+                self._durationChanged()
             self._duration = durationObj
         else:
             # need to permit Duration object assignment here
@@ -3262,6 +3355,15 @@ class Music21Object(object):
         Get and set the duration of this object as a Duration object.
         ''')
 
+    def _durationChanged(self):
+        '''
+        Called when the Duration of this object, or its length, changes:
+        the end time of this object has changed in each of its sites.
+        '''
+        for siteRef in self.sites._definedContexts.values():
+            if siteRef.offset is not None:
+                self.sites._offsetChanged(siteRef)
+
     def _getIsGrace(self):
         return self.duration.isGrace
 
@@ -3389,6 +3491,10 @@ class Music21Object(object):
         If fmt is not given then the default of your Environment's 'writeFormat' will
         be used.  For most people that is musicxml.
 
+        For musicxml, a `copyOnWrite` keyword of True avoids copying a Stream
+        that needs no notation added (see
+        :func:`~music21.musicxml.m21ToString.fromStream`).
+
         Returns the full path to the file.
         '''
         if fmt is None: # get setting in environment
@@ -3422,14 +3528,20 @@ class Music21Object(object):
             # musicxml, musicxml.png, etc.
             elif fileFormat.startswith('musicxml'):
                 from music21.musicxml import m21ToString
-                dataStr = m21ToString.fromMusic21Object(self)
+                dataStr = None # written to the file as it is made
             elif fileFormat.startswith('vexflow'):
                 import music21.vexflow
                 dataStr = music21.vexflow.fromObject(self, mode='html')
 
             f = open(fp, 'w')
-            f.write(dataStr)
-            f.close()
+            try:
+                if dataStr is None:
+                    m21ToString.writeMusic21Object(self, f,
+                        copyOnWrite=keywords.get('copyOnWrite', False))
+                else:
+                    f.write(dataStr)
+            finally:
+                f.close()
 
             if fileFormat == 'musicxml.png':
                 # HACK
@@ -4872,6 +4984,36 @@ class Test(unittest.TestCase):
         lastNoteClef = lastNote.getContextByClass(clef.Clef)
         self.assertEqual(isinstance(lastNoteClef, clef.TrebleClef), True)
 
+    def testSitesPurgeDead(self):
+        import gc
+        from music21 import note, stream
+
+        n = note.Note()
+        s = stream.Stream()
+        s.insert(3, n)
+        # many temporary Streams, as created by .flat or .sorted; Streams
+        # are only freed by the garbage collector
+        for i in range(40):
+            sTemp = stream.Stream()
+            sTemp.insert(i, n)
+            del sTemp
+            gc.collect()
+        # references to dead Streams are removed as references are added
+        self.assertEqual(len(n.sites) < 20, True)
+        self.assertEqual(len(n.sites._locationKeys), len(n.sites))
+        self.assertEqual(n.sites.isSite(s), True)
+        self.assertEqual(n.getOffsetBySite(s), 3.0)
+
+        n.sites.remove(s)
+        self.assertEqual(n.sites.isSite(s), False)
+        self.assertEqual(id(s) in n.sites._locationKeys, False)
+        # a context is not a location until added with an offset
+        n.sites.add(s)
+        self.assertEqual(n.sites.hasSiteId(id(s)), False)
+        n.sites.add(s, 2)
+        self.assertEqual(n.sites.hasSiteId(id(s)), True)
+        self.assertEqual(n.sites._locationKeys.count(id(s)), 1)
+
     def testSitesSearch(self):
         from music21 import note, stream, clef
 
@@ -3410,13 +3410,22 @@ class Chord(note.NotRest):
             #pitchZeroDuration = self._notes[0]['pitch'].duration
             pitchZeroDuration = self._notes[0].duration
             self._duration = pitchZeroDuration
-        return self._duration
+        # as in Music21Object, this Chord is told of changes to the length
+        durationObj = self._duration
+        try:
+            if durationObj.client is None or durationObj.client() is not self:
+                durationObj.client = common.wrapWeakref(self)
+        except AttributeError: # None, or not a Duration
+            pass
+        return durationObj
 
     @duration.setter
     def duration(self, durationObj):
         '''Set a Duration object.
         '''
         if hasattr(durationObj, "quarterLength"):
+            if self._duration is not None:
+                self._durationChanged()
             self._duration = durationObj
         else:
             # need to permit Duration object assignment here
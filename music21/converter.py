@@ -43,6 +43,7 @@ the temp folder on the disk.
 import unittest
 
 import copy
+import multiprocessing
 import os
 import re
 import urllib
@@ -246,6 +247,185 @@ class PickleFilter(object):
 
 
 
+#-------------------------------------------------------------------------------
+class StreamCache(object):
+    '''
+    An on-disk cache of parsed Streams, stored frozen with
+    :class:`~music21.freezeThaw.StreamFreezer` and used by
+    :meth:`~music21.converter.Converter.parseFile` for files of every
+    format.
+
+    Entries are keyed by a hash of the contents of the file, the music21
+    version, and the format and number used to parse it, so a cached Stream
+    is never out of date, and one cache can be shared by many processes.
+    When the files in the cache take more than `maxSize` bytes, the least
+    recently used are removed.
+
+    If `directory` is None, a directory named `m21-streamCache` in the
+    scratch directory (see :meth:`~music21.environment.Environment.getRootTempDir`)
+    is used. The cache used by the converter is `converter.streamCache`;
+    set its `enabled` attribute to False to always parse files. A Stream
+    parsed on a miss is replaced by the Stream thawed from its new entry
+    (see :meth:`~music21.converter.StreamCache.put`), so the converter
+    returns the same Stream on a hit and on a miss.
+
+    >>> import tempfile
+    >>> sc = converter.StreamCache(directory=tempfile.mkdtemp())
+    >>> fp = corpus.getWork('bwv66.6')
+    >>> key = sc.getKey(fp, 'musicxml')
+    >>> sc.get(key) is None
+    True
+    >>> s = corpus.parse('bwv66.6')
+    >>> sc.put(key, s) is s
+    True
+    >>> len(sc.get(key).parts)
+    4
+    >>> sc
+    <music21.converter.StreamCache: 1 hits, 1 misses, 0 evictions>
+    >>> sc.clear()
+    >>> sc.get(key) is None
+    True
+    '''
+    def __init__(self, directory=None, maxSize=256 * 2**20):
+        self.directory = directory
+        self.maxSize = maxSize
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return '<music21.converter.StreamCache: %s hits, %s misses, %s evictions>' % (
+            self.hits, self.misses, self.evictions)
+
+    def _getDirectory(self):
+        if self.directory is not None:
+            directory = self.directory
+        else:
+            directory = os.path.join(environLocal.getRootTempDir(),
+                'm21-streamCache')
+        if not os.path.exists(directory):
+            try:
+                os.makedirs(directory)
+            except OSError: # created by another process
+                pass
+        return directory
+
+    def _getCacheFp(self, key):
+        return os.path.join(self._getDirectory(), 'm21-' + key + '.p')
+
+    def getKey(self, fp, format, number=None): # @ReservedAssignment
+        '''
+        Return the key of the Stream parsed from the file at `fp` in
+        `format`, with the work `number` if given.
+        '''
+        from music21 import base
+        f = open(fp, 'rb')
+        data = f.read()
+        f.close()
+        return common.getMd5('%s|%s|%s|%s' % (common.getMd5(data),
+            base.VERSION, format, number))
+
+    def get(self, key):
+        '''
+        Return a new Stream thawed from the entry for `key`, or None if
+        there is none.
+        '''
+        fpCache = self._getCacheFp(key)
+        if not os.path.exists(fpCache):
+            self.misses += 1
+            return None
+        try:
+            streamObj = thaw(fpCache)
+        except Exception: # pylint: disable=broad-except
+            # damaged or partly written; parse again
+            environLocal.printDebug(['cannot thaw cached Stream', fpCache])
+            self.misses += 1
+            return None
+        try:
+            os.utime(fpCache, None) # mark as recently used
+        except OSError:
+            pass
+        self.hits += 1
+        return streamObj
+
+    def put(self, key, streamObj, fastButUnsafe=False):
+        '''
+        Store `streamObj` as the entry for `key`, remove the least
+        recently used entries if the cache is too large, and return the
+        Stream to use from now on. Streams that cannot be frozen are not
+        stored.
+
+        A copy of `streamObj` is frozen, and `streamObj` is returned
+        unchanged. If `fastButUnsafe` is True, as for
+        :class:`~music21.freezeThaw.StreamFreezer`, `streamObj` itself is
+        frozen, which is much faster than copying it but leaves it
+        unusable; the Stream returned is then a new one thawed from the
+        entry, as :meth:`~music21.converter.StreamCache.get` would return.
+        '''
+        from music21 import freezeThaw
+        fpCache = self._getCacheFp(key)
+        # write to a temporary file first, so that other processes never
+        # read a partly written entry
+        fpTemp = fpCache + '.' + str(os.getpid())
+        try:
+            data = freezeThaw.StreamFreezer(streamObj,
+                fastButUnsafe=fastButUnsafe).writeStr()
+            f = open(fpTemp, 'wb')
+            f.write(data)
+            f.close()
+            os.rename(fpTemp, fpCache)
+        except Exception: # pylint: disable=broad-except
+            environLocal.printDebug(['cannot freeze Stream to cache', fpCache])
+            if os.path.exists(fpTemp):
+                os.remove(fpTemp)
+            if fastButUnsafe:
+                freezeThaw.StreamThawer().teardownSerializationScaffold(
+                    streamObj)
+            return streamObj
+        self._evict()
+        if not fastButUnsafe:
+            return streamObj
+        return thawStr(data)
+
+    def _evict(self):
+        directory = self._getDirectory()
+        entries = []
+        totalSize = 0
+        for fn in os.listdir(directory):
+            if not fn.endswith('.p'):
+                continue
+            fpCache = os.path.join(directory, fn)
+            try:
+                stat = os.stat(fpCache)
+            except OSError: # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, fpCache))
+            totalSize += stat.st_size
+        entries.sort()
+        for unused_mtime, size, fpCache in entries:
+            if totalSize <= self.maxSize:
+                break
+            try:
+                os.remove(fpCache)
+                self.evictions += 1
+            except OSError:
+                pass
+            totalSize -= size
+
+    def clear(self):
+        '''
+        Remove all entries from the cache.
+        '''
+        directory = self._getDirectory()
+        for fn in os.listdir(directory):
+            if fn.endswith('.p'):
+                os.remove(os.path.join(directory, fn))
+
+
+streamCache = StreamCache()
+
+
 #-------------------------------------------------------------------------------
 # Converters are associated classes; they are not subclasses, but most define a pareData() method, a parseFile() method, and a .stream attribute or property.
 
@@ -393,12 +573,22 @@ class ConverterNoteworthyBinary(object):
 #-------------------------------------------------------------------------------
 class ConverterMusicXML(object):
     '''Converter for MusicXML
+
+    If `streaming` is True, each measure is translated into music21 as soon
+    as it is read, so that the complete mxScore is never held in memory
+    (see :meth:`~music21.musicxml.xmlHandler.Document.iterStream`); the
+    source is always parsed, as pickled mxScores are not used.
+
+    `xmlBackend` selects the XML parser, 'sax' or the faster 'etree'; see
+    :class:`~music21.musicxml.xmlHandler.Document`.
     '''
 
-    def __init__(self, forceSource):
+    def __init__(self, forceSource, streaming=False, xmlBackend='sax'):
         self._mxScore = None # store the musicxml object representation
         self._stream = stream.Score()
         self.forceSource = forceSource
+        self.streaming = streaming
+        self.xmlBackend = xmlBackend
 
     #---------------------------------------------------------------------------
     def partIdToNameDict(self):
@@ -425,7 +615,13 @@ class ConverterMusicXML(object):
     #---------------------------------------------------------------------------
     def parseData(self, xmlString, number=None):
         '''Open MusicXML data from a string.'''
-        c = musicxmlHandler.Document()
+        c = musicxmlHandler.Document(xmlBackend=self.xmlBackend)
+        if self.streaming:
+            c.readStream(xmlString, inputM21=self._stream)
+            self._mxScore = c.score
+            if len(self._stream.parts) == 0:
+                raise ConverterException('score from xmlString (%s...) either has no parts defined or was incompletely parsed' % xmlString[:30])
+            return
         c.read(xmlString)
         self._mxScore = c.score #  the mxScore object from the musicxml Document
         if len(self._mxScore) == 0:
@@ -438,6 +634,10 @@ class ConverterMusicXML(object):
         version available and up to date; if so, open that, otherwise
         open source.
         '''
+        if self.streaming:
+            self._parseFileStreaming(fp)
+            return
+
         # return fp to load, if pickle needs to be written, fp pickle
         # this should be able to work on a .mxl file, as all we are doing
         # here is seeing which is more recent
@@ -452,7 +652,7 @@ class ConverterMusicXML(object):
         m21Format = common.findFormatFile(fpDst)
         pickleError = False
 
-        c = musicxmlHandler.Document()
+        c = musicxmlHandler.Document(xmlBackend=self.xmlBackend)
         if m21Format == 'pickle':
             environLocal.printDebug(['opening pickled file', fpDst])
             try:
@@ -516,6 +716,27 @@ class ConverterMusicXML(object):
 
         self.load()
 
+    def _parseFileStreaming(self, fp):
+        '''
+        Translate a MusicXML file measure by measure; called by
+        parseFile() if `streaming` is True.
+        '''
+        c = musicxmlHandler.Document(xmlBackend=self.xmlBackend)
+        arch = ArchiveManager(fp)
+        if arch.isArchive():
+            c.readStream(arch.getData(), inputM21=self._stream)
+        else:
+            c.openStream(fp, inputM21=self._stream)
+        self._mxScore = c.score
+        if len(self._stream.parts) == 0:
+            raise ConverterException('score from file path (%s) no parts defined' % fp)
+        # as in parseFile(), use the file name as a title if no titles
+        # are defined
+        md = self._stream.metadata
+        if md.movementName is None and md.title is None:
+            junk, fn = os.path.split(fp)
+            md.movementName = fn
+
 
 
 
@@ -753,15 +974,17 @@ class Converter(object):
 
     def __init__(self):
         self._converter = None
+        self._streamFromCache = None
 
-    def _setConverter(self, format, forceSource=False): # @ReservedAssignment
+    def _setConverter(self, format, forceSource=False, streaming=False, xmlBackend='sax'): # @ReservedAssignment
         # assume for now that pickled files are always musicxml
         # this WILL change in the future
         if format is None:
             raise ConverterException('Did not find a format from the source file')
 
         if format in ['musicxml', 'pickle']:
-            self._converter = ConverterMusicXML(forceSource=forceSource)
+            self._converter = ConverterMusicXML(forceSource=forceSource,
+                streaming=streaming, xmlBackend=xmlBackend)
         elif format == 'midi':
             self._converter = ConverterMidi()
         elif format == 'humdrum':
@@ -793,7 +1016,7 @@ class Converter(object):
             raise ValueError
         return os.path.join(directory, 'm21-' + common.getMd5(url) + ext)
 
-    def parseFile(self, fp, number=None, format=None, forceSource=False): # @ReservedAssignment
+    def parseFile(self, fp, number=None, format=None, forceSource=False, streaming=False, xmlBackend='sax'): # @ReservedAssignment
         '''
         Given a file path, parse and store a music21 Stream.
 
@@ -801,6 +1024,16 @@ class Converter(object):
         If format is None then look up the format from the file
         extension using `common.findFormatFile`.
 
+        If `streaming` is True, MusicXML is translated measure by measure;
+        `xmlBackend` selects the XML parser for MusicXML; see
+        :class:`~music21.converter.ConverterMusicXML`.
+
+        Parsed Streams are stored in, and if possible loaded from,
+        `converter.streamCache` (see :class:`~music21.converter.StreamCache`),
+        unless `forceSource` is True or the cache is disabled. A Stream
+        that goes through the cache is not made by a format-specific
+        converter that can be kept, so the `_converter` of this Converter
+        is then None.
         '''
         #environLocal.printDebug(['attempting to parseFile', fp])
         if not os.path.exists(fp):
@@ -816,13 +1049,31 @@ class Converter(object):
                 useFormat = common.findFormatFile(fp)
                 if useFormat is None:
                     raise ConverterFileException('cannot find a format extensions for: %s' % fp)
-        self._setConverter(useFormat, forceSource=forceSource)
-        self._converter.parseFile(fp, number=number)
+        self._streamFromCache = None
+        if (streamCache.enabled and not forceSource and useFormat != 'pickle'
+            and os.path.isfile(fp)):
+            cacheKey = streamCache.getKey(fp, useFormat, number)
+            self._streamFromCache = streamCache.get(cacheKey)
+            if self._streamFromCache is None:
+                # pickled mxScores are not needed when Streams are cached
+                self._setConverter(useFormat, forceSource=True,
+                    streaming=streaming, xmlBackend=xmlBackend)
+                self._converter.parseFile(fp, number=number)
+                # the newly parsed Stream is not copied, so cannot be used
+                # once stored; use the Stream thawed from the cache instead
+                self._streamFromCache = streamCache.put(cacheKey,
+                    self._converter.stream, fastButUnsafe=True)
+            # the stream of a previous parse must not be kept
+            self._converter = None
+        else:
+            self._setConverter(useFormat, forceSource=forceSource,
+                streaming=streaming, xmlBackend=xmlBackend)
+            self._converter.parseFile(fp, number=number)
         self.stream.filePath = fp
         self.stream.fileNumber = number
         self.stream.fileFormat = useFormat
 
-    def parseData(self, dataStr, number=None, format=None, forceSource=False): # @ReservedAssignment
+    def parseData(self, dataStr, number=None, format=None, forceSource=False, streaming=False, xmlBackend='sax'): # @ReservedAssignment
         '''
         Given raw data, determine format and parse into a music21 Stream.
         '''
@@ -858,7 +1109,9 @@ class Converter(object):
             else:
                 raise ConverterException('File not found or no such format found for: %s' % dataStr)
 
-        self._setConverter(useFormat)
+        self._streamFromCache = None
+        self._setConverter(useFormat, streaming=streaming,
+            xmlBackend=xmlBackend)
         self._converter.parseData(dataStr, number=number)
 
 
@@ -933,6 +1186,7 @@ class Converter(object):
             useFormat = common.findFormatFile(fp)
         else:
             useFormat = format
+        self._streamFromCache = None
         self._setConverter(useFormat, forceSource=False)
         self._converter.parseFile(fp, number=number)
         self.stream.filePath = fp
@@ -979,6 +1233,8 @@ class Converter(object):
     def _getStream(self):
         '''All converters have to have a stream property or attribute.
         '''
+        if self._streamFromCache is not None:
+            return self._streamFromCache
         return self._converter.stream
         # not _stream: please don't look in other objects' private variables;
         #              humdrum worked differently.
@@ -992,21 +1248,23 @@ class Converter(object):
 # module level convenience methods
 
 
-def parseFile(fp, number=None, format=None, forceSource=False):  #@ReservedAssignment
+def parseFile(fp, number=None, format=None, forceSource=False, streaming=False, xmlBackend='sax'):  #@ReservedAssignment
     '''
     Given a file path, attempt to parse the file into a Stream.
     '''
     v = Converter()
-    v.parseFile(fp, number=number, format=format, forceSource=forceSource)
+    v.parseFile(fp, number=number, format=format, forceSource=forceSource,
+        streaming=streaming, xmlBackend=xmlBackend)
     return v.stream
 
-def parseData(dataStr, number=None, format=None): # @ReservedAssignment
+def parseData(dataStr, number=None, format=None, streaming=False, xmlBackend='sax'): # @ReservedAssignment
     '''
     Given musical data represented within a Python string, attempt to parse the
     data into a Stream.
     '''
     v = Converter()
-    v.parseData(dataStr, number=number, format=format)
+    v.parseData(dataStr, number=number, format=format, streaming=streaming,
+        xmlBackend=xmlBackend)
     return v.stream
 
 def parseURL(url, number=None, format=None, forceSource=False): # @ReservedAssignment
@@ -1031,6 +1289,11 @@ def parse(value, *args, **keywords):
 
     `format` specifies the format to parse the line of text or the file as.
 
+    If `streaming` is True, MusicXML is translated into music21 measure by
+    measure as it is read, which needs much less memory for large files;
+    see :class:`~music21.converter.ConverterMusicXML`. `xmlBackend` can be
+    set to 'etree' to parse MusicXML faster with xml.etree.
+
     A string of text is first checked to see if it is a filename that exists on
     disk.  If not it is searched to see if it looks like a URL.  If not it is
     processed as data.
@@ -1076,14 +1339,26 @@ def parse(value, *args, **keywords):
     else:
         m21Format = None
 
+    if 'streaming' in keywords:
+        streaming = keywords['streaming']
+    else:
+        streaming = False
+
+    if 'xmlBackend' in keywords:
+        xmlBackend = keywords['xmlBackend']
+    else:
+        xmlBackend = 'sax'
+
     if (common.isListLike(value) and len(value) == 2 and
         value[1] == None and os.path.exists(value[0])):
         # comes from corpus.search
-        return parseFile(value[0], format=m21Format)
+        return parseFile(value[0], format=m21Format, streaming=streaming,
+            xmlBackend=xmlBackend)
     elif (common.isListLike(value) and len(value) == 2 and
         isinstance(value[1], int) and os.path.exists(value[0])):
         # corpus or other file with movement number
-        return parseFile(value[0], format=m21Format).getScoreByNumber(value[1])
+        return parseFile(value[0], format=m21Format, streaming=streaming,
+            xmlBackend=xmlBackend).getScoreByNumber(value[1])
     elif common.isListLike(value) or len(args) > 0: # tiny notation list
         if len(args) > 0: # add additional args to a list
             value = [value] + list(args)
@@ -1092,12 +1367,15 @@ def parse(value, *args, **keywords):
     elif value.startswith('MThd'):
         return parseData(value, number=number, format=m21Format)
     elif os.path.exists(value):
-        return parseFile(value, number=number, format=m21Format, forceSource=forceSource)
+        return parseFile(value, number=number, format=m21Format,
+            forceSource=forceSource, streaming=streaming,
+            xmlBackend=xmlBackend)
     elif (value.startswith('http://') or value.startswith('https://')):
         # its a url; may need to broaden these criteria
         return parseURL(value, number=number, format=m21Format, forceSource=forceSource)
     else:
-        return parseData(value, number=number, format=m21Format)
+        return parseData(value, number=number, format=m21Format,
+            streaming=streaming, xmlBackend=xmlBackend)
 
 
 
@@ -1201,6 +1479,147 @@ def thawStr(strData):
     return v.stream
 
 
+def _runParseJob(job):
+    '''
+    Parse one item of :func:`~music21.converter.parseMany`, possibly in a
+    worker process. Returns a tuple of the result of the map function or,
+    if there is none, the Stream (frozen if `freeze` is True), or None if
+    the item could not be parsed; and the error message (or None).
+    '''
+    parseFunction, value, keywords, mapFunction, freeze = job
+    try:
+        streamObj = parseFunction(value, **keywords)
+        if mapFunction is not None:
+            return (mapFunction(streamObj), None)
+        if freeze:
+            return (freezeStr(streamObj), None)
+        return (streamObj, None)
+    except Exception as e: # anything can go wrong in parsing a file
+        return (None, '%s: %s' % (e.__class__.__name__, e))
+
+
+def _runParseJobs(parseFunction, values, keywords, mapFunction=None,
+    workers=None, skipFailures=False):
+    '''
+    Call `parseFunction` on each of `values` with `keywords`, in a pool of
+    `workers` processes, and return a list of the Streams (or of the results
+    of `mapFunction` called on each Stream) in the order of `values`.
+
+    If `workers` is None, use 1 fewer process than the number of available
+    cores. If only one process would be used, everything is done in this
+    process, without pickling.
+
+    Every value is parsed even if some fail. If `skipFailures` is True, the
+    result for each value that fails is None; otherwise a
+    ConverterException naming the values that failed is raised.
+    '''
+    values = list(values)
+    if workers is None:
+        workers = multiprocessing.cpu_count() - 1
+    workers = min(workers, len(values))
+    freeze = workers > 1 and mapFunction is None
+    jobs = [(parseFunction, value, keywords, mapFunction, freeze)
+        for value in values]
+    if workers <= 1:
+        results = [_runParseJob(job) for job in jobs]
+    else:
+        pool = multiprocessing.Pool(processes=workers)
+        try:
+            # chunksize of 1, as files can differ greatly in size
+            results = pool.map(_runParseJob, jobs, chunksize=1)
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    errors = ['%s (%s)' % (value, error)
+        for value, (unused_result, error) in zip(values, results)
+        if error is not None]
+    if errors and not skipFailures:
+        raise ConverterException('cannot parse: %s' % ', '.join(errors))
+    post = []
+    for result, error in results:
+        if error is None and freeze:
+            result = thawStr(result)
+        post.append(result)
+    return post
+
+
+def parseMany(values, workers=None, skipFailures=False, parseFunction=None,
+    **keywords):
+    '''
+    Parse each of a list of file paths (or anything else that
+    :func:`~music21.converter.parse` accepts) into a Stream, using a pool of
+    `workers` processes, and return a list of the Streams in the same order.
+
+    Keywords are passed to :func:`~music21.converter.parse`, or to
+    `parseFunction` if it is given; like `function` in
+    :func:`~music21.converter.parseMap`, it must be defined at the top level
+    of a module. If `workers` is None, 1 fewer process than the number of
+    available cores is used; Streams are sent back from the worker processes
+    as :class:`~music21.freezeThaw.StreamFreezer` pickles. With one worker
+    (or one value) everything is parsed in this process.
+
+    >>> from music21 import corpus
+    >>> paths = corpus.getBachChorales()[:3]
+    >>> scores = converter.parseMany(paths, workers=2)
+    >>> [len(s.parts) for s in scores]
+    [5, 4, 4]
+    >>> scores[0].metadata.title == converter.parse(paths[0]).metadata.title
+    True
+
+    All the values are parsed even if some cannot be; then a
+    ConverterException is raised, unless `skipFailures` is True, in which
+    case None is returned for each value that could not be parsed:
+
+    >>> scores = converter.parseMany([paths[0], 'noSuchFile.xml'], workers=2,
+    ...     skipFailures=True)
+    >>> scores[0].metadata.title == converter.parse(paths[0]).metadata.title
+    True
+    >>> scores[1] is None
+    True
+
+    To send back less than whole Streams, use
+    :func:`~music21.converter.parseMap`.
+    '''
+    if parseFunction is None:
+        parseFunction = parse
+    return _runParseJobs(parseFunction, values, keywords, workers=workers,
+        skipFailures=skipFailures)
+
+
+def parseMap(function, values, workers=None, skipFailures=False,
+    parseFunction=None, **keywords):
+    '''
+    Parse each of `values` as :func:`~music21.converter.parseMany` does, call
+    `function` on each Stream in the worker process, and return a list of the
+    results in the order of `values`. Only the results, which must be
+    picklable, are sent between processes, so `function` must be a function
+    defined at the top level of a module, not a lambda or a nested function.
+
+    >>> from music21 import corpus
+    >>> paths = corpus.getBachChorales()[:3]
+    >>> converter.parseMap(len, paths, workers=2)
+    [11, 10, 6]
+
+    Values that cannot be parsed, or for which `function` fails, are handled
+    as in :func:`~music21.converter.parseMany`:
+
+    >>> converter.parseMap(len, [paths[0], 'noSuchFile.xml'], workers=2)
+    Traceback (most recent call last):
+    ConverterException: cannot parse: noSuchFile.xml (...)
+    >>> converter.parseMap(len, [paths[0], 'noSuchFile.xml'], workers=2,
+    ...     skipFailures=True)
+    [11, None]
+    '''
+    if parseFunction is None:
+        parseFunction = parse
+    return _runParseJobs(parseFunction, values, keywords,
+        mapFunction=function, workers=workers, skipFailures=skipFailures)
+
+
 
 
 #-------------------------------------------------------------------------------
@@ -1815,10 +2234,74 @@ class Test(unittest.TestCase):
         cmd = ConverterMuseData()
         cmd.parseFile(fp)
 
+    def testStreamCache(self):
+        import shutil
+        import tempfile
+        global streamCache # pylint: disable=global-statement
+        storedStreamCache = streamCache
+        directory = tempfile.mkdtemp()
+        streamCache = StreamCache(directory=directory)
+        try:
+            dirLib = common.getSourceFilePath()
+            for fp in [os.path.join(dirLib, 'midi', 'testPrimitive', 'test05.mid'),
+                os.path.join(dirLib, 'corpus', 'bach', 'bwv277.krn'),
+                os.path.join(dirLib, 'corpus', 'bach', 'bwv66.6.mxl')]:
+                s1 = parse(fp)
+                s2 = parse(fp)
+                self.assertEqual(s2.filePath, fp)
+                self.assertEqual([(e.offset, e.classes[0]) for e in s1.flat],
+                    [(e.offset, e.classes[0]) for e in s2.flat])
+                self.assertEqual(
+                    [(n.offset, n.pitches) for n in s1.flat.notes],
+                    [(n.offset, n.pitches) for n in s2.flat.notes])
+                s3 = parse(fp, forceSource=True)
+                self.assertEqual(len(s3.flat), len(s1.flat))
+            self.assertEqual(streamCache.hits, 3)
+            self.assertEqual(streamCache.misses, 3)
+
+            # abc works are cached by number
+            fp = os.path.join(dirLib, 'corpus', 'essenFolksong', 'testd.abc')
+            s1 = parse(fp, number=1)
+            s2 = parse(fp, number=2)
+            self.assertEqual(streamCache.misses, 5)
+            self.assertEqual(parse(fp, number=2).metadata.title,
+                s2.metadata.title)
+            self.assertNotEqual(s1.metadata.title, s2.metadata.title)
+            self.assertEqual(streamCache.hits, 4)
+
+            # least recently used entries are removed
+            self.assertEqual(len(os.listdir(directory)), 5)
+            streamCache.maxSize = 0
+            streamCache.put('test', s1)
+            self.assertEqual(os.listdir(directory), [])
+            self.assertEqual(streamCache.evictions, 6)
+
+            # put() leaves the Stream given unchanged unless fastButUnsafe
+            # is True, when a new Stream is returned
+            siteCounts = [len(e.sites) for e in s1.recurse()]
+            self.assertEqual(streamCache.put('test', s1) is s1, True)
+            self.assertEqual([len(e.sites) for e in s1.recurse()], siteCounts)
+            s4 = streamCache.put('test', copy.deepcopy(s1), fastButUnsafe=True)
+            self.assertEqual(
+                [(n.offset, n.pitches) for n in s4.flat.notes],
+                [(n.offset, n.pitches) for n in s1.flat.notes])
+
+            # a Converter keeps no format-specific converter for a cached
+            # Stream, even after an earlier uncached parse
+            c = Converter()
+            c.parseFile(fp, number=1, forceSource=True)
+            self.assertNotEqual(c._converter, None)
+            c.parseFile(fp, number=1)
+            self.assertEqual(c._converter, None)
+            self.assertEqual(c.stream.metadata.title, s1.metadata.title)
+        finally:
+            streamCache = storedStreamCache
+            shutil.rmtree(directory)
+
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
-_DOC_ORDER = [parse, parseFile, parseData, parseURL, freeze, thaw, freezeStr, thawStr, Converter, ConverterMusicXML, ConverterHumdrum]
+_DOC_ORDER = [parse, parseFile, parseData, parseURL, parseMany, parseMap, freeze, thaw, freezeStr, thawStr, Converter, StreamCache, ConverterMusicXML, ConverterHumdrum]
 
 
 if __name__ == "__main__":
@@ -640,10 +640,11 @@ def parse(
     ABC documents contain dozens of folk songs within a single file.
 
     Advanced: if `forceSource` is True, the original file will always be loaded
-    freshly and pickled (e.g., pre-parsed) files will be ignored.  This should
-    not be needed if the file has been changed, since the filetime of the file
-    and the filetime of the pickled version are compared.  But it might be
-    needed if the music21 parsing routine has changed.
+    freshly and cached (e.g., pre-parsed) Streams will be ignored.  This should
+    not be needed if the file has been changed, since cached Streams are found
+    by the contents of the file and the music21 version (see
+    :class:`~music21.converter.StreamCache`).  But it might be needed if the
+    music21 parsing routine has changed.
 
     Example, get a chorale by Bach.  Note that the source type does not need to
     be specified, nor does the name Bach even (since it's the only piece with
@@ -674,6 +675,73 @@ def parse(
         )
 
 
+def parseMany(
+    workNames,
+    workers=None,
+    skipFailures=False,
+    movementNumber=None,
+    number=None,
+    fileExtensions=None,
+    forceSource=False,
+    ):
+    '''
+    Parse each of a list of work names or file paths, as
+    :func:`~music21.corpus.parse` does, using a pool of `workers` processes,
+    and return a list of the Streams in the same order. See
+    :func:`~music21.converter.parseMany`, which also describes `skipFailures`.
+
+    ::
+
+        >>> from music21 import corpus
+        >>> chorales = corpus.parseMany(['bwv66.6', 'bwv1.6'], workers=2)
+        >>> [c.corpusFilepath for c in chorales]
+        [u'bach/bwv66.6.mxl', u'bach/bwv1.6.mxl']
+
+    '''
+    keywords = {
+        'movementNumber': movementNumber,
+        'number': number,
+        'fileExtensions': fileExtensions,
+        'forceSource': forceSource,
+        }
+    return converter.parseMany(workNames, workers=workers,
+        skipFailures=skipFailures, parseFunction=parse, **keywords)
+
+
+def mapCorpus(
+    function,
+    workNames,
+    workers=None,
+    skipFailures=False,
+    movementNumber=None,
+    number=None,
+    fileExtensions=None,
+    forceSource=False,
+    ):
+    '''
+    Parse each of a list of work names or file paths as
+    :func:`~music21.corpus.parseMany` does, call `function` on each Stream in
+    the worker process, and return a list of the results in the same order.
+    Only the results are sent between processes; `function` must be defined
+    at the top level of a module. See :func:`~music21.converter.parseMap`.
+
+    ::
+
+        >>> from music21 import corpus
+        >>> corpus.mapCorpus(len, ['bwv66.6', 'bwv1.6'], workers=2)
+        [6, 11]
+
+    '''
+    keywords = {
+        'movementNumber': movementNumber,
+        'number': number,
+        'fileExtensions': fileExtensions,
+        'forceSource': forceSource,
+        }
+    return converter.parseMap(function, workNames, workers=workers,
+        skipFailures=skipFailures, parseFunction=parse, **keywords)
+
+
 def _addCorpusFilepath(streamObj, filePath):
     # metadata attribute added to store the file path,
     # for use later in identifying the score
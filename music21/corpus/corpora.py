@@ -274,11 +274,11 @@ class Corpus(object):
         our ABC documents contain dozens of folk songs within a single file.
 
         Advanced: if `forceSource` is True, the original file will always be
-        loaded freshly and pickled (e.g., pre-parsed) files will be ignored.
-        This should not be needed if the file has been changed, since the
-        filetime of the file and the filetime of the pickled version are
-        compared.  But it might be needed if the music21 parsing routine has
-        changed.
+        loaded freshly and cached (e.g., pre-parsed) Streams will be ignored.
+        This should not be needed if the file has been changed, since cached
+        Streams are found by the contents of the file and the music21
+        version (see :class:`~music21.converter.StreamCache`).  But it might
+        be needed if the music21 parsing routine has changed.
 
         Example, get a chorale by Bach.  Note that the source type does not
         need to be specified, nor does the name Bach even (since it's the only
@@ -204,6 +204,30 @@ class Test(unittest.TestCase):
             )
         #s.show()
 
+    def testParseMany(self):
+        from music21 import converter
+        workNames = ['bwv66.6', 'bach/bwv1.6', 'luca/gloria']
+        serial = corpus.parseMany(workNames, workers=1)
+        parallel = corpus.parseMany(workNames, workers=2)
+        self.assertEqual(len(parallel), 3)
+        for s1, s2 in zip(serial, parallel):
+            self.assertEqual(s1.corpusFilepath, s2.corpusFilepath)
+            self.assertEqual(s1.metadata.title, s2.metadata.title)
+            self.assertEqual(
+                [(n.offset, n.nameWithOctave) for n in s1.flat.notes],
+                [(n.offset, n.nameWithOctave) for n in s2.flat.notes])
+        self.assertEqual(corpus.mapCorpus(len, workNames, workers=2),
+            [len(s) for s in serial])
+
+        # a work that cannot be parsed does not stop the others
+        workNames.insert(1, 'noSuchWork')
+        for workers in (1, 2):
+            self.assertRaises(converter.ConverterException,
+                corpus.parseMany, workNames, workers=workers)
+            self.assertEqual(corpus.mapCorpus(len, workNames,
+                workers=workers, skipFailures=True),
+                [len(serial[0]), None, len(serial[1]), len(serial[2])])
+
 #     def testWorkReferences(self):
 #         s = corpus.getWorkReferences()
 #
@@ -628,10 +628,10 @@ class ClassDocumenter(ObjectDocumenter):
             - music21.stream.Stream.beatStrength
             - music21.stream.Stream.derivationChain
             - music21.stream.Stream.flat
+            - music21.stream.Stream.flatView
             - music21.stream.Stream.highestOffset
             - music21.stream.Stream.highestTime
             - music21.stream.Stream.isGapless
-            - music21.stream.Stream.lowestOffset
 
         '''
 
@@ -678,7 +678,7 @@ class ClassDocumenter(ObjectDocumenter):
             - music21.stream.Stream.attachMelodicIntervals
             - music21.stream.Stream.attributeCount
             - music21.stream.Stream.augmentOrDiminish
-            - music21.stream.Stream.beatAndMeasureFromOffset
+            - music21.stream.Stream.batchEdit
 
         '''
         return self._inheritedMethodsMapping
@@ -740,7 +740,7 @@ class ClassDocumenter(ObjectDocumenter):
             <music21.documentation.library.documenters.MethodDocumenter: music21.stream.Stream.attachMelodicIntervals>
             <music21.documentation.library.documenters.MethodDocumenter: music21.stream.Stream.attributeCount>
             <music21.documentation.library.documenters.MethodDocumenter: music21.stream.Stream.augmentOrDiminish>
-            <music21.documentation.library.documenters.MethodDocumenter: music21.stream.Stream.beatAndMeasureFromOffset>
+            <music21.documentation.library.documenters.MethodDocumenter: music21.stream.Stream.batchEdit>
 
         '''
         return self._methods
@@ -764,6 +764,7 @@ class ClassDocumenter(ObjectDocumenter):
             <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.beatStrength>
             <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.derivationChain>
             <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.flat>
+            <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.flatView>
             <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.highestOffset>
             <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.highestTime>
             <music21.documentation.library.documenters.AttributeDocumenter: music21.stream.Stream.isGapless>
@@ -2120,6 +2120,7 @@ class Duration(DurationCommon):
     isGrace = False
 
     __slots__ = (
+        'client',
         'linkage',
         '_cachedIsLinked',
         '_components',
@@ -2133,6 +2134,8 @@ class Duration(DurationCommon):
         First positional argument is assumed to be type string or a quarterLength.
         '''
         DurationCommon.__init__(self)
+        # a weak reference to the object that this is the Duration of
+        self.client = None
         self._quarterLengthNeedsUpdating = False
         self._qtrLength = 0.0
         # always have one DurationUnit object
@@ -2233,6 +2236,12 @@ class Duration(DurationCommon):
         '''
         return not self.__eq__(other)
 
+    def __getstate__(self):
+        state = DurationCommon.__getstate__(self)
+        # copies and thawed Durations are not yet the Duration of any object
+        state['client'] = None
+        return state
+
     def __repr__(self):
         if self.isLinked:
             return '<music21.duration.Duration %s>' % self.quarterLength
@@ -2241,6 +2250,24 @@ class Duration(DurationCommon):
 
     ### PRIVATE METHODS ###
 
+    def _informClient(self):
+        '''
+        Called when the length of this Duration changes in place: the
+        object that this is the Duration of, if any, must tell its Stream
+        sites that its end time has changed.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> s.highestTime
+        4.0
+        >>> s[3].duration.type = 'half'
+        >>> s.highestTime
+        5.0
+        '''
+        client = common.unwrapWeakref(self.client)
+        if client is not None:
+            client._durationChanged()
+
     def _updateComponents(self):
         '''
         This method will re-construct components and thus is not good if the
@@ -2292,6 +2319,7 @@ class Duration(DurationCommon):
                 self.components.append(c)
         if link:
             self._quarterLengthNeedsUpdating = True
+            self._informClient()
 
     def appendTuplet(self, newTuplet):
         self.tuplets = self.tuplets + (newTuplet,)
@@ -2357,6 +2385,7 @@ class Duration(DurationCommon):
                 d.augmentOrDiminish(amountToScale, inPlace=True)
             self._typeNeedsUpdating = True
             self._quarterLengthNeedsUpdating = True
+            self._informClient()
         else:
             post.quarterLength = post.quarterLength * amountToScale
 
@@ -2383,6 +2412,7 @@ class Duration(DurationCommon):
         '''
         self.components = []
         self._quarterLengthNeedsUpdating = True
+        self._informClient()
 
     def componentIndexAtQtrPosition(self, quarterPosition):
         '''returns the index number of the duration component sounding at
@@ -2589,6 +2619,7 @@ class Duration(DurationCommon):
             self._cachedIsLinked = True
             # quarter length will be set based on component types
             self._quarterLengthNeedsUpdating = True
+            self._informClient()
         else: # there may be components and still a zero type
             raise DurationException("zero DurationUnits in components: cannt link or unlink")
 
@@ -2598,6 +2629,7 @@ class Duration(DurationCommon):
         # quarter length is always obtained from _qtrLength, even when
         # not linked; yet a component must be present to provide a type
         self._qtrLength = value
+        self._informClient()
         if len(self._components) == 0:
             if self._qtrLength == 0.0: # if not set create a default
                 self._components.append(ZeroDuration())
@@ -2816,6 +2848,7 @@ class Duration(DurationCommon):
             self._components = value
             # this is Ture b/c components are note the same
             self._quarterLengthNeedsUpdating = True
+            self._informClient()
             # musst be cleared
             self._cachedIsLinked = None
 
@@ -2853,6 +2886,7 @@ class Duration(DurationCommon):
         if len(self.components) == 1:
             self.components[0].dotGroups = value
             self._quarterLengthNeedsUpdating = True
+            self._informClient()
         elif len(self.components) > 1:
             raise DurationException("setting dotGroups: Myke and Chris need to decide what that means")
         else: # there must be 1 or more components
@@ -2898,6 +2932,7 @@ class Duration(DurationCommon):
         if len(self.components) == 1:
             self.components[0].dots = value
             self._quarterLengthNeedsUpdating = True
+            self._informClient()
         elif len(self.components) > 1:
             raise DurationException("setting type on Complex note: Myke and Chris need to decide what that means")
         else:  # there must be 1 or more components
@@ -3170,6 +3205,7 @@ class Duration(DurationCommon):
             if isinstance(value, int):
                 value = float(value)
             self._qtrLength = value
+            self._informClient()
             self._componentsNeedUpdating = True
             self._quarterLengthNeedsUpdating = False
 
@@ -3198,6 +3234,7 @@ class Duration(DurationCommon):
                 thisTuplet.frozen = True
             self.components[0].tuplets = tupletTuple
             self._quarterLengthNeedsUpdating = True
+            self._informClient()
         else: # there must be 1 or more components
             raise DurationException("zero DurationUnits in components")
 
@@ -3242,6 +3279,7 @@ class Duration(DurationCommon):
             # change the existing DurationUnit to the this type
             self.components[0].type = value
             self._quarterLengthNeedsUpdating = True
+            self._informClient()
         elif self.isComplex: # more than one component
             raise DurationException("setting type on Complex note: Myke and Chris need to decide what that means")
             # what do we do if we already have multiple DurationUnits
@@ -3249,6 +3287,7 @@ class Duration(DurationCommon):
             # create a new duration unit
             self.addDurationUnit(DurationUnit(value)) # updates
             self._quarterLengthNeedsUpdating = True
+            self._informClient()
 
 
 
@@ -313,9 +313,12 @@ class StreamFreezer(StreamFreezeThawBase):
                     el._derivation = derivation.Derivation() #reset
 
                 el.sites.clear()
+                # keep the default location, as in Music21Object.__init__
+                el.sites.add(None, 0.0)
                 el.activeSite = None
             startObj._derivation = derivation.Derivation() #reset
             startObj.sites.clear()
+            startObj.sites.add(None, 0.0)
             startObj.activeSite = None
 
     def setupStoredElementOffsetTuples(self, streamObj):
@@ -418,6 +418,39 @@ class BoundIntervalNetwork(IntervalNetwork):
         self._ascendingCache = {}
         self._descendingCache = {}
 
+    def copyStructure(self):
+        '''
+        Return a new BoundIntervalNetwork with copies of the Nodes and Edges
+        of this one, and the same settings, but none of its cached pitch
+        realizations. The Interval objects of the Edges are shared, as the
+        network never changes them; this is much faster than filling a new
+        network from a list of interval names.
+
+        >>> net1 = intervalNetwork.BoundIntervalNetwork(['M2', 'M2', 'm2'])
+        >>> net2 = net1.copyStructure()
+        >>> net2 == net1
+        True
+        >>> net2._edges[0] is net1._edges[0]
+        False
+        >>> net2._edges[0].interval is net1._edges[0].interval
+        True
+        >>> net2.realizePitch('G4') == net1.realizePitch('G4')
+        True
+        '''
+        post = self.__class__(octaveDuplicating=self.octaveDuplicating,
+            deterministic=self.deterministic,
+            pitchSimplification=self.pitchSimplification)
+        post._edgeIdCount = self._edgeIdCount
+        post._nodeIdCount = self._nodeIdCount
+        for nId, n in self._nodes.items():
+            post._nodes[nId] = Node(id=n.id, degree=n.degree, weight=n.weight)
+        for eId, e in self._edges.items():
+            eNew = Edge(e.interval, id=e.id)
+            eNew._direction = e._direction
+            eNew.weight = e.weight
+            eNew._connections = list(e._connections)
+            post._edges[eId] = eNew
+        return post
 
 
     def __eq__(self, other):
@@ -34,6 +34,7 @@ import unittest
 import unicodedata
 import sys, os, string, types
 import struct
+import array
 
 try:
     import StringIO # python 2 
@@ -197,6 +198,37 @@ def getVariableLengthNumber(midiStr):
             #environLocal.printDebug(['getVariableLengthNumber: depth read into string: %s' % i])
             return summation, midiStr[i:] 
 
+def _getNumberAt(midiStr, position, length):
+    '''
+    Like :func:`~music21.midi.getNumber`, but reads from `position` in
+    `midiStr` and returns the position after the number rather than the
+    remaining string, so that no string is copied.
+
+    >>> midi._getNumberAt('test', 1, 2)
+    (25971, 3)
+    '''
+    summation = 0
+    for i in range(position, position + length):
+        summation = (summation << 8) + ord(midiStr[i])
+    return summation, position + length
+
+def _getVariableLengthNumberAt(midiStr, position):
+    r'''
+    Like :func:`~music21.midi.getVariableLengthNumber`, but reads from
+    `position` in `midiStr` and returns the position after the number
+    rather than the remaining string, so that no string is copied.
+
+    >>> midi._getVariableLengthNumberAt('A\xff\x7fu', 1)
+    (16383, 3)
+    '''
+    summation = 0
+    while True:
+        x = ord(midiStr[position])
+        summation = (summation << 7) + (x & 0x7F)
+        position += 1
+        if not (x & 0x80):
+            return summation, position
+
 def getNumbersAsList(midiStr):
     '''
     Translate each char into a number, return in a list. 
@@ -599,12 +631,25 @@ class MidiEvent(object):
         >>> me1.velocity
         120
         '''
-        # x, y, and z define characteristics of the first two chars
+        return midiStr[self._parseChannelVoiceMessageAt(
+            ord(midiStr[0]), midiStr, 1):]
+
+    def _parseChannelVoiceMessageAt(self, x, midiStr, position):
+        '''
+        Parse a channel voice message with status byte `x` (as an int),
+        whose data begins at `position` in `midiStr`, and return the
+        position after the message.
+
+        >>> mt = midi.MidiTrack(1)
+        >>> me1 = midi.MidiEvent(mt)
+        >>> me1._parseChannelVoiceMessageAt(145, midi.intsToHexString([60, 120]), 0)
+        2
+        >>> me1.channel, me1.type, me1.pitch, me1.velocity
+        (2, 'NOTE_ON', 60, 120)
+        '''
         # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
-        x = ord(midiStr[0]) # return the char number
         y = x & 0xF0  # bitwise and to derive channel number
-        z = ord(midiStr[1])
-        thirdByte = midiStr[2] 
+        z = ord(midiStr[position])
 
         self.channel = (x & 0x0F) + 1  # this is same as y + 1
         self.type = channelVoiceMessages.whatis(y) 
@@ -612,21 +657,21 @@ class MidiEvent(object):
         if (self.type == "PROGRAM_CHANGE" or 
             self.type == "CHANNEL_KEY_PRESSURE"): 
             self.data = z 
-            return midiStr[2:] 
+            return position + 1
         elif (self.type == "CONTROLLER_CHANGE"):
             # for now, do nothing with this data
             # for a note, str[2] is velocity; here, it is the control value
             self.pitch = z # this is the controller id
-            self.velocity = ord(thirdByte) # this is the controller value
-            return midiStr[3:] 
+            self.velocity = ord(midiStr[position + 1]) # this is the controller value
+            return position + 2
         else: 
             self.pitch = z # the second byte
             # read the third chart toi get velocity 
-            self.velocity = ord(thirdByte) 
+            self.velocity = ord(midiStr[position + 1]) 
             # each MidiChannel object is accessed here
             # using that channel, data for each event is added or 
             # removed 
-            return midiStr[3:] 
+            return position + 2
 
     def read(self, time, midiStr): 
         '''
@@ -650,15 +695,30 @@ class MidiEvent(object):
         >>> (159 & 0x0F) + 1 # getting the channel
         16
         '''
-        if len(midiStr) < 2:
+        return midiStr[self._readAt(time, midiStr, 0):]
+
+    def _readAt(self, time, midiStr, position):
+        '''
+        Parse the event beginning at `position` in `midiStr`, as
+        :meth:`~music21.midi.MidiEvent.read` does, and return the position
+        after the event; `midiStr` is not copied.
+
+        >>> mt = midi.MidiTrack(1)
+        >>> me1 = midi.MidiEvent(mt)
+        >>> me1._readAt(0, midi.intsToHexString([0, 144, 60, 120, 0]), 1)
+        4
+        >>> me1
+        <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=60, velocity=120>
+        '''
+        if len(midiStr) - position < 2:
             # often what we have here are null events:
             # the string is simply: 0x00
-            environLocal.printDebug(['MidiEvent.read(): got bad data string', 'time', time, 'str', repr(midiStr)])
-            return ''
+            environLocal.printDebug(['MidiEvent.read(): got bad data string', 'time', time, 'str', repr(midiStr[position:])])
+            return len(midiStr)
 
         # x, y, and z define characteristics of the first two chars
         # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
-        x = ord(midiStr[0]) # given a string representation, get decimal number
+        x = ord(midiStr[position]) # given a string representation, get decimal number
 
         # detect running status: if the status byte is less than 128, its 
         # not a status byte, but a data byte
@@ -669,41 +729,38 @@ class MidiEvent(object):
                 rsb = self.lastStatusByte
             else: # provide a default
                 rsb = chr(0x90)
-            #post = self._parseChannelVoiceMessage(str, runningStatusByte=rsb)
-            #return post
-            # add the running status byte to the front of the string 
-            # and process as before
-            midiStr = rsb + midiStr
-            x = ord(midiStr[0]) # given a string representation, get decimal number
+            # process as if the running status byte were found before
+            # the data, which starts here
+            x = ord(rsb)
+            position -= 1
         else:
             # store last status byte
-            self.lastStatusByte = midiStr[0]
+            self.lastStatusByte = midiStr[position]
 
         y = x & 0xF0  # bitwise and to derive message type
-        z = ord(midiStr[1]) 
-
-        #environLocal.printDebug(['MidiEvent.read(): trying to parse a MIDI event, looking at first two chars:', 'repr(x)', repr(x), 'charToBinary(str[0])', charToBinary(str[0]), 'charToBinary(str[1])', charToBinary(str[1])])
+        z = ord(midiStr[position + 1]) 
 
         if channelVoiceMessages.hasValue(y): 
-            return self._parseChannelVoiceMessage(midiStr)
+            return self._parseChannelVoiceMessageAt(x, midiStr, position + 1)
 
         elif y == 0xB0 and channelModeMessages.hasValue(z): 
             self.channel = (x & 0x0F) + 1 
             self.type = channelModeMessages.whatis(z) 
             if self.type == "LOCAL_CONTROL": 
-                self.data = (ord(midiStr[2]) == 0x7F) 
+                self.data = (ord(midiStr[position + 2]) == 0x7F) 
             elif self.type == "MONO_MODE_ON": 
-                self.data = ord(midiStr[2]) 
+                self.data = ord(midiStr[position + 2]) 
             else:
-                environLocal.printDebug(['unhandled message:', midiStr[2]])
-            return midiStr[3:]
+                environLocal.printDebug(['unhandled message:', midiStr[position + 2]])
+            return position + 3
 
         elif x == 0xF0 or x == 0xF7: 
             self.type = {0xF0: "F0_SYSEX_EVENT", 
                          0xF7: "F7_SYSEX_EVENT"}[x] 
-            length, midiStr = getVariableLengthNumber(midiStr[1:]) 
-            self.data = midiStr[:length] 
-            return midiStr[length:]
+            length, position = _getVariableLengthNumberAt(midiStr,
+                position + 1)
+            self.data = midiStr[position:position + length] 
+            return position + length
 
         # SEQUENCE_TRACK_NAME and other MetaEvents are here
         elif x == 0xFF: 
@@ -713,17 +770,16 @@ class MidiEvent(object):
                 sys.stdout.flush() 
                 raise MidiException("Unknown midi event type: %r, %r" % (x, z))
             self.type = metaEvents.whatis(z) 
-            length, midiStr = getVariableLengthNumber(midiStr[2:]) 
-            self.data = midiStr[:length] 
-            # return remainder
-            return midiStr[length:] 
+            length, position = _getVariableLengthNumberAt(midiStr,
+                position + 2)
+            self.data = midiStr[position:position + length] 
+            # return position of remainder
+            return position + length
         else:
             # an uncaught message
-            environLocal.printDebug(['got unknown midi event type', repr(x), 'charToBinary(midiStr[0])', charToBinary(midiStr[0]), 'charToBinary(midiStr[1])', charToBinary(midiStr[1])])
+            environLocal.printDebug(['got unknown midi event type', repr(x), 'charToBinary(midiStr[0])', charToBinary(chr(x)), 'charToBinary(midiStr[1])', charToBinary(midiStr[position + 1])])
 
             raise MidiException("Unknown midi event type")
-            #return everything but the first character
-            return midiStr[1:] # 
 
 
     def write(self): 
@@ -962,25 +1018,38 @@ class MidiTrack(object):
         Creates and stores :class:`~music21.midi.base.DeltaTime` 
         and :class:`~music21.midi.base.MidiEvent` objects. 
         '''
+        return midiStr[self._readAt(midiStr, 0):]
+
+    def _readAt(self, midiStr, position):
+        '''
+        Read the track beginning at `position` in `midiStr`, as
+        :meth:`~music21.midi.MidiTrack.read` does, and return the position
+        after the track. The track data is copied once; events are read
+        from it by position.
+        '''
         time = 0 # a running counter of ticks
 
-        if not midiStr[:4] == "MTrk":
+        if not midiStr[position:position + 4] == "MTrk":
             raise MidiException('badly formed midi string: missing leading MTrk')
         # get the 4 chars after the MTrk encoding
-        length, midiStr = getNumber(midiStr[4:], 4)      
+        length, position = _getNumberAt(midiStr, position + 4, 4)
         #environLocal.printDebug(['MidiTrack.read(): got chunk size', length])   
         self.length = length 
 
         # all event data is in the track str
-        trackStr = midiStr[:length] 
-        remainder = midiStr[length:] 
+        trackStr = midiStr[position:position + length] 
+        trackLength = len(trackStr)
+        trackPosition = 0
 
+        events = self.events
         ePrevious = None
-        while trackStr: 
+        while trackPosition < trackLength: 
             # shave off the time stamp from the event
             delta_t = DeltaTime(self) 
-            # return extracted time, as well as remaining string
-            dt, trackStrCandidate = delta_t.read(trackStr) 
+            # return extracted time, as well as position of the event
+            dt, candidatePosition = _getVariableLengthNumberAt(trackStr,
+                trackPosition)
+            delta_t.time = dt
             # this is the offset that this event happens at, in ticks
             timeCandidate = time + dt 
     
@@ -990,22 +1059,24 @@ class MidiTrack(object):
                 e.lastStatusByte = ePrevious.lastStatusByte
             # some midi events may raise errors; simply skip for now
             try:
-                trackStrCandidate = e.read(timeCandidate, trackStrCandidate) 
+                candidatePosition = e._readAt(timeCandidate, trackStr,
+                    candidatePosition)
             except MidiException:
                 # assume that trackStr, after delta extraction, is still correct
                 #environLocal.printDebug(['forced to skip event; delta_t:', delta_t])
                 # set to result after taking delta time
-                trackStr = trackStrCandidate
+                trackPosition = candidatePosition
                 continue
             # only set after trying to read, which may raise exception
             time = timeCandidate
-            trackStr = trackStrCandidate # remainder string
+            trackPosition = candidatePosition # remainder of track
             # only append if we get this far
-            self.events.append(delta_t) 
-            self.events.append(e) 
+            events.append(delta_t) 
+            events.append(e) 
             ePrevious = e
 
-        return remainder # remainder string after extracting track data
+        # position after extracting track data
+        return position + length
     
     def write(self): 
         '''
@@ -1073,7 +1144,239 @@ class MidiTrack(object):
             if e.type == 'PROGRAM_CHANGE':
                 if e.data not in post:
                     post.append(e.data)
-        return post            
+        return post
+
+
+class ColumnarMidiTrack(MidiTrack):
+    '''
+    A MIDI Track that stores the events read from MIDI data in parallel
+    arrays (columns) rather than as :class:`~music21.midi.DeltaTime` and
+    :class:`~music21.midi.MidiEvent` objects.
+
+    For each event, `ticks` stores the absolute time in ticks; `statuses`
+    stores the status byte (with running status resolved), from which the
+    type and channel are derived; `data1` stores the first data byte (the
+    pitch, controller, or program, or the meta event type); and `data2` stores
+    the second data byte (the velocity or controller value). The data of
+    meta and system exclusive events is stored in the `payloads` dictionary,
+    keyed by event index. An event whose status is zero is a null event.
+
+    MidiEvent objects are only created when they are needed:
+    :meth:`~music21.midi.ColumnarMidiTrack.getEvent` creates a single event,
+    and accessing `.events` creates the complete list of DeltaTime and
+    MidiEvent pairs found in a :class:`~music21.midi.MidiTrack`. Once
+    `.events` has been accessed, it (and not the columns) defines this track.
+
+    >>> mt = midi.ColumnarMidiTrack(1)
+    >>> mt.read(midi.intsToHexString([77, 84, 114, 107, 0, 0, 0, 8,
+    ...     0, 144, 60, 100, 129, 0, 60, 0]))
+    ''
+    >>> list(mt.ticks), list(mt.statuses), list(mt.data1), list(mt.data2)
+    ([0, 128], [144, 144], [60, 60], [100, 0])
+    >>> mt.hasNotes()
+    True
+    >>> mt.isMaterialized
+    False
+    >>> mt.getEvent(1)
+    <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=60, velocity=0>
+    >>> mt.events
+    [<MidiEvent DeltaTime, t=0, track=1, channel=None>, <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=60, velocity=100>, <MidiEvent DeltaTime, t=128, track=1, channel=None>, <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=60, velocity=0>]
+    >>> mt.isMaterialized
+    True
+    '''
+    def __init__(self, index):
+        MidiTrack.__init__(self, index)
+        self._events = None
+        self.ticks = array.array('l')
+        self.statuses = array.array('B')
+        self.data1 = array.array('B')
+        self.data2 = array.array('B')
+        self.payloads = {}
+
+    def _getEvents(self):
+        if self._events is None:
+            events = []
+            previousTicks = 0
+            for i in range(len(self.statuses)):
+                t = self.ticks[i]
+                events.append(DeltaTime(self, time=t - previousTicks))
+                events.append(self._eventFromColumns(i))
+                previousTicks = t
+            self._events = events
+        return self._events
+
+    def _setEvents(self, value):
+        self._events = value
+
+    events = property(_getEvents, _setEvents, doc='''
+        The list of DeltaTime and MidiEvent objects of this track, created
+        from the columns when first accessed.
+        ''')
+
+    def _getIsMaterialized(self):
+        return self._events is not None
+
+    isMaterialized = property(_getIsMaterialized, doc='''
+        Return True if the `.events` list has been created; the columns
+        are then no longer used.
+        ''')
+
+    def _eventFromColumns(self, i):
+        e = MidiEvent(self)
+        x = self.statuses[i]
+        if x == 0: # a null event
+            return e
+        e.lastStatusByte = chr(x)
+        y = x & 0xF0
+        if y != 0xF0:
+            e.channel = (x & 0x0F) + 1
+            e.type = channelVoiceMessages.whatis(y)
+            if y == 0xC0 or y == 0xD0: # program change, channel key pressure
+                e.data = self.data1[i]
+            else:
+                e.pitch = self.data1[i]
+                e.velocity = self.data2[i]
+        elif x == 0xFF:
+            e.type = metaEvents.whatis(self.data1[i])
+            e.data = self.payloads[i]
+        else:
+            e.type = {0xF0: "F0_SYSEX_EVENT",
+                      0xF7: "F7_SYSEX_EVENT"}[x]
+            e.data = self.payloads[i]
+        return e
+
+    def getEvent(self, i):
+        '''
+        Return the MidiEvent at index `i` (not counting DeltaTime objects).
+        If `.events` has not been created, a new MidiEvent is made from the
+        columns.
+
+        >>> mt = midi.ColumnarMidiTrack(2)
+        >>> mt.readColumns(midi.intsToHexString([0, 255, 81, 3, 7, 161, 32]))
+        >>> mt.getEvent(0)
+        <MidiEvent SET_TEMPO, t=None, track=2, channel=None, data='\\x07\\xa1 '>
+        '''
+        if self._events is not None:
+            return self._events[2 * i + 1]
+        return self._eventFromColumns(i)
+
+    def _readAt(self, midiStr, position):
+        '''
+        Read the track beginning at `position` in `midiStr` into the
+        columns and return the position after the track.
+        '''
+        if not midiStr[position:position + 4] == "MTrk":
+            raise MidiException('badly formed midi string: missing leading MTrk')
+        # get the 4 chars after the MTrk encoding
+        length, position = _getNumberAt(midiStr, position + 4, 4)
+        self.length = length
+        self.readColumns(midiStr[position:position + length])
+        # position after extracting track data
+        return position + length
+
+    def readColumns(self, trackStr):
+        '''
+        Read the events in `trackStr`, the track data following the `MTrk`
+        header and length, appending them to the columns. Events are read
+        as by :meth:`~music21.midi.MidiEvent.read`, and events that cannot
+        be read are skipped, as in :class:`~music21.midi.MidiTrack`.
+        '''
+        appendTicks = self.ticks.append
+        appendStatus = self.statuses.append
+        appendData1 = self.data1.append
+        appendData2 = self.data2.append
+        payloads = self.payloads
+
+        time = 0 # a running counter of ticks
+        if len(self.ticks) > 0:
+            time = self.ticks[-1]
+        lastStatus = None # the last status byte read, as an int
+        trackLength = len(trackStr)
+        trackPosition = 0
+        while trackPosition < trackLength:
+            dt, eventPosition = _getVariableLengthNumberAt(trackStr,
+                trackPosition)
+            if trackLength - eventPosition < 2:
+                # a null event; see MidiEvent._readAt()
+                environLocal.printDebug(['ColumnarMidiTrack.readColumns(): got bad data string', 'str', repr(trackStr[eventPosition:])])
+                time += dt
+                appendTicks(time)
+                appendStatus(0)
+                appendData1(0)
+                appendData2(0)
+                break
+
+            x = ord(trackStr[eventPosition])
+            statusPosition = eventPosition
+            if x < 128: # running status: this is the first data byte
+                if lastStatus is not None:
+                    x = lastStatus
+                else: # provide a default
+                    x = 0x90
+                statusPosition -= 1
+            y = x & 0xF0
+            z = ord(trackStr[statusPosition + 1])
+            if y != 0xF0: # channel voice messages
+                if y == 0xC0 or y == 0xD0:
+                    velocity = 0
+                    nextPosition = statusPosition + 2
+                else:
+                    velocity = ord(trackStr[statusPosition + 2])
+                    nextPosition = statusPosition + 3
+                payload = None
+            elif x == 0xF0 or x == 0xF7:
+                dataLength, dataPosition = _getVariableLengthNumberAt(
+                    trackStr, statusPosition + 1)
+                payload = trackStr[dataPosition:dataPosition + dataLength]
+                z = 0
+                velocity = 0
+                nextPosition = dataPosition + dataLength
+            elif x == 0xFF and metaEvents.hasValue(z):
+                dataLength, dataPosition = _getVariableLengthNumberAt(
+                    trackStr, statusPosition + 2)
+                payload = trackStr[dataPosition:dataPosition + dataLength]
+                velocity = 0
+                nextPosition = dataPosition + dataLength
+            else:
+                # skip events that cannot be read; the data after the
+                # delta time is read as the next delta time, as in MidiTrack
+                environLocal.printDebug(['ColumnarMidiTrack.readColumns(): skipping unknown midi event type', x, z])
+                trackPosition = eventPosition
+                continue
+
+            if statusPosition == eventPosition:
+                lastStatus = x
+            time += dt
+            if payload is not None:
+                payloads[len(self.statuses)] = payload
+            appendTicks(time)
+            appendStatus(x)
+            appendData1(z)
+            appendData2(velocity)
+            trackPosition = nextPosition
+
+    def hasNotes(self):
+        '''Return True/False if this track has any note-on/note-off pairs defined.
+        '''
+        if self._events is not None:
+            return MidiTrack.hasNotes(self)
+        data2 = self.data2
+        for i, x in enumerate(self.statuses):
+            if x & 0xF0 == 0x90 and data2[i] != 0:
+                return True
+        return False
+
+    def getProgramChanges(self):
+        '''Get all unique program changes used in this Track, sorted.
+        '''
+        if self._events is not None:
+            return MidiTrack.getProgramChanges(self)
+        post = []
+        data1 = self.data1
+        for i, x in enumerate(self.statuses):
+            if x & 0xF0 == 0xC0 and data1[i] not in post:
+                post.append(data1[i])
+        return post
 
 
 class MidiFile(object):
@@ -1126,34 +1429,40 @@ class MidiFile(object):
         '''
         self.file.close() 
     
-    def read(self): 
+    def read(self, columnar=False): 
         '''
         Read and parse MIDI data stored in a file.
+
+        If `columnar` is True, tracks are read as
+        :class:`~music21.midi.ColumnarMidiTrack` objects.
         '''
-        self.readstr(self.file.read()) 
+        self.readstr(self.file.read(), columnar=columnar) 
     
-    def readstr(self, midiStr): 
+    def readstr(self, midiStr, columnar=False): 
         '''
         Read and parse MIDI data as a string, putting the
         data in `.ticksPerQuarterNote` and a list of
         `MidiTrack` objects in the attribute `.tracks`. 
+
+        If `columnar` is True, the tracks are
+        :class:`~music21.midi.ColumnarMidiTrack` objects, which store
+        events in arrays and only create MidiEvent objects when needed.
         '''
         if not midiStr[:4] == "MThd":
             raise MidiException('badly formated midi string, got: %s' % midiStr[:20])
 
-        # we step through the str src, chopping off characters as we go
-        # and reassigning to str
-        length, midiStr = getNumber(midiStr[4:], 4) 
+        # we step through the str src, reading from an advancing position
+        length, position = _getNumberAt(midiStr, 4, 4)
         if not length == 6:
             raise MidiException('badly formated midi string')
 
-        midiFormatType, midiStr = getNumber(midiStr, 2) 
+        midiFormatType, position = _getNumberAt(midiStr, position, 2)
         self.format = midiFormatType
         if not midiFormatType in [0, 1]:
             raise MidiException('cannot handle midi file format: %s' % format)
 
-        numTracks, midiStr = getNumber(midiStr, 2) 
-        division, midiStr = getNumber(midiStr, 2) 
+        numTracks, position = _getNumberAt(midiStr, position, 2)
+        division, position = _getNumberAt(midiStr, position, 2)
 
         # very few midi files seem to define ticksPerSecond
         if division & 0x8000: 
@@ -1170,8 +1479,11 @@ class MidiFile(object):
         #environLocal.printDebug(['MidiFile.readstr(): got midi file format:', self.format, 'with specified number of tracks:', numTracks, 'ticksPerSecond:', self.ticksPerSecond, 'ticksPerQuarterNote:', self.ticksPerQuarterNote])
 
         for i in range(numTracks): 
-            trk = MidiTrack(i) # sets the MidiTrack index parameters
-            midiStr = trk.read(midiStr) # pass all the remaining string, reassing
+            if columnar:
+                trk = ColumnarMidiTrack(i)
+            else:
+                trk = MidiTrack(i) # sets the MidiTrack index parameters
+            position = trk._readAt(midiStr, position) # read from position, then advance
             self.tracks.append(trk) 
     
     def write(self): 
@@ -1517,6 +1829,65 @@ class Test(unittest.TestCase):
         #    print n, n.quarterLength
         #s.show()
 
+    def testReadRemainder(self):
+        directory = common.getPackageDir(relative=False, remapSep=os.sep)
+        for fp in directory:
+            if fp.endswith('midi'):
+                break
+        fp = os.path.join(fp, 'testPrimitive', 'test09.mid')
+        mf = MidiFile()
+        mf.open(fp)
+        mf.read()
+        mf.close()
+        self.assertEqual(len(mf.tracks), 3)
+
+        # reading a track returns the data after it, as before
+        trackStrs = [mt.write() for mt in mf.tracks]
+        mt = MidiTrack(0)
+        remainder = mt.read(''.join(trackStrs))
+        self.assertEqual(remainder, ''.join(trackStrs[1:]))
+        self.assertEqual(mt.write(), trackStrs[0])
+
+        # as does reading an event, here with running status
+        me = MidiEvent(mt)
+        me.lastStatusByte = chr(0x91)
+        remainder = me.read(0, intsToHexString([60, 0, 1, 2]))
+        self.assertEqual(remainder, intsToHexString([1, 2]))
+        self.assertEqual((me.type, me.channel, me.pitch, me.velocity),
+            ('NOTE_ON', 2, 60, 0))
+
+        dt = DeltaTime(mt)
+        self.assertEqual(dt.read('\x81\x00x'), (128, 'x'))
+
+    def testColumnarMidiTrack(self):
+        directory = common.getPackageDir(relative=False, remapSep=os.sep)
+        for fp in directory:
+            if fp.endswith('midi'):
+                break
+        # test09 uses running status; test03 has program changes
+        for fn in ['test09.mid', 'test03.mid']:
+            midiStr = open(os.path.join(fp, 'testPrimitive', fn), 'rb').read()
+            mf = MidiFile()
+            mf.readstr(midiStr)
+            mfColumnar = MidiFile()
+            mfColumnar.readstr(midiStr, columnar=True)
+            self.assertEqual(len(mf.tracks), len(mfColumnar.tracks))
+            for mt, mtColumnar in zip(mf.tracks, mfColumnar.tracks):
+                self.assertEqual(mtColumnar.isMaterialized, False)
+                self.assertEqual(mt.hasNotes(), mtColumnar.hasNotes())
+                self.assertEqual(mt.getProgramChanges(),
+                    mtColumnar.getProgramChanges())
+                self.assertEqual(len(mt.events), 2 * len(mtColumnar.statuses))
+                for i in range(len(mtColumnar.statuses)):
+                    self.assertEqual(repr(mtColumnar.getEvent(i)),
+                        repr(mt.events[2 * i + 1]))
+                self.assertEqual([repr(e) for e in mt.events],
+                    [repr(e) for e in mtColumnar.events])
+                self.assertEqual(mtColumnar.isMaterialized, True)
+                # once created, the events are used
+                self.assertTrue(mtColumnar.getEvent(0) is mtColumnar.events[1])
+            self.assertEqual(mf.writestr(), mfColumnar.writestr())
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = []
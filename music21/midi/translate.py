@@ -132,6 +132,7 @@ def midiToDuration(ticks, ticksPerQuarter=None, inputM21DurationObject=None):
     d._qtrLength = float(ticks) / ticksPerQuarter
     d._componentsNeedUpdating = True
     d._quarterLengthNeedsUpdating = False
+    d._informClient()
     return d
 
 
@@ -991,37 +992,44 @@ def tempoToMidiEvents(tempoIndication, includeDeltaTime=True):
 
 def _getPacket(trackId, offset, midiEvent, obj, lastInstrument=None):
     '''
-    Pack a dictionary of parameters for each event. 
+    Pack a tuple of parameters for each event. 
     Packets are used for sorting and configuring all note events. 
-    Includes offset, any cent shift, the midi event, and the source object.
+    A packet is a tuple of the offset, the sort order of the midi event, the
+    track id, the midi event, the source object, the duration, and the last
+    instrument.
 
     Offset and duration values stored here are MIDI ticks, not quarter lengths.
 
-    TODO: Test
+    >>> mt = midi.MidiTrack(1)
+    >>> n = note.Note(quarterLength=2)
+    >>> meOn = midi.MidiEvent(mt, type='NOTE_ON')
+    >>> midi.translate._getPacket(1, 0, meOn, n)
+    (0, 0, 1, <MidiEvent NOTE_ON, t=None, track=1, channel=None>, <music21.note.Note C>, 2048, None)
+    >>> meOff = midi.MidiEvent(mt, type='NOTE_OFF')
+    >>> midi.translate._getPacket(1, 2048, meOff, n)
+    (2048, -20, 1, <MidiEvent NOTE_OFF, t=None, track=1, channel=None>, <music21.note.Note C>, 0, None)
     '''
-    post = {}
-    post['trackId'] = trackId
-    post['offset'] = offset # offset values are in midi ticks
-
     # update sort order here, as type may have been set after creation
     midiEvent.updateSortOrder()
-    post['midiEvent'] = midiEvent
-    post['obj'] = obj # keep a reference to the source object
-    post['centShift'] = midiEvent.centShift
-    # allocate channel later
-    #post['channel'] = None
     if midiEvent.type != 'NOTE_OFF' and obj is not None:
         # store duration so as to calculate when the 
         # channel/pitch bend can be freed
-        post['duration'] = durationToMidi(obj.duration)
+        duration = durationToMidi(obj.duration)
     # note offs will have the same object ref, and seem like the have a 
     # duration when they do not
     else: 
-        post['duration'] = 0
-
+        duration = 0
     # store last m21 instrument object, as needed to reset program changes
-    post['lastInstrument'] = lastInstrument
-    return post
+    return (offset, midiEvent.sortOrder, trackId, midiEvent, obj, duration,
+            lastInstrument)
+
+def _packetSortKey(packet):
+    '''
+    Return the key by which packets are sorted: the offset, then the
+    sort order of the MIDI event. As sorting is stable, packets with
+    equal keys keep their order.
+    '''
+    return packet[:2]
 
 def _streamToPackets(s, trackId=1):
     '''
@@ -1074,32 +1082,25 @@ def _streamToPackets(s, trackId=1):
         # for each event, we create a packet representation
         # all events: delta/note-on/delta/note-off
         # strip delta times
-        packets = []
-        for i in range(len(sub)):
+        offset = offsetToMidi(obj.getOffsetBySite(s))
+        for midiEvent in sub:
             # store offset, midi event, object
             # add channel and pitch change also
-            midiEvent = sub[i]
             if midiEvent.type != 'NOTE_OFF':
                 # use offset
-                p = _getPacket(trackId, 
-                            offsetToMidi(obj.getOffsetBySite(s)), 
+                p = _getPacket(trackId, offset, 
                             midiEvent, obj=obj, lastInstrument=lastInstrument)
-                packets.append(p)
             # if its a note_off, use the duration to shift offset
             # midi events have already been created; 
             else: 
                 p = _getPacket(trackId, 
-                    offsetToMidi(obj.getOffsetBySite(s)) + durationToMidi(obj.duration), 
+                    offset + durationToMidi(obj.duration), 
                     midiEvent, obj=obj, lastInstrument=lastInstrument)
-                packets.append(p)
-        packetsByOffset += packets
+            packetsByOffset.append(p)
 
     # sorting is useful here, as we need these to be in order to assign last
     # instrument
-    packetsByOffset.sort(
-        cmp=lambda x,y: cmp(x['offset'], y['offset']) or
-                        cmp(x['midiEvent'].sortOrder, y['midiEvent'].sortOrder)
-        )
+    packetsByOffset.sort(key=_packetSortKey)
     # return packets and stream, as this flat stream should be retained
     return packetsByOffset
 
@@ -1123,7 +1124,8 @@ def _processPackets(packets, channelForInstrument=None, channelsDynamic=None,
     `packets` is a list of packets.
     `channelForInstrument` should be a dictionary.
     `channelsDynamic` should be a list.
-    `initChannelForTrack` should be a dictionary.
+    `initChannelForTrack` should be a dictionary of the first channel 
+    of each track, by track id; it is used for all packets of the track.
     '''
     from music21 import midi as midiModule
 
@@ -1136,58 +1138,65 @@ def _processPackets(packets, channelForInstrument=None, channelsDynamic=None,
     
     #allChannels = range(1, 10) + range(11, 17) # all but 10
     uniqueChannelEvents = {} # dict of (start, stop, usedChannel) : channel
+    # keys of uniqueChannelEvents that have a cent shift
+    bentChannelEvents = set()
     post = []
     usedTracks = []
 
     for p in packets:
-        #environLocal.printDebug(['_processPackets', p['midiEvent'].track, p['trackId']])
+        o, unused_sortOrder, trackId, midiEvent, unused_obj, duration, \
+            lastInstrument = p
         # must use trackId, as .track on MidiEvent is not yet set
-        if p['trackId'] not in usedTracks:
-            usedTracks.append(p['trackId'])
+        if trackId not in usedTracks:
+            usedTracks.append(trackId)
 
         # only need note_ons, as stored correspondingEvent attr can be used
         # to get noteOff
-        if p['midiEvent'].type not in ['NOTE_ON']:
+        if midiEvent.type != 'NOTE_ON':
             # set all not note-off messages to init channel
-            if p['midiEvent'].type not in ['NOTE_OFF']:
-                p['midiEvent'].channel = p['initChannel']
+            if midiEvent.type != 'NOTE_OFF':
+                midiEvent.channel = initChannelForTrack[trackId]
             post.append(p) # add the non note_on packet first
             # if this is a note off, and has a cent shift, need to 
             # rest the pitch bend back to 0 cents
-            if p['midiEvent'].type in ['NOTE_OFF']:
-                #environLocal.printDebug(['got note-off', p['midiEvent']])
+            if midiEvent.type == 'NOTE_OFF':
+                #environLocal.printDebug(['got note-off', midiEvent])
                 # cent shift is set for note on and note off
-                if p['centShift'] is not None:
+                if midiEvent.centShift is not None:
                     # do not set channel, as already set
-                    me = midiModule.MidiEvent(p['midiEvent'].track, 
-                        type="PITCH_BEND", channel=p['midiEvent'].channel)
+                    me = midiModule.MidiEvent(midiEvent.track, 
+                        type="PITCH_BEND", channel=midiEvent.channel)
                     # note off stores note on's pitch; do not invert, simply
                     # set to zero
                     me.setPitchBend(0) 
-                    pBendEnd = _getPacket(trackId=p['trackId'], 
-                        offset=p['offset'], midiEvent=me, 
+                    pBendEnd = _getPacket(trackId=trackId, 
+                        offset=o, midiEvent=me, 
                         obj=None, lastInstrument=None)
                     post.append(pBendEnd)
                     #environLocal.printDebug(['adding pitch bend', pBendEnd])
             continue # store and continue
 
         # set default channel for all packets
-        p['midiEvent'].channel = p['initChannel']
+        midiEvent.channel = initChannelForTrack[trackId]
 
         # find a free channel       
         # if necessary, add pitch change at start of Note, 
         # cancel pitch change at end
-        o = p['offset']
-        oEnd = p['offset']+p['duration']
+        oEnd = o + duration
 
         channelExclude = [] # channels that cannot be used
-        centShift = p['centShift'] # may be None
+        centShift = midiEvent.centShift # may be None
 
         #environLocal.printDebug(['\n\noffset', o, 'oEnd', oEnd, 'centShift', centShift])
 
         # iterate through all past events/channels, and find all
-        # that are active and have a pitch bend
-        for key in uniqueChannelEvents:
+        # that are active and have a pitch bend; if this event has a
+        # shift, all that are active must be found
+        if centShift is None:
+            pastChannelEvents = bentChannelEvents
+        else:
+            pastChannelEvents = uniqueChannelEvents
+        for key in pastChannelEvents:
             start, stop, usedChannel = key
             # if offset (start time) is in this range of a found event
             # or if any start or stop is within this span
@@ -1223,37 +1232,37 @@ def _processPackets(packets, channelForInstrument=None, channelsDynamic=None,
                     break
             if ch is None:
                 raise TranslateException('no unused channels available for microtone/instrument assignment')
-            p['midiEvent'].channel = ch
+            midiEvent.channel = ch
             # change channel of note off; this is used above to turn off pbend
-            p['midiEvent'].correspondingEvent.channel = ch
+            midiEvent.correspondingEvent.channel = ch
             #environLocal.printDebug(['set channel of correspondingEvent:', 
-                                #p['midiEvent'].correspondingEvent])
+                                #midiEvent.correspondingEvent])
 
             # TODO: must add program change, as we are now in a new 
             # channel; regardless of if we have a pitch bend (we may
             # move channels for a different reason  
-            if p['lastInstrument'] is not None:
-                meList = instrumentToMidiEvents(inputM21=p['lastInstrument'], 
+            if lastInstrument is not None:
+                meList = instrumentToMidiEvents(inputM21=lastInstrument, 
                     includeDeltaTime=False, 
-                    midiTrack=p['midiEvent'].track, channel=ch)
-                pgmChangePacket = _getPacket(trackId=p['trackId'], 
+                    midiTrack=midiEvent.track, channel=ch)
+                pgmChangePacket = _getPacket(trackId=trackId, 
                     offset=o, midiEvent=meList[0], # keep offset here
                     obj=None, lastInstrument=None)
                 post.append(pgmChangePacket)
 
         else: # use the existing channel
-            ch = p['midiEvent'].channel
+            ch = midiEvent.channel
             # always set corresponding event to the same channel
-            p['midiEvent'].correspondingEvent.channel = ch
+            midiEvent.correspondingEvent.channel = ch
 
-        #environLocal.printDebug(['assigning channel', ch, 'channelsDynamic', channelsDynamic, "p['initChannel']", p['initChannel']])
+        #environLocal.printDebug(['assigning channel', ch, 'channelsDynamic', channelsDynamic, 'initChannel', initChannelForTrack[trackId]])
 
         if centShift is not None:
             # add pitch bend
-            me = midiModule.MidiEvent(p['midiEvent'].track, 
+            me = midiModule.MidiEvent(midiEvent.track, 
                                     type="PITCH_BEND", channel=ch)
             me.setPitchBend(centShift)
-            pBendStart = _getPacket(trackId=p['trackId'], 
+            pBendStart = _getPacket(trackId=trackId, 
                 offset=o, midiEvent=me, # keep offset here
                 obj=None, lastInstrument=None)
             post.append(pBendStart)
@@ -1261,7 +1270,7 @@ def _processPackets(packets, channelForInstrument=None, channelsDynamic=None,
             # removal of pitch bend will happen above with note off
 
         # key includes channel, so that durations can span once in each channel
-        key = (p['offset'], p['offset']+p['duration'], ch)
+        key = (o, oEnd, ch)
         if key not in uniqueChannelEvents:
             # need to count multiple instances of events on the same
             # span and in the same channel (fine if all have the same pitchbend
@@ -1269,6 +1278,7 @@ def _processPackets(packets, channelForInstrument=None, channelsDynamic=None,
         # always add the cent shift if it is not None
         if centShift is not None:
             uniqueChannelEvents[key].append(centShift)
+            bentChannelEvents.add(key)
         post.append(p) # add packet/ done after ch change or bend addition
         #environLocal.printDebug(['uniqueChannelEvents', uniqueChannelEvents])
 
@@ -1300,10 +1310,7 @@ def _processPackets(packets, channelForInstrument=None, channelsDynamic=None,
         post.append(pBendEnd)
         #environLocal.printDebug(['adding pitch bend for found channels', me])
     # this sort is necessary
-    post.sort(
-        cmp=lambda x,y: cmp(x['offset'], y['offset']) or
-                        cmp(x['midiEvent'].sortOrder, y['midiEvent'].sortOrder)
-        )
+    post.sort(key=_packetSortKey)
 
     # TODO: for each track, add an additional silent event to make sure
     # entire duration gets played
@@ -1338,18 +1345,18 @@ def _packetsToEvents(midiTrack, packetsSrc, trackIdFilter=None):
     packets = []
     if trackIdFilter is not None:
         for p in packetsSrc:
-            if p['trackId'] == trackIdFilter:
+            if p[2] == trackIdFilter: # the track id
                 packets.append(p)
     else:
         packets = packetsSrc
 
     events = []
     lastOffset = 0
-    for p in packets:
-        me = p['midiEvent']
+    for offset, unused_sortOrder, unused_trackId, me, unused_obj, \
+            unused_duration, unused_lastInstrument in packets:
         if me.time is None:
             me.time = 0
-        t = p['offset'] - lastOffset
+        t = offset - lastOffset
         if t < 0:
             raise TranslateException('got a negative delta time')
         # set the channel from the midi event
@@ -1357,7 +1364,7 @@ def _packetsToEvents(midiTrack, packetsSrc, trackIdFilter=None):
         #environLocal.printDebug(['packetsByOffset', p])
         events.append(dt)
         events.append(me)
-        lastOffset = p['offset']
+        lastOffset = offset
     #environLocal.printDebug(['_packetsToEvents', 'total events:', len(events)])
     return events
 
@@ -1388,6 +1395,65 @@ def packetsToMidiTrack(packets, trackId=1, channels=None):
     return mt
 
 
+def _midiColumnsToNotesAndMetaEvents(mt):
+    '''
+    Given a :class:`~music21.midi.ColumnarMidiTrack`, return a list of
+    paired note-on and note-off events and a list of (time, music21 object)
+    pairs for meta events, as found by :func:`~music21.midi.translate.midiTrackToStream`
+    from the `.events` of a MidiTrack. The columns are read directly; MidiEvent
+    objects are only created for note-on and meta events.
+
+    >>> mt = midi.ColumnarMidiTrack(1)
+    >>> mt.readColumns(midi.intsToHexString([0, 144, 60, 100, 0, 64, 90,
+    ...     0, 255, 81, 3, 7, 161, 32, 136, 0, 144, 60, 0, 0, 128, 64, 0]))
+    >>> notes, metaEvents = midi.translate._midiColumnsToNotesAndMetaEvents(mt)
+    >>> for on, off in notes:
+    ...     print on, off
+    [0, <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=60, velocity=100>] [1024, None]
+    [0, <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=64, velocity=90>] [1024, None]
+    >>> metaEvents
+    [[0, <music21.tempo.MetronomeMark animato Quarter=120.0>]]
+    '''
+    from music21 import midi as midiModule
+    timeSignatureType = midiModule.metaEvents.TIME_SIGNATURE
+    keySignatureType = midiModule.metaEvents.KEY_SIGNATURE
+    tempoType = midiModule.metaEvents.SET_TEMPO
+
+    ticks = mt.ticks
+    data1 = mt.data1
+    data2 = mt.data2
+    pending = {} # (channel, pitch) of an unmatched note-on: its index
+    pairs = []
+    metaEvents = []
+    for i, x in enumerate(mt.statuses):
+        y = x & 0xF0
+        if y == 0x90 or y == 0x80:
+            key = (x & 0x0F, data1[i])
+            if key in pending:
+                # as in MidiEvent.matchedNoteOff(), the next note event
+                # with the same pitch and channel ends the note
+                pairs.append((pending.pop(key), i))
+            elif y == 0x90 and data2[i] != 0:
+                pending[key] = i
+        elif y == 0xC0:
+            metaEvents.append([ticks[i], midiEventsToInstrument(mt.getEvent(i))])
+        elif x == 0xFF:
+            if data1[i] == timeSignatureType:
+                metaEvents.append([ticks[i],
+                    midiEventsToTimeSignature(mt.getEvent(i))])
+            elif data1[i] == keySignatureType:
+                metaEvents.append([ticks[i],
+                    midiEventsToKeySignature(mt.getEvent(i))])
+            elif data1[i] == tempoType:
+                metaEvents.append([ticks[i], midiEventsToTempo(mt.getEvent(i))])
+    # order notes by their note-on events; note-off events are not
+    # needed to create notes or chords
+    pairs.sort()
+    notes = [[[ticks[iOn], mt.getEvent(iOn)], [ticks[iOff], None]]
+             for iOn, iOff in pairs]
+    return notes, metaEvents
+
+
 def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
     inputM21=None):
     '''
@@ -1422,97 +1488,99 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
     from music21 import chord
     from music21 import note
 
-    # get an abs start time for each event, discard deltas
-    events = []
-    t = 0
-
-    # pair deltas with events, convert abs time
-    # get even numbers
-    # in some cases, the first event may not be a delta time, but
-    # a SEQUENCE_TRACK_NAME or something else. thus, need to get
-    # first delta time
-    i = 0
-    while i < len(mt.events):
-        # in pairs, first should be delta time, second should be event
-        #environLocal.printDebug(['midiTrackToStream(): index', 'i', i, mt.events[i]])
-        #environLocal.printDebug(['midiTrackToStream(): index', 'i+1', i+1, mt.events[i+1]])
-
-        # need to find pairs of delta time and events
-        # in some cases, there are delta times that are out of order, or
-        # packed in the beginning
-        if mt.events[i].isDeltaTime() and not mt.events[i+1].isDeltaTime():
-            td = mt.events[i]
-            e = mt.events[i+1]
-            t += td.time # increment time
-            events.append([t, e])
-            i += 2
-            continue
-        elif (not mt.events[i].isDeltaTime() and not 
-            mt.events[i+1].isDeltaTime()):
-            #environLocal.printDebug(['midiTrackToStream(): got two non delta times in a row'])
-            i += 1
-            continue
-        elif mt.events[i].isDeltaTime() and mt.events[i+1].isDeltaTime():
-            #environLocal.printDebug(['midiTrackToStream(): got two delta times in a row'])
-            i += 1
-            continue
-        else:
-            # cannot pair delta time to the next event; skip by 1
-            #environLocal.printDebug(['cannot pair to delta time', mt.events[i]])
-            i += 1
-            continue
-    #environLocal.printDebug(['raw event pairs', events])
-    # need to pair note-on with note-off
-    notes = [] # store pairs of pairs
-    metaEvents = [] # store pairs of abs time, m21 object
-    memo = [] # store already matched note off
-    for i in range(len(events)):
-        #environLocal.printDebug(['midiTrackToStream(): paired events', events[i][0], events[i][1]])
-        if i in memo:
-            continue
-        t, e = events[i]
-        # for each note on event, we need to search for a match in all future
-        # events
-        if e.isNoteOn():
-            match = None
-            #environLocal.printDebug(['midiTrackToStream(): isNoteOn', e])
-            for j in range(i+1, len(events)):
-                if j in memo: 
-                    continue
-                tSub, eSub = events[j]
-                if e.matchedNoteOff(eSub):
-                    memo.append(j)
-                    match = i, j
-                    break
-            if match is not None:
-                i, j = match
-                notes.append([events[i], events[j]])
+    from music21 import midi as midiModule
+    if isinstance(mt, midiModule.ColumnarMidiTrack) and not mt.isMaterialized:
+        notes, metaEvents = _midiColumnsToNotesAndMetaEvents(mt)
+    else:
+        # get an abs start time for each event, discard deltas
+        events = []
+        t = 0
+
+        # pair deltas with events, convert abs time
+        # get even numbers
+        # in some cases, the first event may not be a delta time, but
+        # a SEQUENCE_TRACK_NAME or something else. thus, need to get
+        # first delta time
+        i = 0
+        while i < len(mt.events):
+            # in pairs, first should be delta time, second should be event
+            #environLocal.printDebug(['midiTrackToStream(): index', 'i', i, mt.events[i]])
+            #environLocal.printDebug(['midiTrackToStream(): index', 'i+1', i+1, mt.events[i+1]])
+
+            # need to find pairs of delta time and events
+            # in some cases, there are delta times that are out of order, or
+            # packed in the beginning
+            if mt.events[i].isDeltaTime() and not mt.events[i+1].isDeltaTime():
+                td = mt.events[i]
+                e = mt.events[i+1]
+                t += td.time # increment time
+                events.append([t, e])
+                i += 2
+                continue
+            elif (not mt.events[i].isDeltaTime() and not 
+                mt.events[i+1].isDeltaTime()):
+                #environLocal.printDebug(['midiTrackToStream(): got two non delta times in a row'])
+                i += 1
+                continue
+            elif mt.events[i].isDeltaTime() and mt.events[i+1].isDeltaTime():
+                #environLocal.printDebug(['midiTrackToStream(): got two delta times in a row'])
+                i += 1
+                continue
             else:
-                pass
-                #environLocal.printDebug(['midiTrackToStream(): cannot find a note off for a note on', e])
-        else:
-            if e.type == 'TIME_SIGNATURE':
-                # time signature should be 4 bytes
-                metaEvents.append([t, midiEventsToTimeSignature(e)])
-            elif e.type == 'KEY_SIGNATURE':
-                metaEvents.append([t, midiEventsToKeySignature(e)])
-            elif e.type == 'SET_TEMPO':
-                metaEvents.append([t, midiEventsToTempo(e)])
-            elif e.type == 'INSTRUMENT_NAME':
-                # TODO import instrument object
-                pass
-            elif e.type == 'PROGRAM_CHANGE':
-                metaEvents.append([t, midiEventsToInstrument(e)])
-            elif e.type == 'MIDI_PORT':
-                pass
+                # cannot pair delta time to the next event; skip by 1
+                #environLocal.printDebug(['cannot pair to delta time', mt.events[i]])
+                i += 1
+                continue
+        #environLocal.printDebug(['raw event pairs', events])
+        # need to pair note-on with note-off
+        notes = [] # store pairs of pairs
+        metaEvents = [] # store pairs of abs time, m21 object
+        memo = [] # store already matched note off
+        for i in range(len(events)):
+            #environLocal.printDebug(['midiTrackToStream(): paired events', events[i][0], events[i][1]])
+            if i in memo:
+                continue
+            t, e = events[i]
+            # for each note on event, we need to search for a match in all future
+            # events
+            if e.isNoteOn():
+                match = None
+                #environLocal.printDebug(['midiTrackToStream(): isNoteOn', e])
+                for j in range(i+1, len(events)):
+                    if j in memo: 
+                        continue
+                    tSub, eSub = events[j]
+                    if e.matchedNoteOff(eSub):
+                        memo.append(j)
+                        match = i, j
+                        break
+                if match is not None:
+                    i, j = match
+                    notes.append([events[i], events[j]])
+                else:
+                    pass
+                    #environLocal.printDebug(['midiTrackToStream(): cannot find a note off for a note on', e])
             else:
-                pass
-                #environLocal.printDebug(['unhandled event:', e.type, e.data])
+                if e.type == 'TIME_SIGNATURE':
+                    # time signature should be 4 bytes
+                    metaEvents.append([t, midiEventsToTimeSignature(e)])
+                elif e.type == 'KEY_SIGNATURE':
+                    metaEvents.append([t, midiEventsToKeySignature(e)])
+                elif e.type == 'SET_TEMPO':
+                    metaEvents.append([t, midiEventsToTempo(e)])
+                elif e.type == 'INSTRUMENT_NAME':
+                    # TODO import instrument object
+                    pass
+                elif e.type == 'PROGRAM_CHANGE':
+                    metaEvents.append([t, midiEventsToInstrument(e)])
+                elif e.type == 'MIDI_PORT':
+                    pass
+                else:
+                    pass
+                    #environLocal.printDebug(['unhandled event:', e.type, e.data])
 
     # first create meta events
-    for t, obj in metaEvents:
-        #environLocal.printDebug(['insert midi meta event:', t, obj])
-        s.insert(t / float(ticksPerQuarter), obj)
+    s.insertMany([(t / float(ticksPerQuarter), obj) for t, obj in metaEvents])
 
     #environLocal.printDebug(['midiTrackToStream(): found notes ready for Stream import', len(notes)])
 
@@ -1522,6 +1590,8 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
     chordSub = None
     i = 0
     iGathered = [] # store a lost of indexes of gathered values put into chords
+    # (offset, element) pairs, inserted at once when all have been created
+    noteEntries = []
     voicesRequired = False
     if len(notes) > 1:
         #environLocal.printDebug(['\nmidiTrackToStream(): notes', notes])
@@ -1577,7 +1647,7 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
                 o = notes[i][0][0] / float(ticksPerQuarter)
                 c.midiTickStart = notes[i][0][0]
                 
-                s._insertCore(o, c)
+                noteEntries.append((o, c))
                 #iSkip = len(chordSub) # amount of accumulated chords
                 chordSub = None
             else: # just append the note, chordSub is None
@@ -1590,7 +1660,7 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
                 o = notes[i][0][0] / float(ticksPerQuarter)
                 n.midiTickStart = notes[i][0][0]
 
-                s._insertCore(o, n)
+                noteEntries.append((o, n))
                 #iSkip = 1
             #break # exit secondary loop
             i += 1
@@ -1601,9 +1671,9 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
         # need to round, as floating point error is likely
         o = notes[0][0][0] / float(ticksPerQuarter)
         n.midiTickStart = notes[i][0][0]
-        s._insertCore(o, n)
+        noteEntries.append((o, n))
                     
-    s._elementsChanged()
+    s._insertManyCore(noteEntries)
     # quantize to nearest 16th
     if quantizePost:    
         s.quantize([8, 3], processOffsets=True, processDurations=True, inPlace=True)
@@ -1750,12 +1820,12 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList = None):
 
     #environLocal.printDebug(['channelForInstrument', channelForInstrument, 'channelsDynamic', channelsDynamic, 'allChannels', allChannels, 'allUniqueInstruments', allUniqueInstruments])
 
+    # the first channel of each track, used for all of its packets
     initChannelForTrack = {}
-    # update packets with first channel
     for key, bundle in packetStorage.items():
         initChannelForTrack[key] = None # key is channel id
         bundle['initChannel'] = None # set for bundle too
-        for p in bundle['rawPackets']:
+        if len(bundle['rawPackets']) > 0:
             # get instrument
             instObj = bundle['initInstrument']
             if instObj is None:
@@ -1765,11 +1835,8 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList = None):
                     initCh = 0  # CUTHBERT ADD -- Not sure if this works...
             else: # use midi program
                 initCh = channelForInstrument[instObj.midiProgram]
-            p['initChannel'] = initCh
-            # only set for bundle once
-            if bundle['initChannel'] is None:
-                bundle['initChannel'] = initCh
-                initChannelForTrack[key] = initCh
+            bundle['initChannel'] = initCh
+            initChannelForTrack[key] = initCh
 
     # combine all packets for processing of channel allocation 
     netPackets = []
@@ -1785,6 +1852,11 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList = None):
     #environLocal.printDebug(['got netPackets:', len(netPackets), 'packetStorage keys (tracks)', packetStorage.keys()])
     # build each track, sorting out the appropriate packets based on track
     # ids
+    packetsByTrack = {}
+    for trackId in packetStorage:
+        packetsByTrack[trackId] = []
+    for p in netPackets:
+        packetsByTrack[p[2]].append(p) # the track id
     for trackId in packetStorage:   
         initChannel = packetStorage[trackId]['initChannel']
         instObj = packetStorage[trackId]['initInstrument']
@@ -1793,9 +1865,8 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList = None):
         # need to pass preferred channel here
         mt.events += _getStartEvents(mt, channel=initChannel, 
                                     instrumentObj=instObj) 
-        # note that netPackets is must be passed here, and then be filtered
-        # packets have been added to net packets
-        mt.events += _packetsToEvents(mt, netPackets, trackIdFilter=trackId)
+        # packets have been added to net packets, then sorted by track
+        mt.events += _packetsToEvents(mt, packetsByTrack[trackId])
         mt.events += getEndEvents(mt, channel=initChannel)
         mt.updateEvents()
     # need to filter out packets only for the desired tracks
@@ -1917,7 +1988,7 @@ def midiFilePathToStream(filePath, inputM21=None):
     from music21 import midi as midiModule
     mf = midiModule.MidiFile()
     mf.open(filePath)
-    mf.read()
+    mf.read(columnar=True)
     mf.close()
     return midiFileToStream(mf, inputM21)
 
@@ -1929,7 +2000,7 @@ def midiStringToStream(strData, inputM21):
     
     mf = midiModule.MidiFile()
     # do not need to call open or close on MidiFile instance
-    mf.readstr(strData)
+    mf.readstr(strData, columnar=True)
     return midiFileToStream(mf, inputM21)
 
 
@@ -2654,6 +2725,34 @@ class Test(unittest.TestCase):
         s = converter.parse(fp)
         #s.show('t')
         self.assertEqual(len(s.flat.getElementsByClass('Chord')), 4)
+
+    def testImportColumnarA(self):
+        import os
+        from music21 import midi as midiModule
+
+        directory = common.getPackageDir(relative=False, remapSep=os.sep)
+        for fp in directory:
+            if fp.endswith('midi'):
+                break
+        dirLib = os.path.join(fp, 'testPrimitive')
+        # chords, overlapping notes, and tempo and time signature changes
+        for fn in ['test05.mid', 'test07.mid', 'test11.mid']:
+            midiStr = open(os.path.join(dirLib, fn), 'rb').read()
+            mf = midiModule.MidiFile()
+            mf.readstr(midiStr)
+            s = midiFileToStream(mf)
+            mfColumnar = midiModule.MidiFile()
+            mfColumnar.readstr(midiStr, columnar=True)
+            sColumnar = midiFileToStream(mfColumnar)
+            # the columns are read without creating all events
+            for mt in mfColumnar.tracks:
+                self.assertEqual(mt.isMaterialized, False)
+
+            post = [(e.offset, repr(e), e.duration.quarterLength)
+                    for e in s.flat]
+            postColumnar = [(e.offset, repr(e), e.duration.quarterLength)
+                            for e in sColumnar.flat]
+            self.assertEqual(post, postColumnar)
         
 
 #-------------------------------------------------------------------------------
@@ -2507,67 +2507,88 @@ def mxToMeasure(mxMeasure, spannerBundle=None, inputM21=None, lastMeasureInfo=No
 # Streams
 
 
-def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
-    '''
-    Load a part into a new Stream or one provided by 
-    `inputM21` given an mxScore and a part name.
-
-    The `spannerBundle` reference, when passed in, 
-    is used to accumulate Spanners. These are not inserted here.
-
-    Though it is incorrect MusicXML, PDFtoMusic creates 
-    empty measures when it should create full
-    measures of rests (possibly hidden).  This routine 
-    fixes that bug.  See http://musescore.org/en/node/15129
-    '''
-    #environLocal.printDebug(['calling Stream.mxToStreamPart'])
-    if inputM21 == None:
-        # need a Score to load parts into
-        s = stream.Score()
-    else:
-        s = inputM21
-
-    if spannerBundle == None:
-        spannerBundle = spanner.SpannerBundle()
-
-    mxPart = mxScore.getPart(partId)
-    # in some cases there may be more than one instrument defined
-    # in each score part; this has not been tested
-    mxInstrument = mxScore.getScorePart(partId)
-
-    # create a new music21 instrument
-    instrumentObj = instrument.Instrument()
-    if mxInstrument is not None: # mxInstrument is a ScorePart
-        # need an mxScorePart here   
-        mxToInstrument(mxInstrument, instrumentObj)
-    # add part id as group
-    instrumentObj.groups.append(partId)
-
-    streamPart = stream.Part() # create a part instance for each part
-    # always assume at sounding, unless transposition is defined in attributes
-    streamPart.atSoundingPitch = True
-
-    # set part id to stream best name
-    if instrumentObj.bestName() is not None:
-        streamPart.id = instrumentObj.bestName()
-    streamPart._insertCore(0, instrumentObj) # add instrument at zero offset
-
-    staffReferenceList = []
-    # offset is in quarter note length
-    oMeasure = 0.0
-    lastTimeSignature = None
-    lastTransposition = None # may change at measure boundaries
-    lastMeasureWasShort = False  # keep track of whether the last measure was short...
-
-    lastMeasureNumber = 0
-    lastMeasureSuffix = None
-
-    for i, mxMeasure in enumerate(mxPart):
+class PartParser(object):
+    '''
+    Translates the mxMeasures of one MusicXML part, one at a time and in
+    order, into a music21 Part, which is inserted into the Score given as
+    `inputM21` (or a new Score) by :meth:`close`.
+
+    `mxScorePart` is the mxScorePart for the part, if any, and is used to
+    create the Instrument of the Part.
+
+    As with :func:`mxToStreamPart`, the `spannerBundle` is used to
+    accumulate Spanners.
+
+    Measures do not have to be stored in an mxPart before being
+    translated; this is used by
+    :class:`~music21.musicxml.xmlHandler.StreamingHandler` to translate each
+    mxMeasure as soon as it is read.
+
+    >>> from music21.musicxml import testPrimitive, xmlHandler
+    >>> d = xmlHandler.Document()
+    >>> d.read(testPrimitive.pitches01a)
+    >>> mxPart = d.score.getPart('P1')
+    >>> partParser = musicxml.fromMxObjects.PartParser('P1',
+    ...     d.score.getScorePart('P1'))
+    >>> for mxMeasure in mxPart:
+    ...     m = partParser.addMeasure(mxMeasure)
+    >>> m
+    <music21.stream.Measure 32 offset=100.0>
+    >>> p = partParser.close()
+    >>> len(p.getElementsByClass('Measure'))
+    26
+    >>> p.activeSite
+    <music21.stream.Score ...>
+    '''
+    def __init__(self, partId, mxScorePart=None, spannerBundle=None,
+        inputM21=None):
+        self.partId = partId
+        if inputM21 == None:
+            # need a Score to load parts into
+            self.score = stream.Score()
+        else:
+            self.score = inputM21
+        if spannerBundle == None:
+            spannerBundle = spanner.SpannerBundle()
+        self.spannerBundle = spannerBundle
+
+        # create a new music21 instrument
+        self.instrumentObj = instrument.Instrument()
+        if mxScorePart is not None:
+            mxToInstrument(mxScorePart, self.instrumentObj)
+        # add part id as group
+        self.instrumentObj.groups.append(partId)
+
+        self.streamPart = stream.Part() # create a part instance for each part
+        # always assume at sounding, unless transposition is defined in attributes
+        self.streamPart.atSoundingPitch = True
+        # set part id to stream best name
+        if self.instrumentObj.bestName() is not None:
+            self.streamPart.id = self.instrumentObj.bestName()
+        self.streamPart._insertCore(0, self.instrumentObj) # add instrument at zero offset
+
+        self.staffReferenceList = []
+        # the highest number of staves used in any measure
+        self.stavesCount = 1
+        # offset is in quarter note length
+        self.oMeasure = 0.0
+        self.measureCount = 0
+        self.lastTimeSignature = None
+        self.lastTransposition = None # may change at measure boundaries
+        self.lastMeasureWasShort = False  # keep track of whether the last measure was short...
+        self.lastMeasureNumber = 0
+        self.lastMeasureSuffix = None
+
+    def addMeasure(self, mxMeasure):
+        '''
+        Translate the next mxMeasure of the part, add it to the Part, and
+        return the new Measure.
+        '''
         # t here is transposition, if defined; otherwise it is None
         try:
             m, staffReference, t = mxToMeasure(mxMeasure,
-                                   spannerBundle=spannerBundle,
-                                   lastMeasureInfo=(lastMeasureNumber, lastMeasureSuffix))
+                                   spannerBundle=self.spannerBundle,
+                                   lastMeasureInfo=(self.lastMeasureNumber, self.lastMeasureSuffix))
         except Exception as e:
             import sys
             measureNumber = "unknown"
@@ -2578,42 +2599,51 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
             # see http://stackoverflow.com/questions/6062576/adding-information-to-a-python-exception
             message = "In measure (" + measureNumber + "): " + e.message
             raise type(e), type(e)(message), sys.exc_info()[2]
+
+        # as in mxPart.getStavesCount()
+        mxAttributes = mxMeasure.attributesObj
+        if mxAttributes is not None and mxAttributes.staves is not None:
+            self.stavesCount = max(self.stavesCount, int(mxAttributes.staves))
+
+        streamPart = self.streamPart
         if t is not None:
-            if lastTransposition is None and i == 0: # if this is the first
+            if self.lastTransposition is None and self.measureCount == 0: # if this is the first
                 #environLocal.printDebug(['transposition', t])
-                instrumentObj.transposition = t
+                self.instrumentObj.transposition = t
             else: # if not the first measure, need to copy as well
                 # for now, copy Instrument, change transposition, 
                 # could insert in part, or in measure
-                newInst = copy.deepcopy(instrumentObj)
+                newInst = copy.deepcopy(self.instrumentObj)
                 newInst.transposition = t
-                streamPart._insertCore(oMeasure, newInst)
+                streamPart._insertCore(self.oMeasure, newInst)
             # if a transposition is defined in musicxml, we assume it is
             # at written pitch
             streamPart.atSoundingPitch = False
             # store last for comparison
-            lastTransposition = t
+            self.lastTransposition = t
+        self.measureCount += 1
 
         # there will be one for each measure
-        staffReferenceList.append(staffReference)
+        self.staffReferenceList.append(staffReference)
 
-        if m.number != lastMeasureNumber:
+        if m.number != self.lastMeasureNumber:
             # we do this check so that we do not compound suffixes, i.e.:
             # 23, 23.X1, 23.X1X2, 23.X1X2X3
             # and instead just do:
             # 23, 23.X1, 23.X2, etc.
-            lastMeasureNumber = m.number
-            lastMeasureSuffix = m.numberSuffix
+            self.lastMeasureNumber = m.number
+            self.lastMeasureSuffix = m.numberSuffix
 
         if m.timeSignature is not None:
-            lastTimeSignature = m.timeSignature
-        elif lastTimeSignature is None and m.timeSignature is None:
+            self.lastTimeSignature = m.timeSignature
+        elif self.lastTimeSignature is None and m.timeSignature is None:
             # if no time sigature is defined, need to get a default
             ts = meter.TimeSignature()
             ts.load('%s/%s' % (defaults.meterNumerator,
                                defaults.meterDenominatorBeatType))
-            lastTimeSignature = ts
-        
+            self.lastTimeSignature = ts
+        lastTimeSignature = self.lastTimeSignature
+
         if m._fullMeasureRest is True:
             r1 = m.getElementsByClass('Rest')[0]
             if r1.duration.quarterLength == 4.0 and r1.duration.quarterLength != lastTimeSignature.barDuration.quarterLength:
@@ -2623,7 +2653,7 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
         del(m._fullMeasureRest)
         
         # add measure to stream at current offset for this measure
-        streamPart._insertCore(oMeasure, m)
+        streamPart._insertCore(self.oMeasure, m)
 
         # note: we cannot assume that the time signature properly
         # describes the offsets w/n this bar. need to look at 
@@ -2649,7 +2679,7 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
             # for the first measure, this may be a pickup
             # must detect this when writing, as next measures offsets will be 
             # incorrect
-            if oMeasure == 0.0:
+            if self.oMeasure == 0.0:
                 # cannot get bar duration proportion if cannot get a ts
                 if m.barDurationProportion() < 1.0:
                     m.padAsAnacrusis()
@@ -2661,57 +2691,87 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
             ### no...let's not do this...
             else:
                 mOffsetShift = mHighestTime #lastTimeSignatureQuarterLength
-                if lastMeasureWasShort is True:
+                if self.lastMeasureWasShort is True:
                     if m.barDurationProportion() < 1.0:
                         m.padAsAnacrusis() # probably a pickup after a repeat or phrase boundary or something
-                        lastMeasureWasShort = False
+                        self.lastMeasureWasShort = False
                 else:
                     if mHighestTime < lastTimeSignatureQuarterLength:
-                        lastMeasureWasShort = True
+                        self.lastMeasureWasShort = True
                     else:
-                        lastMeasureWasShort = False
+                        self.lastMeasureWasShort = False
                         
-        oMeasure += mOffsetShift
+        self.oMeasure += mOffsetShift
+        return m
 
-    # if we have multiple staves defined, add more parts, and transfer elements
-    # note: this presently has to look at _idLastDeepCopyOf to get matches
-    # to find removed elements after copying; this is probably not the
-    # best way to do this. 
+    def close(self):
+        '''
+        Called after the last measure has been added: insert the Part,
+        and any complete Spanners, into the Score, and return the Part.
 
-    # for this part, if any elements are components in the spannerBundle,
-    # then then we need to update the spannerBundle after the part is copied
+        If more than one staff is used, a PartStaff is inserted into the
+        Score for each staff instead of the Part.
+        '''
+        # if we have multiple staves defined, add more parts, and transfer elements
+        # note: this presently has to look at _idLastDeepCopyOf to get matches
+        # to find removed elements after copying; this is probably not the
+        # best way to do this. 
+
+        # for this part, if any elements are components in the spannerBundle,
+        # then then we need to update the spannerBundle after the part is copied
+        streamPart = self.streamPart
+        spannerBundle = self.spannerBundle
+        s = self.score
+        if self.stavesCount > 1:
+            separateOutPartStaffs(None, streamPart, spannerBundle, s,
+                self.staffReferenceList, self.partId)
+        else:
+            streamPart.addGroupForElements(self.partId) # set group for components 
+            streamPart.groups.append(self.partId) # set group for stream itself
+
+            # TODO: this does not work with voices; there, Spanners 
+            # will be copied into the Score 
+
+            # copy spanners that are complete into the part, as this is the 
+            # highest level container that needs them
+            rm = spannerBundle.getByCompleteStatus(True)
+            streamPart._insertManyCore([(0, sp) for sp in rm])
+            # remove from original spanner bundle
+            for sp in rm:
+                spannerBundle.remove(sp)
+            # s is the score; adding the aprt to the score
+            s._insertCore(0, streamPart)
+
+        s._elementsChanged()
+        # when adding parts to this Score
+        # this assumes all start at the same place
+        # even if there is only one part, it will be placed in a Stream
+        return streamPart
 
-    streamPartStaff = None
-    if mxPart.getStavesCount() > 1:
-        separateOutPartStaffs(mxPart, streamPart, spannerBundle, s, staffReferenceList, partId)
-    else:
-        streamPart.addGroupForElements(partId) # set group for components 
-        streamPart.groups.append(partId) # set group for stream itself
-
-        # TODO: this does not work with voices; there, Spanners 
-        # will be copied into the Score 
-
-        # copy spanners that are complete into the part, as this is the 
-        # highest level container that needs them
-        rm = []
-        for sp in spannerBundle.getByCompleteStatus(True):
-            streamPart._insertCore(0, sp)
-            rm.append(sp)
-        # remove from original spanner bundle
-        for sp in rm:
-            spannerBundle.remove(sp)
-        # s is the score; adding the aprt to the score
-        streamPart._elementsChanged()
-        s._insertCore(0, streamPart)
+def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
+    '''
+    Load a part into a new Stream or one provided by 
+    `inputM21` given an mxScore and a part name.
 
-    s._elementsChanged()
-    # when adding parts to this Score
-    # this assumes all start at the same place
-    # even if there is only one part, it will be placed in a Stream
-    if streamPartStaff is not None:
-        return streamPartStaff
-    else:
-        return streamPart
+    The `spannerBundle` reference, when passed in, 
+    is used to accumulate Spanners. These are not inserted here.
+
+    Though it is incorrect MusicXML, PDFtoMusic creates 
+    empty measures when it should create full
+    measures of rests (possibly hidden).  This routine 
+    fixes that bug.  See http://musescore.org/en/node/15129
+    '''
+    #environLocal.printDebug(['calling Stream.mxToStreamPart'])
+    mxPart = mxScore.getPart(partId)
+    # in some cases there may be more than one instrument defined
+    # in each score part; this has not been tested
+    mxInstrument = mxScore.getScorePart(partId)
+
+    partParser = PartParser(partId, mxInstrument, spannerBundle=spannerBundle,
+        inputM21=inputM21)
+    for mxMeasure in mxPart:
+        partParser.addMeasure(mxMeasure)
+    return partParser.close()
 
 def separateOutPartStaffs(mxPart, streamPart, spannerBundle, s, staffReferenceList, partId):
     '''
@@ -2845,6 +2905,17 @@ def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None):
         m21PartIdDictionary[partId] = part
         #print("%r %s %r" % (m21PartIdDictionary, partId, part))
 
+    mxScoreToScoreObjects(mxScore, s, spannerBundle, m21PartIdDictionary)
+    return s
+
+
+def mxScoreToScoreObjects(mxScore, s, spannerBundle, m21PartIdDictionary):
+    '''
+    After all parts of an mxScore have been added to the Score `s`, insert
+    the objects that belong to the Score as a whole: StaffGroups, Metadata,
+    ScoreLayout, TextBoxes from credits, and all complete Spanners left in
+    `spannerBundle`. `m21PartIdDictionary` maps part ids to music21 Parts.
+    '''
     # get part/staff groups
     #environLocal.printDebug(['partgroups:', mxScore.getPartGroupData()])
     partGroupData = mxScore.getPartGroupData()
@@ -2904,7 +2975,6 @@ def mxScoreToScore(mxScore, spannerBundle=None, inputM21=None):
         spannerBundle.remove(sp)
 
     s._elementsChanged()
-    return s
 
 #------------------------------------------------------------------------------
 # beam and beams
@@ -39,19 +39,21 @@ from music21 import note
 from music21 import stream
 from music21.musicxml import toMxObjects
 
-def fromMusic21Object(m21Object):
+def fromMusic21Object(m21Object, copyOnWrite=False):
     '''
     Translate an arbitrary music21 object to a musicxml
     string and return it
     
     This function is called by music21.base.write()
     and is the most important function here.
+
+    `copyOnWrite` is passed to fromStream for Streams.
     '''
     classes = m21Object.classes
     if 'Measure' in classes: # must go before Stream
         return fromMeasure(m21Object)
     elif 'Stream' in classes:
-        return fromStream(m21Object)
+        return fromStream(m21Object, copyOnWrite=copyOnWrite)
     elif 'GeneralNote' in classes:
         return fromGeneralNote(m21Object)
     elif 'Pitch' in classes:
@@ -69,18 +71,84 @@ def fromMusic21Object(m21Object):
     else:
         raise M21ToStringException("Cannot translate the object %s to a complete musicXML document; put it in a Stream first!" % m21Object)
 
-def fromStream(streamObject):
+def writeMusic21Object(m21Object, fileLike, copyOnWrite=False):
     '''
-    return a complete musicxml string
-    from a music21 Stream object
+    Translate an arbitrary music21 object to musicxml
+    and write it to `fileLike` (a file opened for writing,
+    or anything else with a `write` method).
+
+    Streams are written with :func:`~music21.musicxml.m21ToString.writeStream`,
+    without making the whole string first; this is what
+    music21.base.write() uses.
+
+    >>> import io
+    >>> s = converter.parse('tinyNotation: 3/4 C4 D E r2.').makeMeasures()
+    >>> f = io.BytesIO()
+    >>> musicxml.m21ToString.writeMusic21Object(s, f)
+    >>> musicxmlStr = musicxml.m21ToString.fromMusic21Object(s)
+
+    The two are the same, but for the ids of the parts, which are made
+    anew for each copy of the Stream:
+
+    >>> import re
+    >>> partId = re.compile('id="[^"]*"')
+    >>> partId.sub('', f.getvalue()) == partId.sub('', musicxmlStr)
+    True
+
+    `copyOnWrite` is passed to writeStream for Streams.
+    '''
+    classes = m21Object.classes
+    if 'Stream' in classes and 'Measure' not in classes:
+        writeStream(m21Object, fileLike, copyOnWrite=copyOnWrite)
+    else:
+        fileLike.write(fromMusic21Object(m21Object))
+
+def _streamToMxScore(streamObject, copyOnWrite=False):
     '''
+    return an mxScore from a copy of a music21 Stream object,
+    or, if `copyOnWrite` is True, from the Stream itself if
+    it needs no notation to be added
+    '''
+    if copyOnWrite:
+        return toMxObjects.streamToMx(streamObject, inPlace=False)
     # always make a deepcopy before processing musicxml
     # this should only be done once
     post = copy.deepcopy(streamObject)
     post.makeImmutable()
     mxScore = toMxObjects.streamToMx(post)
     del post
-    return mxScore.xmlStr()
+    return mxScore
+
+def fromStream(streamObject, copyOnWrite=False):
+    '''
+    return a complete musicxml string
+    from a music21 Stream object
+
+    The Stream is not changed. Normally the whole Stream is copied
+    first, since translating it can add measures, rests, accidentals,
+    beams, and so on. If `copyOnWrite` is True, it is only copied if
+    any of these are needed (see
+    :func:`~music21.musicxml.toMxObjects.streamNeedsNotation`), so that a
+    fully notated Stream, such as one parsed from a file, is translated
+    without copying it.
+
+    >>> s = corpus.parse('bach/bwv66.6')
+    >>> musicxml.toMxObjects.streamNeedsNotation(s)
+    False
+    >>> musicxmlStr = musicxml.m21ToString.fromStream(s, copyOnWrite=True)
+    >>> musicxmlStr == musicxml.m21ToString.fromStream(s)
+    True
+    '''
+    return _streamToMxScore(streamObject, copyOnWrite).xmlStr()
+
+def writeStream(streamObject, fileLike, copyOnWrite=False):
+    '''
+    write complete musicxml for a music21 Stream object to `fileLike`,
+    part by part and measure by measure, as it is made:
+    the output is the same as that of fromStream, but the whole
+    string is never in memory.
+    '''
+    _streamToMxScore(streamObject, copyOnWrite).xmlWrite(fileLike)
 
 def fromMeasure(m):
     '''Translate a music21 Measure into a 
@@ -305,6 +373,67 @@ class Test(unittest.TestCase):
         unused_raw = fromMusic21Object(s)
         # TODO- Test voices out...
 
+    def testXmlWriteMatchesToxml(self):
+        import io
+        from music21 import converter
+        from music21.musicxml import testPrimitive
+
+        for data in (testPrimitive.pitches01a, testPrimitive.lyricsMelisma61d,
+                testPrimitive.multipleAttributesPerMeasures,
+                testPrimitive.spanners33a, testPrimitive.textExpressions):
+            s = converter.parse(data)
+            mxScore = toMxObjects.streamToMx(s)
+            f = io.BytesIO()
+            mxScore.xmlWrite(f)
+            self.assertEqual(f.getvalue(), mxScore.toxml(None, None, True))
+
+    def testCopyOnWriteLeavesStreamUnchanged(self):
+        import re
+        from music21 import converter
+        from music21 import corpus
+        from music21.musicxml import testPrimitive
+
+        def elements(s):
+            for e in s:
+                yield e
+                if 'Stream' in e.classes:
+                    for subElement in elements(e):
+                        yield subElement
+
+        def fingerprint(s):
+            post = []
+            for e in elements(s):
+                post.append((e.classes[0], e.offset, e.duration.quarterLength,
+                             getattr(e, 'color', None),
+                             getattr(e, 'idLocal', None)))
+                if 'Stream' in e.classes:
+                    post.append(len(e))
+                if 'Note' in e.classes:
+                    post.append((e.nameWithOctave, repr(e.beams), repr(e.tie),
+                                 repr(e.pitch.accidental) if e.pitch.accidental
+                                 is None else e.pitch.accidental.displayStatus))
+                if 'Instrument' in e.classes:
+                    post.append((e.partId, e.midiChannel))
+            for sp in s.spannerBundle:
+                post.append((sp.classes[0], sp.idLocal))
+            return post
+
+        sources = [converter.parse(testPrimitive.spanners33a),
+                   converter.parse(testPrimitive.multipleAttributesPerMeasures),
+                   converter.parse(testPrimitive.pitches01a),
+                   corpus.parse('bach/bwv66.6')]
+        built = stream.Stream()
+        built.repeatAppend(note.Note('F#4', type='eighth'), 10)
+        sources.append(built)
+        partIdPattern = re.compile('id="[^"]*"')
+        for s in sources:
+            before = fingerprint(s)
+            post = fromStream(s, copyOnWrite=True)
+            self.assertEqual(fingerprint(s), before)
+            self.assertEqual(partIdPattern.sub('', post),
+                             partIdPattern.sub('', fromStream(s)))
+            self.assertEqual(fingerprint(s), before)
+
     def testTextExpressionsB(self):
         from music21 import expressions
 
@@ -1513,11 +1513,8 @@ def chordToMx(c, spannerBundle=None):
                 mxNote.set('duration', None)
             if chordPos > 0:
                 mxNote.set('chord', True)
-            # if we do not have a component color, set color from the chord
-            # working with a deepcopy, so this change is ok
-            if n.color is None:
-                n.color = c.color
-            mxNote.noteheadObj = noteheadToMxNotehead(n)
+            # if we do not have a component color, use the color of the chord
+            mxNote.noteheadObj = noteheadToMxNotehead(n, defaultColor=c.color)
             #get the stem direction from the chord, not the pitch
             if c.stemDirection != 'unspecified':
                 if c.stemDirection in ['noStem']:
@@ -1620,6 +1617,14 @@ def noteheadToMxNotehead(obj, defaultColor=None):
     'no'
     >>> mxN4._attr['parentheses']
     'yes'
+
+    If the object has no color, `defaultColor` is used:
+
+    >>> mxN5 = musicxml.toMxObjects.noteheadToMxNotehead(n1, defaultColor='#FF0000')
+    >>> mxN5._attr['color']
+    '#FF0000'
+    >>> print(n1.color)
+    None
     '''
     mxNotehead = mxObjects.Notehead()
     nh = 'normal'
@@ -1644,8 +1649,11 @@ def noteheadToMxNotehead(obj, defaultColor=None):
         mxNotehead.set('filled', nhFill)
     if nhParen is not False:
         mxNotehead.set('parentheses', nhParen)
-    if obj.color not in [None, '']:
-        mxNotehead.set('color', obj.color)
+    color = obj.color
+    if color is None:
+        color = defaultColor
+    if color not in [None, '']:
+        mxNotehead.set('color', color)
     return mxNotehead
 
 def noteToMxNotes(n, spannerBundle=None):
@@ -2064,7 +2072,7 @@ def measureToMx(m, spannerBundle=None, mxTranspose=None):
 # Streams
 
 def streamPartToMx(part, instStream=None, meterStream=None,
-                   refStreamOrTimeRange=None, spannerBundle=None):
+                   refStreamOrTimeRange=None, spannerBundle=None, inPlace=True):
     '''
     Convert a Part object (or any Stream representing a Part)
     to musicxml
@@ -2076,6 +2084,10 @@ def streamPartToMx(part, instStream=None, meterStream=None,
     from this Stream in order to configure id and midi-channel values.
 
     The `meterStream`, if given, provides a template of meters.
+
+    If `inPlace` is False, the part must not need notation (see
+    :func:`~music21.musicxml.toMxObjects.streamNeedsNotation`); an
+    Instrument that needs a part id is copied rather than changed.
     '''
     #environLocal.printDebug(['calling Stream.streamPartToMx', 'len(spannerBundle)', len(spannerBundle)])
     # note: meterStream may have TimeSignature objects from an unrelated
@@ -2083,10 +2095,16 @@ def streamPartToMx(part, instStream=None, meterStream=None,
     if instStream is None:
         # see if an instrument is defined in this or a parent stream
         instObj = part.getInstrument()
+        if instObj.partId == None and not inPlace:
+            instObj = copy.deepcopy(instObj)
         instStream = stream.Stream()
         instStream.insert(0, instObj) # create for storage
     else:
         instObj = instStream[0]
+        if instObj.partId == None and not inPlace:
+            instCopy = copy.deepcopy(instObj)
+            instStream.replace(instObj, instCopy, allTargetSites=False)
+            instObj = instCopy
     # must set a unique part id, if not already assigned
     if instObj.partId == None:
         instObj.partIdRandomize()
@@ -2200,7 +2218,75 @@ def emptyObjectToMx():
     return streamToMx(out)
 
 
-def streamToMx(s, spannerBundle=None):
+def streamNeedsNotation(s):
+    '''
+    Return True if :func:`~music21.musicxml.toMxObjects.streamToMx` would
+    need to change Stream `s` to translate it: to move Parts to offset
+    zero, to add Measures or Rests, to move clefs, key signatures, or time
+    signatures into the first Measure, or to make accidentals or beams.
+    (The idLocals of Spanners are set while translating even if this is
+    False; see streamToMx.)
+
+    >>> s = stream.Stream()
+    >>> s.append(note.Note('C4', type='half'))
+    >>> musicxml.toMxObjects.streamNeedsNotation(s)
+    True
+    >>> s = s.makeNotation()
+    >>> musicxml.toMxObjects.streamNeedsNotation(s)
+    True
+
+    The half note has no accidental and no beams, so accidentals and beams
+    would be made again; with a flat and beamed eighth notes, nothing more
+    is needed:
+
+    >>> s = stream.Stream()
+    >>> s.repeatAppend(note.Note('B-4', type='eighth'), 8)
+    >>> s = s.makeNotation()
+    >>> musicxml.toMxObjects.streamNeedsNotation(s)
+    False
+    '''
+    if len(s) == 0:
+        return False
+    if s.hasPartLikeStreams():
+        parts = s.getElementsByClass('Stream')
+        highestTime = 0
+        for p in parts:
+            if p.getOffsetBySite(s) != 0:
+                return True
+            highestTime = max(highestTime, p.highestTime)
+        for p in parts:
+            if p.hasVoices():
+                voices = p.voices
+            else:
+                voices = [p]
+            for v in voices:
+                if v.lowestOffset > 0 or v.highestTime < highestTime:
+                    return True
+    else:
+        parts = [s]
+
+    for p in parts:
+        measureStream = p.getElementsByClass('Measure')
+        if len(measureStream) == 0:
+            return True
+        firstMeasure = measureStream[0]
+        if (firstMeasure.clef is None and
+                len(p.getElementsByClass('Clef')) > 0):
+            return True
+        if (firstMeasure.keySignature is None and
+                len(p.getElementsByClass('KeySignature')) > 0):
+            return True
+        if (firstMeasure.timeSignature is None and
+                len(p.getElementsByClass('TimeSignature')) > 0):
+            return True
+        if not measureStream.haveAccidentalsBeenMade():
+            return True
+        if not measureStream.haveBeamsBeenMade():
+            return True
+    return False
+
+
+def streamToMx(s, spannerBundle=None, inPlace=True):
     '''
     Create and return a musicxml Score object from a Stream or Score
 
@@ -2215,9 +2301,43 @@ def streamToMx(s, spannerBundle=None):
     >>> s1.insert(measure1)
     >>> mxScore = musicxml.toMxObjects.streamToMx(s1)
     >>> mxPartList = mxScore.get('partList')
-    '''
-    # returns an mxScore object; a deepcopy has already been made
 
+    If `inPlace` is True (the default), `s` may be changed (with
+    makeNotation and the like) to translate it, so it should be a copy.
+    If `inPlace` is False, `s` is not changed: if it needs notation (see
+    :func:`~music21.musicxml.toMxObjects.streamNeedsNotation`) it is
+    copied first, and otherwise it is translated as it is, without copying
+    anything but Instruments that need part ids or MIDI channels; the
+    idLocals of its Spanners are set for the translation and then put back.
+
+    >>> s2 = stream.Stream()
+    >>> s2.repeatAppend(note.Note('B-4', type='eighth'), 8)
+    >>> s2 = s2.makeNotation()
+    >>> mxScore = musicxml.toMxObjects.streamToMx(s2, inPlace=False)
+    >>> print(s2.getElementsByClass('Measure')[0].getInstrument().partId)
+    None
+    '''
+    if not inPlace:
+        if streamNeedsNotation(s):
+            s = copy.deepcopy(s)
+            s.makeImmutable()
+            inPlace = True
+        else:
+            if spannerBundle is None:
+                spannerBundle = s.spannerBundle
+            idLocals = [(sp, sp.idLocal) for sp in spannerBundle]
+            try:
+                return _streamToMx(s, spannerBundle, inPlace=False)
+            finally:
+                for sp, idLocal in idLocals:
+                    sp.idLocal = idLocal
+    return _streamToMx(s, spannerBundle, inPlace)
+
+
+def _streamToMx(s, spannerBundle, inPlace):
+    '''
+    Translate `s` for streamToMx, changing it only if `inPlace` is True.
+    '''
     #environLocal.printDebug(['streamToMx:'])
     if len(s) == 0:
         return emptyObjectToMx()
@@ -2264,7 +2384,8 @@ def streamToMx(s, spannerBundle=None):
         for obj in streamOfStreams:
             # may need to copy element here
             # apply this streams offset to elements
-            obj.transferOffsetToElements()
+            if inPlace:
+                obj.transferOffsetToElements()
             ht = obj.highestTime
             if ht > highestTime:
                 highestTime = ht
@@ -2272,8 +2393,9 @@ def streamToMx(s, spannerBundle=None):
         refStreamOrTimeRange = [0, highestTime]
         # would like to do something like this but cannot
         # replace object inside of the stream
-        for obj in streamOfStreams:
-            obj.makeRests(refStreamOrTimeRange, inPlace=True)
+        if inPlace:
+            for obj in streamOfStreams:
+                obj.makeRests(refStreamOrTimeRange, inPlace=True)
 
         count = 0
         midiChannelList = []
@@ -2288,6 +2410,14 @@ def streamToMx(s, spannerBundle=None):
             inst = instStream[0] # store first, as handled differently
             instIdList = [x.partId for x in instList]
 
+            if not inPlace and (inst.partId == None or
+                    inst.partId in instIdList or inst.midiChannel == None or
+                    inst.midiChannel in midiChannelList):
+                # will be changed, so change a copy
+                instCopy = copy.deepcopy(inst)
+                instStream.replace(inst, instCopy, allTargetSites=False)
+                inst = instCopy
+
             if inst.partId in instIdList: # must have unique ids 
                 inst.partIdRandomize() # set new random id
 
@@ -2306,7 +2436,7 @@ def streamToMx(s, spannerBundle=None):
             mxScorePart, mxPart = streamPartToMx(obj, instStream=instStream,
                         meterStream=meterStream,
                         refStreamOrTimeRange=refStreamOrTimeRange,
-                        spannerBundle=spannerBundle)
+                        spannerBundle=spannerBundle, inPlace=inPlace)
             mxComponents.append([mxScorePart, mxPart, obj])
             #mxComponents.append(obj.streamPartToMx(inst, meterStream, refStreamOrTimeRange))
 
@@ -2315,7 +2445,7 @@ def streamToMx(s, spannerBundle=None):
         # if no instrument is provided it will be obtained through s
         # when streamPartToMx is called
         mxScorePart, mxPart = streamPartToMx(s, meterStream=meterStream,
-                              spannerBundle=spannerBundle)
+                              spannerBundle=spannerBundle, inPlace=inPlace)
         mxComponents.append([mxScorePart, mxPart, s])
         #environLocal.printDebug(['mxComponents', mxComponents])
 
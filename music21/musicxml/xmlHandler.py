@@ -47,6 +47,11 @@ except ImportError:
 import xml.sax
 import xml.dom.minidom # @UnusedImport
 
+try:
+    import xml.etree.cElementTree as ETree # much faster...
+except ImportError:
+    import xml.etree.ElementTree as ETree
+
 from music21.base import VERSION
 from music21 import xmlnode
 xml.dom.minidom.Element.writexml = xmlnode.fixed_writexml
@@ -288,7 +293,7 @@ class Handler(xml.sax.ContentHandler):
             # measures need to be stored in order; numbers may have odd values
             # update note start times w/ measure utility method
             self._mxObjs['measure'].update()
-            self._mxObjs['part'].componentList.append(self._mxObjs['measure'])
+            self._endMeasure(self._mxObjs['measure'])
 
         elif name == 'slur': 
             self._mxObjs['notations'].componentList.append(self._mxObjs['slur'])
@@ -857,7 +862,7 @@ class Handler(xml.sax.ContentHandler):
         # formerly part of handler part
         elif name == 'part':
             #environLocal.printDebug(['got part:', self._mxObjs['part']])
-            self._parts.append(self._mxObjs['part']) # outermost container
+            self._endPart(self._mxObjs['part'])
 
         elif name == 'key':
             self._mxObjs['attributes'].keyList.append(self._mxObjs['key'])
@@ -985,6 +990,18 @@ class Handler(xml.sax.ContentHandler):
 
 
     #---------------------------------------------------------------------------
+    def _endMeasure(self, mxMeasure):
+        '''
+        Called with each completed mxMeasure; adds it to the open mxPart.
+        '''
+        self._mxObjs['part'].componentList.append(mxMeasure)
+
+    def _endPart(self, mxPart):
+        '''
+        Called with each completed mxPart; stores it for the mxScore.
+        '''
+        self._parts.append(mxPart) # outermost container
+
     def getContent(self):
         #environLocal.printDebug(["self._mxObjs['part-list']", self._mxObjs['part-list']])
 
@@ -993,16 +1010,98 @@ class Handler(xml.sax.ContentHandler):
         return self._mxObjs['score']
 
 
+class StreamingHandler(Handler):
+    '''
+    A Handler that translates each measure into a music21
+    :class:`~music21.stream.Measure` as soon as its closing tag is read,
+    and then discards the mxMeasure, so that a complete mxScore is never
+    held in memory. Parts are inserted into the Score given as `inputM21`
+    (or a new Score) in the order they are found in the document.
+
+    Measures and Parts are collected in `completed` as they are translated;
+    a caller feeding the parser in pieces can remove them from there to
+    process them before the document has been read completely.
+
+    The mxScore returned by :meth:`getContent` has no mxParts;
+    :meth:`getStream` returns the completed music21 Score.
+    '''
+    def __init__(self, tagLib=None, inputM21=None):
+        Handler.__init__(self, tagLib)
+        from music21 import spanner
+        from music21 import stream
+        if inputM21 is None:
+            inputM21 = stream.Score()
+        self.stream = inputM21
+        self.spannerBundle = spanner.SpannerBundle()
+        # translated Measures and Parts not yet removed by the caller
+        self.completed = []
+        self._partParser = None
+        self._m21PartIdDictionary = {}
+
+    def _getPartParser(self):
+        if self._partParser is None:
+            from music21.musicxml import fromMxObjects
+            mxScore = self._mxObjs['score']
+            # the part-list is complete before the first part
+            mxScore.partListObj = self._mxObjs['part-list']
+            partId = self._mxObjs['part'].get('id')
+            self._partParser = fromMxObjects.PartParser(partId,
+                mxScore.getScorePart(partId),
+                spannerBundle=self.spannerBundle, inputM21=self.stream)
+        return self._partParser
+
+    def _endMeasure(self, mxMeasure):
+        m = self._getPartParser().addMeasure(mxMeasure)
+        self.completed.append(m)
+
+    def _endPart(self, mxPart):
+        partParser = self._getPartParser()
+        self._partParser = None
+        part = partParser.close()
+        self._m21PartIdDictionary[partParser.partId] = part
+        self.completed.append(part)
+
+    def getStream(self):
+        '''
+        Called after the document has been read: add the objects that
+        belong to the Score as a whole (see
+        :func:`~music21.musicxml.fromMxObjects.mxScoreToScoreObjects`)
+        and return the Score.
+        '''
+        from music21.musicxml import fromMxObjects
+        fromMxObjects.mxScoreToScoreObjects(self.getContent(), self.stream,
+            self.spannerBundle, self._m21PartIdDictionary)
+        return self.stream
+
+
 
 #-------------------------------------------------------------------------------
 class Document(object):
     '''Represent a MusicXML document, 
-    importing and writing'''
+    importing and writing
+
+    The `xmlBackend` determines how MusicXML is parsed: with 'sax' (the
+    default), a :class:`Handler` receives events from the xml.sax parser;
+    with 'etree', the same Handler receives events from the (C
+    implemented, if available) xml.etree `iterparse()`, which is faster.
+    Both produce the same mxObjects.
+
+    >>> from music21.musicxml import testPrimitive
+    >>> d = musicxml.xmlHandler.Document(xmlBackend='etree')
+    >>> d.read(testPrimitive.pitches01a)
+    >>> len(d.score.getPart('P1'))
+    26
+    '''
 
-    def __init__(self):
+    def __init__(self, xmlBackend='sax'):
+        if xmlBackend not in ('sax', 'etree'):
+            raise MusicXMLHandlerException('no such xmlBackend: %s' % xmlBackend)
+        self.xmlBackend = xmlBackend
         # create one tagLib for efficiency
         self.tagLib = musicxmlMod.TagLib()
         self.score = None
+        # a music21 Score, if read with iterStream()
+        self.stream = None
 
     def _getParser(self):
         '''Setup and return a saxparser with default configuration.'''
@@ -1014,26 +1113,77 @@ class Document(object):
         saxparser.setFeature(xml.sax.handler.feature_namespaces, 0)   
         return saxparser
 
-    def _load(self, fileLike, isFile=True, audit=False):
-        saxparser = self._getParser()
-        #t = common.Timer()
-        #t.start()
-        # call the handler with tagLib
-        h = Handler(self.tagLib) 
-        saxparser.setContentHandler(h)
+    def _iterparseEvents(self, h, fileLikeOpen):
+        '''
+        Parse with xml.etree's iterparse(), calling the methods of Handler
+        `h` in the order the SAX parser would. This is a generator that
+        yields after each closing tag.
+
+        Character data is passed to the Handler before the next tag:
+        iterparse() has set the text (or tail) of an element by then.
+        Elements are emptied once closed, so that only the currently open
+        elements are kept in memory.
+        '''
+        startElement = h.startElement
+        endElement = h.endElement
+        characters = h.characters
+        # the element whose text (or tail, if closed) comes before the
+        # next tag
+        lastElement = None
+        lastClosed = False
+        for event, elem in ETree.iterparse(fileLikeOpen, events=('start', 'end')):
+            if lastElement is not None:
+                if lastClosed:
+                    charData = lastElement.tail
+                else:
+                    charData = lastElement.text
+                if charData:
+                    characters(charData)
+            if event == 'start':
+                startElement(elem.tag, elem.attrib)
+                lastClosed = False
+            else:
+                endElement(elem.tag)
+                del elem[:]
+                lastClosed = True
+                yield
+            lastElement = elem
+
+    def _parse(self, h, fileLikeOpen):
+        '''
+        Parse the open file `fileLikeOpen` with the Handler `h`, using the
+        xmlBackend of this Document.
+        '''
+        if self.xmlBackend == 'etree':
+            for unused in self._iterparseEvents(h, fileLikeOpen):
+                pass
+        else:
+            saxparser = self._getParser()
+            saxparser.setContentHandler(h)
+            saxparser.parse(fileLikeOpen)
 
+    def _openFileLike(self, fileLike, isFile=True):
         if not isFile:
+            if self.xmlBackend == 'etree' and isinstance(fileLike, unicode):
+                # as the SAX parser does, read unicode as utf-8
+                fileLike = fileLike.encode('utf-8')
             # StringIO.StringIO is supposed to handle unicode
-            fileLikeOpen = StringIO.StringIO(fileLike)
-
+            return StringIO.StringIO(fileLike)
         else: # TODO: should this be codecs.open()?
-            fileLikeOpen = open(fileLike)
+            return open(fileLike)
             #fileLikeOpen = codecs.open(fileLike, encoding='utf-8')
 
+    def _load(self, fileLike, isFile=True, audit=False):
+        #t = common.Timer()
+        #t.start()
+        # call the handler with tagLib
+        h = Handler(self.tagLib) 
+        fileLikeOpen = self._openFileLike(fileLike, isFile)
+
         # the file always needs to be closed, otherwise
         # subsequent parsing operations produce an unclosed token error
         try:
-            saxparser.parse(fileLikeOpen)
+            self._parse(h, fileLikeOpen)
         except:
             fileLikeOpen.close()
         fileLikeOpen.close()
@@ -1061,6 +1211,88 @@ class Document(object):
     def open(self, fp, audit=False):
         self._load(fp, True, audit)
 
+    def iterStream(self, fileLike, isFile=True, inputM21=None,
+        chunkSize=2**16):
+        '''
+        Read MusicXML from a file path (or, if `isFile` is False, a string)
+        `chunkSize` bytes at a time (with the 'sax' xmlBackend; iterparse()
+        chooses its own), translating each measure into music21
+        as soon as it is read; see
+        :class:`~music21.musicxml.xmlHandler.StreamingHandler`.
+
+        This is a generator that yields each Measure and Part as it is
+        completed; a Part is yielded after its Measures. Each Part is also
+        inserted into the Score given as `inputM21` (or a new Score), which
+        is completed and stored as `self.stream` once the generator is
+        exhausted. `self.score` is set to an mxScore without mxParts.
+
+        >>> from music21.musicxml import testPrimitive
+        >>> d = musicxml.xmlHandler.Document()
+        >>> for obj in d.iterStream(testPrimitive.pitches01a, isFile=False):
+        ...     if 'Part' in obj.classes:
+        ...         print obj, len(obj.getElementsByClass('Measure'))
+        <music21.stream.Part MusicXML Part> 26
+        >>> d.stream.parts[0] is obj
+        True
+        '''
+        h = StreamingHandler(self.tagLib, inputM21=inputM21)
+        fileLikeOpen = self._openFileLike(fileLike, isFile)
+        # the file always needs to be closed
+        try:
+            if self.xmlBackend == 'etree':
+                for unused in self._iterparseEvents(h, fileLikeOpen):
+                    if h.completed:
+                        completed = h.completed
+                        h.completed = []
+                        for obj in completed:
+                            yield obj
+            else:
+                saxparser = self._getParser()
+                saxparser.setContentHandler(h)
+                while True:
+                    data = fileLikeOpen.read(chunkSize)
+                    if not data:
+                        break
+                    saxparser.feed(data)
+                    completed = h.completed
+                    h.completed = []
+                    for obj in completed:
+                        yield obj
+                saxparser.close()
+            for obj in h.completed:
+                yield obj
+            h.completed = []
+        finally:
+            fileLikeOpen.close()
+
+        self.score = h.getContent()
+        self.stream = h.getStream()
+
+    def readStream(self, xmlString, inputM21=None):
+        '''
+        Translate MusicXML in a string into music21 measure by measure, as
+        in :meth:`iterStream`, and return the Score.
+
+        >>> from music21.musicxml import testPrimitive
+        >>> d = musicxml.xmlHandler.Document()
+        >>> s = d.readStream(testPrimitive.pitches01a)
+        >>> len(s.parts[0].getElementsByClass('Measure'))
+        26
+        '''
+        for unused in self.iterStream(xmlString, False, inputM21=inputM21):
+            pass
+        return self.stream
+
+    def openStream(self, fp, inputM21=None):
+        '''
+        Translate a MusicXML file into music21 measure by measure, as in
+        :meth:`iterStream`, and return the Score. Memory is needed only for
+        the music21 Score and one measure of mxObjects.
+        '''
+        for unused in self.iterStream(fp, True, inputM21=inputM21):
+            pass
+        return self.stream
+
     #---------------------------------------------------------------------------        
     # convenience routines to get meta-data
     def getBestTitle(self):
@@ -1302,6 +1534,59 @@ class Test(unittest.TestCase):
         self.assertEqual(glissCount, 2)
         self.assertEqual(wavyCount, 4)
 
+    def testIterStream(self):
+        from music21.musicxml import testPrimitive
+        from music21 import converter
+
+        for xmlString in [testPrimitive.pianoStaff43a,
+            testPrimitive.spanners33a, testPrimitive.staffGroupsNested41d,
+            testPrimitive.transposingInstruments72a]:
+            s1 = converter.parse(xmlString)
+            d = Document()
+            measureCount = 0
+            parts = []
+            for obj in d.iterStream(xmlString, isFile=False):
+                if 'Measure' in obj.classes:
+                    measureCount += 1
+                else:
+                    parts.append(obj)
+            s2 = d.stream
+            # one Part is yielded for each part in the document, after
+            # its Measures
+            self.assertEqual(len(parts), len(d.score.getPartIdsFromPartListObj()))
+            self.assertEqual(measureCount, sum(
+                [len(p.getElementsByClass('Measure')) for p in parts]))
+            self.assertEqual(len(s1.parts), len(s2.parts))
+            for p1, p2 in zip(s1.parts, s2.parts):
+                self.assertEqual(p1.id, p2.id)
+                self.assertEqual(p1.classes[0], p2.classes[0])
+                self.assertEqual([(e.offset, e.classes[0]) for e in p1.flat],
+                    [(e.offset, e.classes[0]) for e in p2.flat])
+            self.assertEqual(len(s1.flat.spanners), len(s2.flat.spanners))
+            self.assertEqual(d.score.componentList, [])
+
+    def testEtreeBackend(self):
+        from music21.musicxml import testPrimitive
+        from music21 import converter
+
+        for xmlString in [testPrimitive.pianoStaff43a,
+            testPrimitive.spanners33a, testPrimitive.directions31a,
+            testPrimitive.unicodeStrWithNonAscii]:
+            d1 = Document()
+            d1.read(xmlString)
+            d2 = Document(xmlBackend='etree')
+            d2.read(xmlString)
+            self.assertEqual(d1.score.toxml(None, None, 1),
+                d2.score.toxml(None, None, 1))
+
+        s1 = converter.parse(testPrimitive.spanners33a)
+        for streaming in (False, True):
+            s2 = converter.parse(testPrimitive.spanners33a, xmlBackend='etree',
+                streaming=streaming)
+            self.assertEqual([(e.offset, e.classes[0]) for e in s1.flat],
+                [(e.offset, e.classes[0]) for e in s2.flat])
+
+
 #-------------------------------------------------------------------------------
 if __name__ == "__main__":
     # this is a temporary hack to get encoding working right
@@ -74,6 +74,11 @@ DIRECTION_DESCENDING = intervalNetwork.DIRECTION_DESCENDING
 TERMINUS_LOW = intervalNetwork.TERMINUS_LOW
 TERMINUS_HIGH = intervalNetwork.TERMINUS_HIGH
 
+# BoundIntervalNetworks of diatonic scales, keyed by interval list and
+# octaveDuplicating; each AbstractDiatonicScale gets a copy of the structure
+# of one of these, which is faster than building a network from intervals
+_diatonicNetworkCache = {}
+
 #-------------------------------------------------------------------------------
 class ScaleException(exceptions21.Music21Exception):
     pass
@@ -768,9 +773,13 @@ class AbstractDiatonicScale(AbstractScale):
             self.relativeMinorDegree = 3
         else:
             raise ScaleException('cannot create a scale of the following mode:' % mode)
-        self._net = intervalNetwork.BoundIntervalNetwork(intervalList, 
+        cacheKey = (tuple(intervalList), self.octaveDuplicating)
+        if cacheKey not in _diatonicNetworkCache:
+            _diatonicNetworkCache[cacheKey] = \
+                intervalNetwork.BoundIntervalNetwork(intervalList,
                     octaveDuplicating=self.octaveDuplicating,
                     pitchSimplification=None)
+        self._net = _diatonicNetworkCache[cacheKey].copyStructure()
 
 
 class AbstractOctatonicScale(AbstractScale):
@@ -3482,6 +3491,23 @@ class Test(unittest.TestCase):
 
         self.assertEqual(str(hs.pitchFromDegree(1)), 'G3')
 
+    def testDiatonicNetworkCopies(self):
+        # scales of the same mode get separate copies of one network
+        sc1 = MajorScale('c4')
+        sc2 = MajorScale('d4')
+        net1 = sc1._abstract._net
+        net2 = sc2._abstract._net
+        self.assertEqual(net1 == net2, True)
+        self.assertEqual(net1._nodes[1] is net2._nodes[1], False)
+        net1._nodes[1].weight = 0.5
+        self.assertEqual(net2._nodes[1].weight, 1.0)
+        self.assertEqual(self.pitchOut(sc1.pitches),
+            '[C4, D4, E4, F4, G4, A4, B4, C5]')
+        self.assertEqual(self.pitchOut(sc2.pitches),
+            '[D4, E4, F#4, G4, A4, B4, C#5, D5]')
+        self.assertEqual(self.pitchOut(MajorScale('c4').pitches),
+            '[C4, D4, E4, F4, G4, A4, B4, C5]')
+
 
 
     def testRagAsawara(self):
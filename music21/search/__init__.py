@@ -26,8 +26,10 @@ from music21.search import segment
 
 
 
+import collections
 import copy
 import difflib
+import heapq
 import math
 import unittest
 
@@ -161,23 +163,259 @@ def rhythmicSearch(thisStream, searchStream):
     searchLength = len(searchStream)
     if searchLength == 0:
         raise SearchException('the search Stream cannot be empty')
-    streamLength = len(thisStream)
-    foundEls = []
-    for start in range(1 + streamLength - searchLength):
-        #miniStream = thisStream[start:start+searchLength]
-        foundException = False
-        for j in range(searchLength):
-            #x = searchStream[j].duration
-            if "WildcardDuration" in searchStream[j].duration.classes:
-                next
-            elif searchStream[j].duration.quarterLength != thisStream[start + j].duration.quarterLength:
-                foundException = True
-                break
-        if foundException == False:
-            foundEls.append(start)
-    return foundEls
+    return rhythmicSearchMany(thisStream, [searchStream])[0]
+
+
+def _getAhoCorasickAutomaton(patterns):
+    '''
+    Build an Aho-Corasick automaton for finding all of `patterns` (tuples
+    of any hashable objects) in one pass through a sequence. Returns a
+    tuple of lists, indexed by state: the transitions from each state (a
+    dictionary of the next object to the next state), the failure state of
+    each state, and the indices of the patterns which end at each state.
+    '''
+    transitions = [{}]
+    failures = [0]
+    outputs = [[]]
+    for patternIndex, pattern in enumerate(patterns):
+        state = 0
+        for symbol in pattern:
+            if symbol not in transitions[state]:
+                transitions.append({})
+                failures.append(0)
+                outputs.append([])
+                transitions[state][symbol] = len(transitions) - 1
+            state = transitions[state][symbol]
+        outputs[state].append(patternIndex)
+
+    queue = collections.deque(transitions[0].values())
+    while queue:
+        state = queue.popleft()
+        for symbol, nextState in transitions[state].items():
+            queue.append(nextState)
+            failure = failures[state]
+            while failure and symbol not in transitions[failure]:
+                failure = failures[failure]
+            failure = transitions[failure].get(symbol, 0)
+            if failure == nextState: # only at the root's children
+                failure = 0
+            failures[nextState] = failure
+            outputs[nextState] = outputs[nextState] + outputs[failure]
+    return (transitions, failures, outputs)
+
+
+def rhythmicSearchMany(thisStream, searchStreams):
+    '''
+    Does the search of :func:`~music21.search.rhythmicSearch` for each of a
+    list of search streams at once, and returns a list of the lists of
+    indices which begin a successful search for each of them.
+
+    The quarterLengths of `thisStream` are read only once, and the search
+    streams (split into pieces between their Wildcards) are all found in
+    one pass through them with the Aho-Corasick algorithm, so the time
+    needed grows with the length of `thisStream` plus the number of
+    matches, rather than with the product of the lengths of the streams.
+
+    >>> thisStream = tinyNotation.TinyNotationStream("c4. d8 e4 g4. a8 f4. c4.", "3/4")
+    >>> searchStream1 = stream.Stream()
+    >>> searchStream1.append(note.Note(quarterLength = 1.5))
+    >>> searchStream1.append(note.Note(quarterLength = .5))
+    >>> searchStream2 = stream.Stream()
+    >>> searchStream2.append(note.Note(quarterLength = .5))
+    >>> searchStream2.append(search.Wildcard())
+    >>> searchStream2.append(note.Note(quarterLength = 1.5))
+    >>> searchStream3 = stream.Stream()
+    >>> searchStream3.append(search.Wildcard())
+    >>> searchStream3.append(note.Note(quarterLength = 1.5))
+    >>> search.rhythmicSearchMany(thisStream,
+    ...     [searchStream1, searchStream2, searchStream3])
+    [[1, 4], [2, 5], [0, 3, 5, 6]]
+
+    A search stream of only Wildcards matches everywhere that it fits:
+
+    >>> searchStream4 = stream.Stream()
+    >>> searchStream4.repeatAppend(search.Wildcard(), 6)
+    >>> search.rhythmicSearchMany(thisStream, [searchStream4])
+    [[0, 1, 2]]
+    '''
+    quarterLengths = [e.duration.quarterLength for e in thisStream]
+    streamLength = len(quarterLengths)
+
+    # each search stream becomes a list of its pieces without Wildcards,
+    # and where they start in it
+    pieceIndices = {}
+    pieces = []
+    searchPieces = []
+    for searchStream in searchStreams:
+        thisSearchPieces = []
+        piece = []
+        pieceStart = 0
+        searchLength = 0
+        for e in searchStream:
+            searchLength += 1
+            if "WildcardDuration" in e.duration.classes:
+                if piece:
+                    thisSearchPieces.append((tuple(piece), pieceStart))
+                piece = []
+                pieceStart = searchLength
+            else:
+                piece.append(e.duration.quarterLength)
+        if piece:
+            thisSearchPieces.append((tuple(piece), pieceStart))
+        pieceOffsets = []
+        for piece, pieceStart in thisSearchPieces:
+            if piece not in pieceIndices:
+                pieceIndices[piece] = len(pieces)
+                pieces.append(piece)
+            pieceOffsets.append((pieceIndices[piece], pieceStart))
+        searchPieces.append((searchLength, pieceOffsets))
+
+    # for each piece, the search streams that it is in, and where
+    pieceUses = [[] for unused in pieces]
+    for searchIndex, (searchLength, pieceOffsets) in enumerate(searchPieces):
+        for pieceIndex, pieceStart in pieceOffsets:
+            pieceUses[pieceIndex].append((searchIndex, pieceStart))
+
+    # count, for each search stream and start, how many of its pieces are
+    # found where they would be if the search stream began there
+    pieceCounts = [{} for unused in searchPieces]
+    if pieces:
+        transitions, failures, outputs = _getAhoCorasickAutomaton(pieces)
+        state = 0
+        for position, quarterLength in enumerate(quarterLengths):
+            while state and quarterLength not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(quarterLength, 0)
+            for pieceIndex in outputs[state]:
+                pieceEnd = position + 1 - len(pieces[pieceIndex])
+                for searchIndex, pieceStart in pieceUses[pieceIndex]:
+                    start = pieceEnd - pieceStart
+                    if (start < 0 or start + searchPieces[searchIndex][0] >
+                            streamLength):
+                        continue
+                    counts = pieceCounts[searchIndex]
+                    counts[start] = counts.get(start, 0) + 1
+
+    post = []
+    for searchIndex, (searchLength, pieceOffsets) in enumerate(searchPieces):
+        if not pieceOffsets:
+            post.append(list(range(1 + streamLength - searchLength)))
+            continue
+        counts = pieceCounts[searchIndex]
+        post.append(sorted(start for start in counts
+            if counts[start] == len(pieceOffsets)))
+    return post
+
 
-def approximateNoteSearch(thisStream, otherStreams):
+def _getUpperBoundRatio(thisCounts, thisLength, thatString, minimumRatio=0.0):
+    '''
+    Return a number which the difflib ratio of a string of `thisLength`
+    characters, with character counts `thisCounts`, and of `thatString`
+    cannot exceed: the ratio of the characters that they could have in
+    common. If the lengths alone show that the ratio is below
+    `minimumRatio`, the characters are not counted, and the bound from
+    the lengths is returned.
+
+    >>> search._getUpperBoundRatio({'A': 2, 'B': 1}, 3, 'AC')
+    0.4
+    >>> search._getUpperBoundRatio({'A': 2, 'B': 1}, 3, 'AAAAAAAAAA', 0.5)
+    0.4615...
+    '''
+    totalLength = thisLength + len(thatString)
+    if totalLength == 0:
+        return 1.0
+    lengthBound = 2.0 * min(thisLength, len(thatString)) / totalLength
+    if lengthBound < minimumRatio:
+        return lengthBound
+    thatCounts = {}
+    for c in thatString:
+        thatCounts[c] = thatCounts.get(c, 0) + 1
+    matches = 0
+    for c, count in thatCounts.items():
+        matches += min(count, thisCounts.get(c, 0))
+    return 2.0 * matches / totalLength
+
+
+def _approximateNoteSearch(thisStream, otherStreams, translators,
+    k=None, minimumProbability=None):
+    '''
+    Do the search of the approximateNoteSearch functions: `translators` is a
+    list of pairs of a translation function and the weight of the
+    similarity of its strings in the matchProbability.
+
+    If `k` or `minimumProbability` is given, each stream is first given an
+    upper bound on its matchProbability from the lengths and character
+    counts of its strings; the streams are compared in order of their
+    bounds, and the search stops as soon as no stream left can be among
+    the `k` best or reach `minimumProbability`. Streams which are not
+    compared are not given a matchProbability.
+    '''
+    isJunk = None
+    totalWeight = float(sum(weight for unused, weight in translators))
+
+    def getStrings(s):
+        notesAndRests = s.flat.notesAndRests
+        return [translator(notesAndRests) for translator, unused in translators]
+
+    def getRatio(thatStrings):
+        ratio = 0.0
+        for thisString, thatString, (unused, weight) in zip(thisStrings,
+                thatStrings, translators):
+            ratio += weight * difflib.SequenceMatcher(isJunk,
+                thisString, thatString).ratio()
+        return ratio / totalWeight
+
+    thisStrings = getStrings(thisStream)
+    if k is None and minimumProbability is None:
+        sorterList = []
+        for s in otherStreams:
+            ratio = getRatio(getStrings(s))
+            s.matchProbability = ratio
+            sorterList.append((ratio, s))
+        sortedList = sorted(sorterList, key = lambda x: 1-x[0])
+        return [x[1] for x in sortedList]
+
+    if minimumProbability is None:
+        minimumProbability = 0.0
+    thisCountsList = []
+    for thisString in thisStrings:
+        thisCounts = {}
+        for c in thisString:
+            thisCounts[c] = thisCounts.get(c, 0) + 1
+        thisCountsList.append(thisCounts)
+
+    candidates = [] # (bound, index, stream, strings)
+    for i, s in enumerate(otherStreams):
+        thatStrings = getStrings(s)
+        bound = 0.0
+        for j, (unused, weight) in enumerate(translators):
+            bound += weight * _getUpperBoundRatio(thisCountsList[j],
+                len(thisStrings[j]), thatStrings[j], minimumProbability)
+        bound /= totalWeight
+        if bound >= minimumProbability:
+            candidates.append((bound, i, s, thatStrings))
+    candidates.sort(key=lambda x: (-x[0], x[1]))
+
+    # a heap of the best (ratio, -index, stream) found so far, worst first;
+    # a smaller index wins a tie, as in a stable sort
+    best = []
+    for bound, i, s, thatStrings in candidates:
+        if k is not None and len(best) == k and bound < best[0][0]:
+            break
+        ratio = getRatio(thatStrings)
+        s.matchProbability = ratio
+        if ratio < minimumProbability:
+            continue
+        if k is None or len(best) < k:
+            heapq.heappush(best, (ratio, -i, s))
+        elif (ratio, -i) > best[0][:2]:
+            heapq.heapreplace(best, (ratio, -i, s))
+    best.sort(key=lambda x: (-x[0], -x[1]))
+    return [x[2] for x in best]
+
+
+def approximateNoteSearch(thisStream, otherStreams, k=None,
+    minimumProbability=None):
     '''
     searches the list of otherStreams and returns an ordered list of matches
     (each stream will have a new property of matchProbability to show how
@@ -198,25 +436,32 @@ def approximateNoteSearch(thisStream, otherStreams):
     o1 0.666666...
     o3 0.333333...
     o2 0.083333...
+
+    If `k` is given, only the `k` best matches are returned, and if
+    `minimumProbability` is given, only the matches at least that good.
+    Streams which cannot be among them, judging only from the number of
+    times that each note is found in them, are skipped without comparing
+    them, so this is much faster for looking up a few matches among many
+    streams:
+
+    >>> l = search.approximateNoteSearch(s, [o1, o2, o3], k=1)
+    >>> [i.id for i in l]
+    ['o1']
+    >>> l = search.approximateNoteSearch(s, [o1, o2, o3], minimumProbability=0.3)
+    >>> [i.id for i in l]
+    ['o1', 'o3']
+
+    The same keywords can be given to the other approximateNoteSearch
+    functions.
     '''
-    isJunk = None
-    n = thisStream.flat.notesAndRests
-    thisStreamStr = translateStreamToString(n)
-    sorterList = []
-    for s in otherStreams:
-        sn = s.flat.notesAndRests
-        thatStreamStr = translateStreamToString(sn)
-        ratio = difflib.SequenceMatcher(isJunk, thisStreamStr, thatStreamStr).ratio()
-        s.matchProbability = ratio
-        sorterList.append((ratio, s))
-    sortedList = sorted(sorterList, key = lambda x: 1-x[0])
-    sortedStreams = [x[1] for x in sortedList]
-    return sortedStreams
+    return _approximateNoteSearch(thisStream, otherStreams,
+        [(translateStreamToString, 1)], k, minimumProbability)
 
 
 
 
-def approximateNoteSearchNoRhythm(thisStream, otherStreams):
+def approximateNoteSearchNoRhythm(thisStream, otherStreams, k=None,
+    minimumProbability=None):
     '''
     searches the list of otherStreams and returns an ordered list of matches
     (each stream will have a new property of matchProbability to show how
@@ -238,23 +483,13 @@ def approximateNoteSearchNoRhythm(thisStream, otherStreams):
     o3 0.5
     o2 0.1666666...
     '''
-    isJunk = None
-    n = thisStream.flat.notesAndRests
-    thisStreamStr = translateStreamToStringNoRhythm(n)
-    sorterList = []
-    for s in otherStreams:
-        sn = s.flat.notesAndRests
-        thatStreamStr = translateStreamToStringNoRhythm(sn)
-        ratio = difflib.SequenceMatcher(isJunk, thisStreamStr, thatStreamStr).ratio()
-        s.matchProbability = ratio
-        sorterList.append((ratio, s))
-    sortedList = sorted(sorterList, key = lambda x: 1-x[0])
-    sortedStreams = [x[1] for x in sortedList]
-    return sortedStreams
+    return _approximateNoteSearch(thisStream, otherStreams,
+        [(translateStreamToStringNoRhythm, 1)], k, minimumProbability)
 
 
 
-def approximateNoteSearchOnlyRhythm(thisStream, otherStreams):
+def approximateNoteSearchOnlyRhythm(thisStream, otherStreams, k=None,
+    minimumProbability=None):
     '''
     searches the list of otherStreams and returns an ordered list of matches
     (each stream will have a new property of matchProbability to show how
@@ -276,22 +511,12 @@ def approximateNoteSearchOnlyRhythm(thisStream, otherStreams):
     o3 0.33...
     o2 0.0
     '''
-    isJunk = None
-    n = thisStream.flat.notesAndRests
-    thisStreamStr = translateStreamToStringOnlyRhythm(n)
-    sorterList = []
-    for s in otherStreams:
-        sn = s.flat.notesAndRests
-        thatStreamStr = translateStreamToStringOnlyRhythm(sn)
-        ratio = difflib.SequenceMatcher(isJunk, thisStreamStr, thatStreamStr).ratio()
-        s.matchProbability = ratio
-        sorterList.append((ratio, s))
-    sortedList = sorted(sorterList, key = lambda x: 1-x[0])
-    sortedStreams = [x[1] for x in sortedList]
-    return sortedStreams
+    return _approximateNoteSearch(thisStream, otherStreams,
+        [(translateStreamToStringOnlyRhythm, 1)], k, minimumProbability)
 
 
-def approximateNoteSearchWeighted(thisStream, otherStreams):
+def approximateNoteSearchWeighted(thisStream, otherStreams, k=None,
+    minimumProbability=None):
     '''
     searches the list of otherStreams and returns an ordered list of matches
     (each stream will have a new property of matchProbability to show how
@@ -315,28 +540,13 @@ def approximateNoteSearchWeighted(thisStream, otherStreams):
     o1 0.75
     o4 0.75
     o2 0.25
+    >>> l = search.approximateNoteSearchWeighted(s, [o1, o2, o3, o4], k=2)
+    >>> [i.id for i in l]
+    ['o3', 'o1']
     '''
-    isJunk = None
-    n = thisStream.flat.notesAndRests
-    thisStreamStrPitches = translateStreamToStringNoRhythm(n)
-    thisStreamStrDuration = translateStreamToStringOnlyRhythm(n)   
-#    print "notes",thisStreamStrPitches
-#    print "rhythm",thisStreamStrDuration 
-    sorterList = []
-    for s in otherStreams:
-        sn = s.flat.notesAndRests
-        thatStreamStrPitches = translateStreamToStringNoRhythm(sn)
-        thatStreamStrDuration = translateStreamToStringOnlyRhythm(sn)
-#        print "notes2",thatStreamStrPitches
-#        print "rhythm2",thatStreamStrDuration 
-        ratioPitches = difflib.SequenceMatcher(isJunk, thisStreamStrPitches, thatStreamStrPitches).ratio()
-        ratioDuration = difflib.SequenceMatcher(isJunk,thisStreamStrDuration,thatStreamStrDuration).ratio()
-        ratio = (3*ratioPitches+ratioDuration)/4.0
-        s.matchProbability = ratio
-        sorterList.append((ratio, s))
-    sortedList = sorted(sorterList, key = lambda x: 1-x[0])
-    sortedStreams = [x[1] for x in sortedList]
-    return sortedStreams
+    return _approximateNoteSearch(thisStream, otherStreams,
+        [(translateStreamToStringNoRhythm, 3),
+         (translateStreamToStringOnlyRhythm, 1)], k, minimumProbability)
 
 
 
@@ -685,6 +895,82 @@ class Test(unittest.TestCase):
                 i = copy.copy(obj)
                 j = copy.deepcopy(obj)
 
+    def testRhythmicSearchMany(self):
+        import random
+        from music21 import note, stream
+        random.seed(20)
+        quarterLengths = [0.5, 1.0, 1.5]
+        thisStream = stream.Stream()
+        for unused in range(300):
+            thisStream.append(note.Note(
+                quarterLength=random.choice(quarterLengths)))
+        searchStreams = []
+        for unused in range(40):
+            searchStream = stream.Stream()
+            for unused in range(random.randint(1, 6)):
+                if random.random() < 0.3:
+                    searchStream.append(Wildcard())
+                else:
+                    searchStream.append(note.Note(
+                        quarterLength=random.choice(quarterLengths)))
+            searchStreams.append(searchStream)
+
+        thisQLs = [n.quarterLength for n in thisStream]
+        expected = []
+        for searchStream in searchStreams:
+            searchQLs = [None if isinstance(e, Wildcard) else e.quarterLength
+                for e in searchStream]
+            expected.append([start
+                for start in range(1 + len(thisQLs) - len(searchQLs))
+                if all(ql is None or ql == thisQLs[start + j]
+                    for j, ql in enumerate(searchQLs))])
+        self.assertEqual(rhythmicSearchMany(thisStream, searchStreams),
+            expected)
+        for searchStream, found in zip(searchStreams, expected):
+            self.assertEqual(rhythmicSearch(thisStream, searchStream), found)
+
+    def testApproximateNoteSearchTopK(self):
+        import random
+        from music21 import note, stream
+        random.seed(19)
+        def randomStream():
+            s = stream.Stream()
+            for unused in range(random.randint(0, 20)):
+                s.append(note.Note(random.choice(['C4', 'D4', 'E4', 'G4']),
+                    quarterLength=random.choice([0.5, 1.0])))
+            return s
+        thisStream = randomStream()
+        otherStreams = [randomStream() for unused in range(60)]
+        for searchFunction in (approximateNoteSearch,
+                approximateNoteSearchNoRhythm,
+                approximateNoteSearchOnlyRhythm,
+                approximateNoteSearchWeighted):
+            full = searchFunction(thisStream, otherStreams)
+            ratios = [s.matchProbability for s in full]
+            self.assertEqual(ratios, sorted(ratios, reverse=True))
+            for k in (1, 5, 59, 100):
+                self.assertEqual(searchFunction(thisStream, otherStreams, k=k),
+                    full[:k])
+            expected = [s for s in full if s.matchProbability >= 0.5]
+            self.assertEqual(searchFunction(thisStream, otherStreams,
+                minimumProbability=0.5), expected)
+            self.assertEqual(searchFunction(thisStream, otherStreams, k=3,
+                minimumProbability=0.5), expected[:3])
+
+    def testApproximateNoteSearchAfterEdit(self):
+        from music21 import converter
+        thisStream = converter.parse("c4 d8 e16 FF a'4 b-", "4/4")
+        otherStream = converter.parse("c16 e4 d8 FF4 a'8 b-", "4/4")
+        approximateNoteSearch(thisStream, [otherStream])
+        self.assertNotEqual(otherStream.matchProbability, 1.0)
+        # edit the notes in place to match
+        for n, thisNote in zip(otherStream.flat.notes, thisStream.flat.notes):
+            n.pitch = thisNote.pitch
+            n.duration.quarterLength = thisNote.duration.quarterLength
+        for k in (None, 1):
+            approximateNoteSearch(thisStream, [otherStream], k=k)
+            self.assertEqual(otherStream.matchProbability, 1.0)
+
     
 
 #-------------------------------------------------------------------------------
@@ -24,6 +24,7 @@ Speed notes:
    slightly different, but the speedup is between 10 and 100x!
 
 '''
+from music21 import common
 from music21 import converter
 from music21 import corpus
 from music21 import environment
@@ -34,6 +35,9 @@ import os
 import math
 import json
 import difflib
+import hashlib
+import heapq
+import multiprocessing
 
 
 def translateMonophonicPartToSegments(
@@ -161,6 +165,57 @@ def indexScoreParts(scoreFile, *args, **kwds):
     return indexedList
 
 
+def _getFileHash(filePath):
+    '''
+    Return the md5 hex digest of the file at `filePath` (a path relative to
+    the corpus is looked up in the corpus), or None if it cannot be read.
+
+    >>> h = search.segment._getFileHash('luca/gloria')
+    >>> len(h)
+    32
+    >>> h == search.segment._getFileHash('luca/gloria')
+    True
+    >>> print(search.segment._getFileHash('/no/such/file.xml'))
+    None
+    '''
+    if not os.path.isabs(filePath) and not os.path.exists(filePath):
+        try:
+            filePath = corpus.getWork(filePath)
+        except Exception: # not found in the corpus
+            return None
+        if not common.isStr(filePath):
+            return None
+    fileHash = hashlib.md5()
+    try:
+        with open(filePath, 'rb') as f:
+            while True:
+                chunk = f.read(65536)
+                if not chunk:
+                    break
+                fileHash.update(chunk)
+    except (IOError, OSError):
+        return None
+    return fileHash.hexdigest()
+
+
+def _indexScoreFileJob(job):
+    '''
+    Parse and index one file for indexScoreFilePaths, possibly in a worker
+    process. Returns a tuple of the file path, the list from indexScoreParts
+    (or None if the file could not be parsed or indexed), and the error
+    message (or None).
+    '''
+    filePath, args, kwds = job
+    try:
+        if not os.path.isabs(filePath):
+            scoreObj = corpus.parse(filePath)
+        else:
+            scoreObj = converter.parse(filePath)
+        return (filePath, indexScoreParts(scoreObj, *args, **kwds), None)
+    except Exception as e: # anything can go wrong in parsing a file
+        return (filePath, None, '%s: %s' % (e.__class__.__name__, e))
+
+
 def indexScoreFilePaths(
     scoreFilePaths,
     giveUpdates=False,
@@ -194,28 +249,178 @@ def indexScoreFilePaths(
 
         >>> scoreDict['bwv190.7.mxl'][0]['segmentList'][0]
         'NNJLNOLLLJJIJLLLLNJJJIJLLJNNJL'
-    
+
+    Other keywords are passed to indexScoreParts, except for these:
+
+    `workers` is the number of processes used to parse the files (default 1,
+    all in this process; None uses 1 fewer process than the number of
+    available cores).
+
+    `progressCallback`, if given, is called after each file with the file
+    path, the number of files done, the total number of files, and one of
+    'indexed', 'skipped', or 'failed'.
+
+    `checkpointFilePath`, if given, is a file to which each score is
+    appended (with the path and a hash of its file) as soon as it is
+    indexed. If the file exists, scores whose files have not changed since
+    they were written to it are loaded from it instead of being indexed
+    again, so that an interrupted run can be continued, and a large
+    collection of files can be indexed again quickly after a few of them
+    change.
+
+    >>> fp = environLocal.getTempFile('.json')
+    >>> calls = []
+    >>> def progress(filePath, numberDone, totalScores, status):
+    ...     calls.append((filePath, numberDone, totalScores, status))
+    >>> paths = ['luca/gloria', 'bach/bwv66.6']
+    >>> scoreDict = search.segment.indexScoreFilePaths(
+    ...     paths, checkpointFilePath=fp, progressCallback=progress)
+    >>> sorted(scoreDict.keys())
+    ['bwv66.6', 'gloria']
+    >>> calls
+    [('luca/gloria', 1, 2, 'indexed'), ('bach/bwv66.6', 2, 2, 'indexed')]
+
+    >>> calls = []
+    >>> scoreDict2 = search.segment.indexScoreFilePaths(
+    ...     paths + ['/no/such/file.xml'], checkpointFilePath=fp,
+    ...     progressCallback=progress)
+    Failed on parse for: /no/such/file.xml (...)
+    >>> scoreDict2 == scoreDict
+    True
+    >>> [c[3] for c in calls]
+    ['skipped', 'skipped', 'failed']
+
+    A line left incomplete by an interrupted run does not affect the scores
+    appended after it:
+
+    >>> with open(fp, 'ab') as f:
+    ...     f.write('{"name": "bwv66.6", "pa')
+    >>> unused = search.segment.indexScoreFilePaths(['bach/bwv19.7'],
+    ...     checkpointFilePath=fp)
+    >>> savedDict = search.segment.loadScoreDictCheckpoint(fp)[0]
+    >>> sorted(str(name) for name in savedDict)
+    ['bwv19.7', 'bwv66.6', 'gloria']
+    >>> import os
+    >>> os.remove(fp)
     '''
+    workers = kwds.pop('workers', 1)
+    progressCallback = kwds.pop('progressCallback', None)
+    checkpointFilePath = kwds.pop('checkpointFilePath', None)
+
     scoreDict = {}
-    scoreIndex = 0
     totalScores = len(scoreFilePaths)
+    numberDone = [0] # a list so that it can be changed in finishFile
+
+    def finishFile(filePath, status):
+        numberDone[0] += 1
+        if progressCallback is not None:
+            progressCallback(filePath, numberDone[0], totalScores, status)
+
+    fileHashes = {}
+    checkpointFile = None
+    toIndex = []
+    if checkpointFilePath is not None:
+        unused, savedFiles = loadScoreDictCheckpoint(checkpointFilePath)
+        endsWithNewline = True
+        if os.path.exists(checkpointFilePath):
+            with open(checkpointFilePath, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    endsWithNewline = (f.read(1) == '\n')
+        checkpointFile = open(checkpointFilePath, 'ab')
+        if not endsWithNewline:
+            # end a line left incomplete by an interrupted run
+            checkpointFile.write('\n')
     for filePath in scoreFilePaths:
         shortfp = filePath.split(os.sep)[-1]
-        if giveUpdates is True:
-            print "Indexing %s (%d/%d)" % (
-                shortfp, scoreIndex, totalScores)
-        scoreIndex += 1
-        try:
-            if not os.path.isabs(filePath):
-                scoreObj = corpus.parse(filePath)
-            else:
-                scoreObj = converter.parse(filePath)
-            scoreDict[shortfp] = indexScoreParts(scoreObj, *args, **kwds)
-        except:
-            print "Failed on parse for: %s" % filePath
+        if checkpointFile is not None:
+            fileHash = _getFileHash(filePath)
+            fileHashes[filePath] = fileHash
+            if (fileHash is not None and filePath in savedFiles and
+                savedFiles[filePath][0] == fileHash):
+                scoreDict[shortfp] = savedFiles[filePath][1]
+                finishFile(filePath, 'skipped')
+                continue
+        toIndex.append(filePath)
+
+    if workers is None:
+        workers = multiprocessing.cpu_count() - 1
+    workers = min(workers, len(toIndex))
+    jobs = [(filePath, args, kwds) for filePath in toIndex]
+    pool = None
+    try:
+        if workers <= 1:
+            results = (_indexScoreFileJob(job) for job in jobs)
+        else:
+            pool = multiprocessing.Pool(processes=workers)
+            # chunksize of 1, as files can differ greatly in size
+            results = pool.imap_unordered(_indexScoreFileJob, jobs, 1)
+        for job in jobs:
+            if giveUpdates is True and pool is None:
+                print "Indexing %s (%d/%d)" % (
+                    job[0].split(os.sep)[-1], numberDone[0], totalScores)
+            filePath, indexedList, error = next(results)
+            shortfp = filePath.split(os.sep)[-1]
+            if indexedList is None:
+                print "Failed on parse for: %s (%s)" % (filePath, error)
+                finishFile(filePath, 'failed')
+                continue
+            if giveUpdates is True and pool is not None:
+                print "Indexed %s (%d/%d)" % (
+                    shortfp, numberDone[0] + 1, totalScores)
+            scoreDict[shortfp] = indexedList
+            if checkpointFile is not None:
+                checkpointFile.write(json.dumps({'name': shortfp,
+                    'path': filePath, 'hash': fileHashes[filePath],
+                    'parts': indexedList}))
+                checkpointFile.write('\n')
+                checkpointFile.flush()
+            finishFile(filePath, 'indexed')
+        if pool is not None:
+            pool.close()
+    except:
+        if pool is not None:
+            pool.terminate()
+        raise
+    finally:
+        if pool is not None:
+            pool.join()
+        if checkpointFile is not None:
+            checkpointFile.close()
     return scoreDict
 
 
+def loadScoreDictCheckpoint(filePath):
+    '''
+    Load the scores written to the `checkpointFilePath` of
+    indexScoreFilePaths and return a tuple of a scoreDict and of a
+    dictionary, keyed by the path of each file that they were indexed
+    from, of a tuple of the hash of the file and the indexed parts. If the
+    file does not exist, both dictionaries are empty.
+
+    The file has one JSON object per line; if a score appears more than
+    once, the last one is used. A line which was not completely written
+    (if indexing was interrupted) is ignored.
+
+    >>> search.segment.loadScoreDictCheckpoint('/no/such/file.json')
+    ({}, {})
+    '''
+    scoreDict = {}
+    savedFiles = {}
+    if not os.path.exists(filePath):
+        return (scoreDict, savedFiles)
+    with open(filePath, 'rb') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            scoreDict[entry['name']] = entry['parts']
+            savedFiles[entry['path']] = (entry['hash'], entry['parts'])
+    return (scoreDict, savedFiles)
+
+
 def saveScoreDict(scoreDict, filePath=None):
     '''
     Save the score dict from indexScoreFilePaths as a .json file for quickly
@@ -239,6 +444,167 @@ def loadScoreDict(filePath):
     return scoreDict
 
 
+def _getNGrams(segment, n):
+    '''
+    Return a set of the distinct substrings of length `n` in `segment`.
+
+    >>> sorted(search.segment._getNGrams('ABCABD', 3))
+    ['ABC', 'ABD', 'BCA', 'CAB']
+    '''
+    return set(segment[i:i + n] for i in range(len(segment) - n + 1))
+
+
+def indexNGrams(scoreDict, n=3, ngramIndex=None):
+    '''
+    Build an inverted index of the segments in a scoreDict from
+    indexScoreFilePaths: for each substring of `n` characters (an n-gram),
+    the index stores the segments in which it is found. The index is a
+    dictionary, which can be saved with saveNGramIndex and searched with
+    searchNGramIndex.
+
+    If `ngramIndex` is given, the scores in `scoreDict` are added to it
+    (replacing scores with the same name), so that an index can be updated
+    as files are added without indexing the rest again.
+
+    >>> luca = corpus.parse('luca/gloria')
+    >>> scoreDict = {'gloria': search.segment.indexScoreParts(luca)}
+    >>> ngramIndex = search.segment.indexNGrams(scoreDict)
+    >>> ngramIndex['n']
+    3
+    >>> len(ngramIndex['segments'])
+    47
+    >>> ngramIndex['segments'][0]
+    ['gloria', 0, 0, 1, 'HJHEAAEHHCE@JHGECA@A>@A><A@AAE']
+    >>> ngramIndex['postings']['HJH']
+    [0, 1, 9]
+
+    Each segment is a list of the score name, the part number, the
+    segment number, the measure number, and the segment itself.
+
+    Indexing a score again replaces its segments:
+
+    >>> ngramIndex = search.segment.indexNGrams(scoreDict, ngramIndex=ngramIndex)
+    >>> len(ngramIndex['scores']['gloria'])
+    47
+    >>> ngramIndex['postings']['HJH']
+    [47, 48, 56]
+    '''
+    if ngramIndex is None:
+        ngramIndex = {'n': n, 'segments': [], 'scores': {}, 'postings': {}}
+    elif ngramIndex['n'] != n:
+        from music21 import search
+        raise search.SearchException(
+            'cannot add %s-grams to an index of %s-grams' % (n, ngramIndex['n']))
+    segments = ngramIndex['segments']
+    scores = ngramIndex['scores']
+    postings = ngramIndex['postings']
+
+    for scoreKey in scoreDict:
+        # remove a score that has been indexed before
+        for segmentId in scores.get(scoreKey, []):
+            for ngram in _getNGrams(segments[segmentId][4], n):
+                postings[ngram].remove(segmentId)
+                if len(postings[ngram]) == 0:
+                    del postings[ngram]
+            segments[segmentId] = None
+        segmentIds = []
+        for pNum, partDict in enumerate(scoreDict[scoreKey]):
+            for segmentNumber, segment in enumerate(partDict['segmentList']):
+                segmentId = len(segments)
+                segments.append([scoreKey, pNum, segmentNumber,
+                    partDict['measureList'][segmentNumber], segment])
+                segmentIds.append(segmentId)
+                for ngram in _getNGrams(segment, n):
+                    if ngram not in postings:
+                        postings[ngram] = []
+                    postings[ngram].append(segmentId)
+        scores[scoreKey] = segmentIds
+    return ngramIndex
+
+
+def saveNGramIndex(ngramIndex, filePath=None):
+    '''
+    Save the index from indexNGrams as a .json file for quickly reloading
+
+    Returns the filepath (assumes you'll probably be using a temporary file)
+    '''
+    return saveScoreDict(ngramIndex, filePath)
+
+
+def loadNGramIndex(filePath):
+    '''
+    Load the index from indexNGrams from filePath
+    '''
+    return loadScoreDict(filePath)
+
+
+def searchNGramIndex(
+    ngramIndex, 
+    query, 
+    topK=10, 
+    candidateCount=None, 
+    algorithm=None, 
+    forceDifflib=False,
+    ):
+    '''
+    Find the `topK` segments in an index from indexNGrams that are most
+    similar to `query`, a segment string or a Stream of notes. A Stream is
+    translated to a string with `algorithm` (by default 
+    music21.search.translateStreamToStringNoRhythm), which should be the
+    algorithm that the indexed segments were made with.
+
+    The `candidateCount` segments (by default, ten times `topK`) that share
+    the most n-grams with the query are found with the index; only these
+    are compared with the query, using the same ratio as scoreSimilarity.
+
+    Returns a list of tuples of score name, voice number, segment number,
+    measure number, and similarity (0 to 1), most similar first.
+
+    >>> luca = corpus.parse('luca/gloria')
+    >>> scoreDict = {'gloria': search.segment.indexScoreParts(luca)}
+    >>> ngramIndex = search.segment.indexNGrams(scoreDict)
+    >>> query = luca.parts[1].measures(1, 8).flat.notes
+    >>> for result in search.segment.searchNGramIndex(ngramIndex, query, 
+    ...        topK=3, forceDifflib=True):
+    ...     result
+    ('gloria', 1, 0, 1, 0.723...)
+    ('gloria', 1, 1, 9, 0.468...)
+    ('gloria', 1, 4, 32, 0.468...)
+    '''
+    if not common.isStr(query):
+        if algorithm is None:
+            from music21 import search
+            algorithm = search.translateStreamToStringNoRhythm
+        query = algorithm(query)
+    if candidateCount is None:
+        candidateCount = 10 * topK
+    segments = ngramIndex['segments']
+    postings = ngramIndex['postings']
+
+    # count the n-grams that each segment shares with the query
+    sharedCounts = {}
+    for ngram in _getNGrams(query, ngramIndex['n']):
+        for segmentId in postings.get(ngram, []):
+            sharedCounts[segmentId] = sharedCounts.get(segmentId, 0) + 1
+    if len(sharedCounts) == 0:
+        # a query shorter than n, or with no n-gram in the index
+        candidateIds = [i for i in range(len(segments))
+                        if segments[i] is not None]
+    else:
+        candidateIds = heapq.nlargest(candidateCount, sharedCounts,
+            key=lambda i: (sharedCounts[i], -i))
+
+    results = []
+    dl = getDifflibOrPyLev(query, forceDifflib=forceDifflib)
+    for segmentId in candidateIds:
+        scoreKey, pNum, segmentNumber, measureNumber, segment = segments[segmentId]
+        dl.set_seq1(segment)
+        results.append((-dl.ratio(), segmentId, 
+            (scoreKey, pNum, segmentNumber, measureNumber)))
+    return [info + (-negativeRatio,) for negativeRatio, unused_segmentId, info
+            in heapq.nsmallest(topK, results)]
+
+
 def getDifflibOrPyLev(
     seq2=None, 
     junk=None, 
@@ -359,7 +725,206 @@ def scoreSimilarity(
     #import pprint
     #pprint.pprint(similarityScores)
     return similarityScores
-    
+
+
+def _getMatchMasks(segment):
+    '''
+    Return a dictionary mapping each character of `segment` to an integer
+    with bit i set wherever that character is at position i, for
+    _getLCSLength.
+
+    >>> masks = search.segment._getMatchMasks('ABAC')
+    >>> sorted((c, bin(m)) for c, m in masks.items())
+    [('A', '0b101'), ('B', '0b10'), ('C', '0b1000')]
+    '''
+    masks = {}
+    bit = 1
+    for c in segment:
+        masks[c] = masks.get(c, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def _getLCSLength(masks, length, other):
+    '''
+    Return the length of the longest common subsequence of a segment of
+    `length` characters, whose masks from _getMatchMasks are `masks`, and
+    of the string `other`. This uses the bit-parallel algorithm of Hyyrö
+    (2004), which treats a row of the dynamic programming table as the bits
+    of one integer, and thus needs only a few integer operations per
+    character of `other`.
+
+    >>> masks = search.segment._getMatchMasks('ABCBDAB')
+    >>> search.segment._getLCSLength(masks, 7, 'BDCABA')
+    4
+    >>> search.segment._getLCSLength(masks, 7, '')
+    0
+    '''
+    allBits = (1 << length) - 1
+    v = allBits
+    for c in other:
+        u = v & masks.get(c, 0)
+        v = ((v + u) | (v - u)) & allBits
+    return length - bin(v).count('1')
+
+
+def _scoreSimilarityMatrixRows(job):
+    '''
+    Compute rows `start` to `stop` of the upper triangle of the matrix of
+    scoreSimilarityMatrix, possibly in a worker process. Returns a list of
+    (row, column, ratio) triples, omitting ratios below
+    `minimumSimilarity`.
+    '''
+    segments, start, stop, minimumSimilarity = job
+    if minimumSimilarity is None:
+        minimumSimilarity = 0.0
+    post = []
+    for i in range(start, stop):
+        thisSegment = segments[i]
+        thisLength = len(thisSegment)
+        masks = _getMatchMasks(thisSegment)
+        for j in range(i + 1, len(segments)):
+            thatSegment = segments[j]
+            lengthSum = thisLength + len(thatSegment)
+            # the common subsequence cannot be longer than the shorter
+            # segment, which bounds the ratio without computing it
+            if 2.0 * min(thisLength, len(thatSegment)) < (
+                    minimumSimilarity * lengthSum):
+                continue
+            ratio = 2.0 * _getLCSLength(masks, thisLength, thatSegment) / lengthSum
+            if ratio >= minimumSimilarity:
+                post.append((i, j, ratio))
+    return post
+
+
+def scoreSimilarityMatrix(
+    scoreDict,
+    minimumLength=20,
+    minimumSimilarity=None,
+    sparse=False,
+    chunkSize=200,
+    workers=1,
+    giveUpdates=False,
+    ):
+    r'''
+    Find the level of similarity between each pair of segments in a
+    scoreDict, as a matrix, for clustering all the segments of a large
+    collection at once.
+
+    Returns a tuple of a list of the segments, each a tuple of the score
+    name, voice number, segment number, and measure number, and the
+    matrix, where item [i][j] is the similarity (0 to 1) of segments i and
+    j. Segments shorter than `minimumLength` are omitted.
+
+    The similarity is 2 * M / T, where M is the length of the longest
+    common subsequence of the two segments, and T is the total length of
+    both (this is the ratio given by pyLevenshtein, and is close to that of
+    difflib). Each pair is only compared once, and each comparison is
+    done with a bit-parallel algorithm, so this is much faster than
+    scoreSimilarity.
+
+    >>> luca = corpus.parse('luca/gloria')
+    >>> scoreDict = {'gloria': search.segment.indexScoreParts(luca)}
+    >>> segments, matrix = search.segment.scoreSimilarityMatrix(scoreDict)
+    >>> len(segments)
+    44
+    >>> segments[0]
+    ('gloria', 0, 0, 1)
+    >>> len(matrix), len(matrix[0])
+    (44, 44)
+    >>> matrix[0][0]
+    1.0
+    >>> matrix[0][1] == matrix[1][0]
+    True
+    >>> print(round(matrix[0][1], 3))
+    0.4
+
+    If `sparse` is True, the matrix is instead a dictionary of the pairs
+    (i, j), with i < j, whose similarity is at least `minimumSimilarity`,
+    which keeps the memory needed for many segments down. Pairs which
+    cannot reach `minimumSimilarity` because of the lengths of their
+    segments are skipped without comparing them:
+
+    >>> segments, pairs = search.segment.scoreSimilarityMatrix(scoreDict,
+    ...     minimumSimilarity=0.6, sparse=True)
+    >>> len(pairs)
+    13
+    >>> sorted(pairs.items())[:3]
+    [((5, 9), 0.6), ((6, 7), 0.6), ((11, 14), 0.6)]
+
+    The rows are computed in chunks of about as many comparisons as
+    `chunkSize` rows of average length, in a pool of `workers` processes if
+    `workers` is more than 1 (None uses 1 fewer process than the number of
+    available cores).
+
+    >>> segments, matrix2 = search.segment.scoreSimilarityMatrix(scoreDict,
+    ...     chunkSize=10, workers=2)
+    >>> matrix2 == matrix
+    True
+    '''
+    segmentList = []
+    segments = []
+    for scoreKey in sorted(scoreDict.keys()):
+        for pNum, partDict in enumerate(scoreDict[scoreKey]):
+            for segmentNumber, segment in enumerate(partDict['segmentList']):
+                if len(segment) < minimumLength:
+                    continue
+                segmentList.append((scoreKey, pNum, segmentNumber,
+                    partDict['measureList'][segmentNumber]))
+                segments.append(segment)
+
+    totalSegments = len(segments)
+    if sparse is True:
+        matrix = {}
+    else:
+        matrix = [[0.0] * totalSegments for unused in range(totalSegments)]
+        for i in range(totalSegments):
+            matrix[i][i] = 1.0
+    # row i compares segment i with the totalSegments - i - 1 segments
+    # after it; later rows are shorter, so size the chunks by comparisons
+    pairsPerChunk = max(chunkSize * (totalSegments - 1) // 2, 1)
+    jobs = []
+    start = 0
+    pairs = 0
+    for i in range(totalSegments):
+        pairs += totalSegments - i - 1
+        if pairs >= pairsPerChunk or i == totalSegments - 1:
+            jobs.append((segments, start, i + 1, minimumSimilarity))
+            start = i + 1
+            pairs = 0
+
+    if workers is None:
+        workers = multiprocessing.cpu_count() - 1
+    workers = min(workers, len(jobs))
+    pool = None
+    try:
+        if workers <= 1:
+            results = (_scoreSimilarityMatrixRows(job) for job in jobs)
+        else:
+            pool = multiprocessing.Pool(processes=workers)
+            results = pool.imap_unordered(_scoreSimilarityMatrixRows, jobs, 1)
+        for jobNumber in range(len(jobs)):
+            if giveUpdates is True:
+                print "Comparing chunk {0}/{1}".format(
+                    jobNumber + 1, len(jobs))
+            for i, j, ratio in next(results):
+                if sparse is True:
+                    matrix[(i, j)] = ratio
+                else:
+                    matrix[i][j] = ratio
+                    matrix[j][i] = ratio
+        if pool is not None:
+            pool.close()
+    except:
+        if pool is not None:
+            pool.terminate()
+        raise
+    finally:
+        if pool is not None:
+            pool.join()
+    return (segmentList, matrix)
+
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = []
@@ -20,6 +20,7 @@ and :class:`~music21.stream.Score` objects, are defined in
 this module.
 '''
 
+import bisect
 import copy
 import unittest
 import sys
@@ -49,11 +50,17 @@ from music21 import tempo
 from music21 import environment
 
 import makeNotation
+import offsetIndex
 import streamStatus
+import streamView
 
 _MOD = "stream.py"
 environLocal = environment.Environment(_MOD)
 
+# offsets used in a linear search are cleaned up with common.cleanupFloat(),
+# so searches in an offset index must allow for this difference
+_OFFSET_INDEX_TOLERANCE = 0.002
+
 #------------------------------------------------------------------------------
 
 
@@ -64,6 +71,29 @@ class StreamException(exceptions21.Music21Exception):
 #------------------------------------------------------------------------------
 
 
+class _StreamBatchEdit(object):
+    '''
+    Context manager returned by :meth:`~music21.stream.Stream.batchEdit`.
+    '''
+    def __init__(self, srcStream):
+        self.srcStream = srcStream
+
+    def __enter__(self):
+        self.srcStream._batchEditDepth += 1
+        return self.srcStream
+
+    def __exit__(self, excType, excValue, traceback):
+        srcStream = self.srcStream
+        srcStream._batchEditDepth -= 1
+        if srcStream._batchEditDepth == 0 and srcStream._batchEditPending:
+            srcStream._batchEditPending = False
+            srcStream._notifyElementsChanged()
+        return False
+
+
+#------------------------------------------------------------------------------
+
+
 class StreamIterator(object):
     '''
     An Iterator object used to handle getting items from Streams.
@@ -309,6 +339,15 @@ class Stream(base.Music21Object):
 
         self._cache = {}
 
+        # depth of nested batchEdit() blocks, and whether Streams that
+        # depend on this Stream need to be informed at their end
+        self._batchEditDepth = 0
+        self._batchEditPending = False
+
+        # in a Stream made by sharedCopy(), a dict, shared by all Streams of
+        # the copy, of the elements still shared with the source
+        self._sharedCopyState = None
+
         #self.analysisData = defaultdict(list)
         #self.analysisData['ResultDict'] = defaultdict(dict)
 
@@ -462,12 +501,23 @@ class Stream(base.Music21Object):
     # most will set isSorted to False
 
     def _elementsChanged(self, updateIsFlat=True, clearIsSorted=True,
-        memo=None, keepIndex=False):
+        memo=None, keepIndex=False, keepClassIndex=False, notify=True):
         '''
         This method is called any time the elements in the Stream are changed.
 
         The various arguments permit optimizing the clearing of cached data in situations when completely dropping all cached data is excessive.
 
+        If `keepClassIndex` is True, the class index (see
+        :meth:`~music21.stream.Stream._getClassIndex`) is retained; this
+        is only correct if elements have been added to the end of
+        `_elements` or `_endElements` and the index has been updated with
+        :meth:`~music21.stream.Stream._updateClassIndex`.
+
+        If `notify` is False, the Streams that depend on this Stream (see
+        :meth:`~music21.stream.Stream._notifyElementsChanged`) are not
+        informed of the change; this is only correct if the elements and
+        their offsets are unchanged, as when sorting.
+
 
         >>> a = stream.Stream()
         >>> a.isFlat
@@ -481,20 +531,8 @@ class Stream(base.Music21Object):
         if not self._mutable:
             return
 
-        if memo is None:
-            memo = []
-        memo.append(id(self))
-        # if this Stream is a flat representation of something, and its
-        # elements have changed, than we must clear the cache of that
-        # ancestor; we can do that by calling _elementsChanged on
-        # flattenedRepresentationOf
-        if self.flattenedRepresentationOf is not None:
-            self.flattenedRepresentationOf._elementsChanged(memo=memo)
-
-        # may not always need to clear cache of the active site, but may
-        # be a good idea; may need to intead clear all sites
-        if self.activeSite is not None:
-            self.activeSite._elementsChanged()
+        if notify:
+            self._notifyElementsChanged(memo)
 
         # clear these attributes for setting later
         if clearIsSorted:
@@ -514,12 +552,171 @@ class Stream(base.Music21Object):
         # resetting the cache removes lowest and highest time storage
         # a slight performance optimization: not creating unless needed
         if len(self._cache) > 0:
+            indexCache = None
             if keepIndex and 'index' in self._cache:
                 indexCache = self._cache['index']
+            classIndexCache = None
+            if keepClassIndex and 'classIndex' in self._cache:
+                classIndexCache = self._cache['classIndex']
             # alway clear cache when elements have changed
             self._cache = {} #common.DefaultHash()
-            if keepIndex:
+            if indexCache is not None:
                 self._cache['index'] = indexCache
+            if classIndexCache is not None:
+                self._cache['classIndex'] = classIndexCache
+
+    def _notifyElementsChanged(self, memo=None):
+        '''
+        Clear the caches of the Streams whose contents depend on the
+        elements of this Stream: the Stream of which this is a flat
+        representation, and all Streams in which this Stream is a site
+        (not only the active site). Within a
+        :meth:`~music21.stream.Stream.batchEdit` block, this is deferred
+        until the block is exited.
+
+        The sorted and flat status of those Streams is not changed, as
+        neither depends on the contents of this Stream.
+
+        >>> p = stream.Part()
+        >>> m = stream.Measure()
+        >>> p.insert(0, m)
+        >>> measures = p.getElementsByClass('Measure') # sets m.activeSite
+        >>> len(p.flat)
+        0
+        >>> m.insert(0, note.Note())
+        >>> len(p.flat)
+        1
+        '''
+        if self._batchEditDepth > 0:
+            self._batchEditPending = True
+            return
+        if memo is None:
+            memo = []
+        memo.append(id(self))
+        # if this Stream is a flat representation of something, and its
+        # elements have changed, than we must clear the cache of that
+        # ancestor
+        dependents = self.sites.getSites(excludeNone=True)
+        if self.flattenedRepresentationOf is not None:
+            dependents.append(self.flattenedRepresentationOf)
+        for site in dependents:
+            if id(site) in memo or not getattr(site, 'isStream', False):
+                continue
+            site._elementsChanged(updateIsFlat=False, clearIsSorted=False,
+                memo=memo)
+
+    def _elementsAppended(self, appended, notify=True):
+        '''
+        Called in place of `_elementsChanged` when the elements in the list
+        `appended` have been added, in order, to the end of `_elements`,
+        at offsets no lower than that of any other element, such that the
+        sorted status of the Stream does not change.
+
+        Rather than dropping all cached data, cached values that can be
+        updated incrementally (highest time and offset, the class index,
+        and `.flat` and `.semiFlat` representations) are kept and
+        updated. If `notify` is False, the Streams that depend on this
+        Stream are not informed of the change.
+
+        A cached `.flat` is only extended once it has been sorted, as
+        happens when it is iterated over.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('C4', type='half'), 2)
+        >>> sFlat = s.flat
+        >>> sFlat.sort()
+        >>> s.highestTime
+        4.0
+        >>> s.append(note.Note('D4'))
+        >>> s.flat is sFlat
+        True
+        >>> len(sFlat), sFlat.highestTime
+        (3, 5.0)
+        '''
+        # experimental
+        if not self._mutable:
+            return
+        if notify:
+            self._notifyElementsChanged()
+
+        appendedStream = False
+        for e in appended:
+            if e.isStream:
+                appendedStream = True
+                self.isFlat = False
+        if len(self._cache) == 0:
+            return
+
+        oldCache = self._cache
+        self._cache = {}
+        if 'classIndex' in oldCache:
+            self._cache['classIndex'] = oldCache['classIndex']
+        # positions of end elements change when elements are appended
+        if 'index' in oldCache and len(self._endElements) == 0:
+            self._cache['index'] = oldCache['index']
+
+        highestOffset = oldCache.get('HighestOffset')
+        highestTime = oldCache.get('HighestTime')
+        offsets = []
+        for e in appended:
+            offset = e.getOffsetBySite(self)
+            offsets.append(offset)
+            if highestOffset is not None and offset > highestOffset:
+                highestOffset = offset
+            end = offset + e.duration.quarterLength
+            if highestTime is not None and end > highestTime:
+                highestTime = end
+        if highestOffset is not None:
+            self._cache['HighestOffset'] = highestOffset
+        if highestTime is not None:
+            self._cache['HighestTime'] = highestTime
+
+        if appendedStream: # flat and semiFlat must be rebuilt
+            return
+        for key in ('flat', 'semiFlat'):
+            flatStream = oldCache.get(key)
+            if flatStream is None or not flatStream.isSorted:
+                continue
+            flatElements = flatStream._elements
+            if (len(flatElements) > 0 and offsets[0] <=
+                flatElements[-1].getOffsetBySite(flatStream)):
+                # sort order among equal offsets is not known
+                continue
+            for offset, e in zip(offsets, appended):
+                flatStream._insertCore(offset, e, ignoreSort=True,
+                    setActiveSite=False)
+            flatStream._elementsAppended(appended, notify=False)
+            self._cache[key] = flatStream
+
+    def batchEdit(self):
+        '''
+        Return a context manager, for use in a `with` statement, that
+        defers informing the Streams that depend on this Stream (its active
+        site, and the Stream that it is a flat representation of) of
+        changes to its elements until the end of the block. This avoids
+        repeatedly clearing the caches of enclosing Streams when building
+        a Stream one element at a time.
+
+        Within the block, this Stream itself is always up to date, but
+        enclosing Streams may return stale cached results.
+
+        >>> p = stream.Part()
+        >>> m = stream.Measure()
+        >>> p.append(m)
+        >>> p.flat.highestTime
+        0.0
+        >>> with m.batchEdit():
+        ...     for i in range(4):
+        ...         m.append(note.Note('E4'))
+        >>> m.highestTime
+        4.0
+        >>> p.flat.highestTime
+        4.0
+
+        Blocks may be nested; informing happens at the end of the
+        outermost block.
+        '''
+        return _StreamBatchEdit(self)
 
     def _getElements(self):
         '''
@@ -715,8 +912,16 @@ class Stream(base.Music21Object):
         '''Manually set the Stream that this Stream was derived from. This operation is generally completed automatically.
 
         See :class:`~music21.derivation.Derivation` for more information.
+
+        A Stream derived from part of a copy made with
+        :meth:`~music21.stream.Stream.sharedCopy`, such as its `.flat` or
+        the result of `getElementsByClass`, holds the same elements as the
+        copy, so it also unshares them before changing them in place.
         '''
         self._derivation.setAncestor(target)
+        state = getattr(target, '_sharedCopyState', None)
+        if state is not None:
+            self._sharedCopyState = state
 
     def _getDerivation(self):
         '''Return a reference to the Stream that created this Stream, if such a Stream exists.
@@ -856,6 +1061,11 @@ class Stream(base.Music21Object):
         False
         '''
         #environLocal.printDebug(['calling hasElementOfClass()', className])
+        # only use the class index if already built: a linear scan that
+        # stops at the first match is cheaper than building the index
+        if 'classIndex' in self._cache and self._isClassIndexCurrent():
+            elementsIndex, endElementsIndex = self._cache['classIndex'][1:]
+            return className in elementsIndex or className in endElementsIndex
         for e in self._elements:
             if e.isClassOrSubclass([className]):
                 return True
@@ -866,6 +1076,94 @@ class Stream(base.Music21Object):
 
 
 
+    def _isClassIndexCurrent(self):
+        '''
+        Return True if the class index stored in the cache was built for the
+        present `_elements` and `_endElements` lists of this Stream.
+
+        Shallow copies of a Stream (such as those created by `.sorted`
+        and `.flat`) may share the cache dictionary, but never the element
+        lists, of the Stream they were copied from.
+        '''
+        classIndex = self._cache.get('classIndex')
+        if classIndex is None:
+            return False
+        elementsRef, endElementsRef = classIndex[0]
+        return (elementsRef is self._elements and
+                endElementsRef is self._endElements)
+
+    def _getClassIndex(self):
+        '''
+        Return a pair of dictionaries mapping each class name found in the
+        `.classes` of contained elements to a list of the index positions of
+        those elements in `_elements` and `_endElements`, respectively.
+
+        The index is built once in a single pass and stored in the cache;
+        it is extended in place by `_insertCore`, `_appendCore`, `append`, and
+        `_storeAtEndCore`, and dropped by any other change to the elements
+        (such as sorting or removing), after which it is rebuilt on demand.
+
+
+        >>> s = stream.Stream()
+        >>> s.append(meter.TimeSignature('3/4'))
+        >>> s.repeatAppend(note.Note('E4'), 2)
+        >>> s.append(note.Rest())
+        >>> elementsIndex, endElementsIndex = s._getClassIndex()
+        >>> elementsIndex['Note']
+        [1, 2]
+        >>> elementsIndex['GeneralNote']
+        [1, 2, 3]
+        >>> elementsIndex['TimeSignature']
+        [0]
+        >>> endElementsIndex
+        {}
+
+        Appending keeps the index current without rebuilding it:
+
+        >>> s.append(note.Note('F4'))
+        >>> s._getClassIndex()[0]['Note']
+        [1, 2, 4]
+        '''
+        if not self._isClassIndexCurrent():
+            elementsIndex = {}
+            for i, e in enumerate(self._elements):
+                for className in e.classes:
+                    try:
+                        elementsIndex[className].append(i)
+                    except KeyError:
+                        elementsIndex[className] = [i]
+            endElementsIndex = {}
+            for i, e in enumerate(self._endElements):
+                for className in e.classes:
+                    try:
+                        endElementsIndex[className].append(i)
+                    except KeyError:
+                        endElementsIndex[className] = [i]
+            self._cache['classIndex'] = (
+                (self._elements, self._endElements),
+                elementsIndex, endElementsIndex)
+        return self._cache['classIndex'][1:]
+
+    def _updateClassIndex(self, element, atEnd=False):
+        '''
+        If a class index has been built, add an element that has just
+        been appended to `_elements` (or to `_endElements` if `atEnd` is
+        True). Otherwise, do nothing: the index will be built when needed.
+        '''
+        if 'classIndex' not in self._cache or not self._isClassIndexCurrent():
+            return
+        if atEnd:
+            index = self._cache['classIndex'][2]
+            position = len(self._endElements) - 1
+        else:
+            index = self._cache['classIndex'][1]
+            position = len(self._elements) - 1
+        for className in element.classes:
+            try:
+                index[className].append(position)
+            except KeyError:
+                index[className] = [position]
+
     def _hasElementByObjectId(self, objId):
         '''Return True if an element object id, provided as an argument, is contained in this Stream.
 
@@ -1297,6 +1595,8 @@ class Stream(base.Music21Object):
                 setattr(new, name, newValue)
             elif name == '_cache' or name == 'analysisData':
                 continue # skip for now
+            elif name == '_sharedCopyState':
+                continue # a copy shares nothing
             elif name == '_elements':
                 # must manually add elements to new Stream
                 for e in self._elements:
@@ -1348,7 +1648,12 @@ class Stream(base.Music21Object):
         # it is likely that this only needs to be done at the highest
         # level of recursion, not on component Streams
         #spannerBundle = spanner.SpannerBundle(new.flat.spanners)
-        spannerBundle = new.spannerBundle
+        # (sharedCopy() does this itself, as elements other than Streams
+        # are not copied)
+        if memo is not None and '_sharedCopy' in memo:
+            spannerBundle = ()
+        else:
+            spannerBundle = new.spannerBundle
         # only proceed if there are spanners, otherwise creating semiFlat
         if len(spannerBundle) > 0:
             # iterate over complete semi flat (need containers); find
@@ -1394,6 +1699,191 @@ class Stream(base.Music21Object):
 
         return new
 
+    def sharedCopy(self):
+        '''
+        Return a copy of this Stream in which all Streams (Parts, Measures,
+        Voices, and so on) and Spanners are new, but all other elements
+        are shared with this Stream instead of being copied. Copying a Score
+        thus costs about as much as copying its Measures, however many
+        Notes it has.
+
+        An element shared with the source must not be changed through the
+        copy: first call :meth:`~music21.stream.Stream.unshareElement` (or
+        :meth:`~music21.stream.Stream.unshareElements`) on the copy, or on
+        any Stream in it. Stream methods that change elements in place, such
+        as transpose, stripTies, makeBeams, makeAccidentals, and
+        augmentOrDiminish, do so already. Any other change to a shared
+        element, through the copy or through the source, is seen by both.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> s2 = s.sharedCopy()
+        >>> m1 = s.parts[0].getElementsByClass('Measure')[1]
+        >>> m2 = s2.parts[0].getElementsByClass('Measure')[1]
+        >>> m2 is m1
+        False
+        >>> m2.notes[0] is m1.notes[0]
+        True
+
+        >>> s3 = s2.transpose('M2')
+        >>> m2.notes[0] is m1.notes[0]
+        True
+        >>> s2.transpose('M2', inPlace=True)
+        >>> m2.notes[0] is m1.notes[0]
+        False
+        >>> m2.notes[0], m1.notes[0]
+        (<music21.note.Note B>, <music21.note.Note A>)
+        '''
+        memo = {'_sharedCopy': True}
+        sharedElements = {}
+
+        def share(s):
+            for e in s._elements + s._endElements:
+                if e.isStream:
+                    share(e)
+                elif not e.isSpanner:
+                    memo[id(e)] = e
+                    sharedElements[id(e)] = e
+        share(self)
+
+        new = copy.deepcopy(self, memo)
+        state = {'elements': sharedElements, 'containers': {}, 'spanners': {}}
+
+        def register(s):
+            s._sharedCopyState = state
+            state['containers'][id(s)] = s
+            for e in s._elements + s._endElements:
+                if e.isStream:
+                    register(e)
+                elif e.isSpanner:
+                    state['spanners'][id(e)] = e
+        register(new)
+
+        # Spanners of the copy still span the Streams of the source
+        for sp in state['spanners'].values():
+            for e in sp.getSpannedElements():
+                if e.isStream and id(e) in memo:
+                    eNew = memo[id(e)]
+                    sp.replaceSpannedElement(e, eNew)
+                    eNew.purgeOrphans(excludeStorageStreams=False)
+        return new
+
+    def unshareElement(self, element):
+        '''
+        If `element` is shared by a copy made with
+        :meth:`~music21.stream.Stream.sharedCopy` (of which this Stream is
+        a part) and its source, replace it in the copy (and in this
+        Stream, if this is, for instance, a flat representation of the copy)
+        with a deepcopy, which Spanners of the copy then span instead, and
+        return the deepcopy. Otherwise return `element`.
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note('C4'))
+        >>> s.append(note.Note('D4'))
+        >>> slur = spanner.Slur(s.notes[0], s.notes[1])
+        >>> s.insert(0, slur)
+        >>> s2 = s.sharedCopy()
+        >>> n = s2.notes[1]
+        >>> n is s.notes[1]
+        True
+        >>> n2 = s2.unshareElement(n)
+        >>> n2 is n
+        False
+        >>> s2.notes[1] is n2, s2.getElementsByClass('Slur')[0].getLast() is n2
+        (True, True)
+        >>> s.notes[1] is n, slur.getLast() is n
+        (True, True)
+        >>> s2.unshareElement(n2) is n2
+        True
+        '''
+        state = self._sharedCopyState
+        if state is None or state['elements'].get(id(element)) is not element:
+            return element
+        del state['elements'][id(element)]
+        new = copy.deepcopy(element)
+        containers = state['containers']
+        for site in element.getSites():
+            if site is None:
+                continue
+            if site is self or containers.get(id(site)) is site:
+                site.replace(element, new, allTargetSites=False)
+        spanners = state['spanners']
+        for sp in element.getSpannerSites():
+            if spanners.get(id(sp)) is sp:
+                sp.replaceSpannedElement(element, new)
+        # remove the sites (and spanner sites) of the source
+        new.purgeOrphans(excludeStorageStreams=False)
+        return new
+
+    def unshareElements(self, classFilter=None):
+        '''
+        Call :meth:`~music21.stream.Stream.unshareElement` on every element
+        of this Stream, and of the Streams in it, that is shared by a copy
+        made with :meth:`~music21.stream.Stream.sharedCopy` and its source;
+        if `classFilter` is given, only on elements of those classes. The
+        Streams holding the elements are changed once, however many
+        elements they hold.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('C4'), 4)
+        >>> s.insert(0, clef.TrebleClef())
+        >>> s2 = s.sharedCopy()
+        >>> s2.unshareElements(['Note'])
+        >>> s2.notes[0] is s.notes[0], s2.notes[0] == s.notes[0]
+        (False, True)
+        >>> s2.getElementsByClass('Clef')[0] is s.getElementsByClass('Clef')[0]
+        True
+        '''
+        state = self._sharedCopyState
+        if state is None:
+            return
+        sharedElements = state['elements']
+        containers = state['containers']
+        replacements = {} # id of shared element: (element, deepcopy)
+
+        def collect(s):
+            for e in s._elements + s._endElements:
+                if e.isStream:
+                    collect(e)
+                elif (sharedElements.get(id(e)) is e and
+                    (classFilter is None or e.isClassOrSubclass(classFilter))):
+                    replacements[id(e)] = (e, None)
+        collect(self)
+        if not replacements:
+            return
+
+        sites = {}
+        for idElement, (e, unused) in replacements.items():
+            del sharedElements[idElement]
+            replacements[idElement] = (e, copy.deepcopy(e))
+            for site in e.getSites():
+                if site is None:
+                    continue
+                if site is self or containers.get(id(site)) is site:
+                    sites[id(site)] = site
+        for site in sites.values():
+            for elements, isEnd in ((site._elements, False),
+                (site._endElements, True)):
+                for i, e in enumerate(elements):
+                    if (id(e) not in replacements or
+                        replacements[id(e)][0] is not e):
+                        continue
+                    new = replacements[id(e)][1]
+                    elements[i] = new
+                    if isEnd:
+                        new.sites.add(site, 'highestTime')
+                    else:
+                        new.sites.add(site, e.getOffsetBySite(site))
+                    e.removeLocationBySite(site)
+            site._elementsChanged()
+        for sp in state['spanners'].values():
+            for e in sp.getSpannedElements():
+                if (id(e) in replacements and
+                    replacements[id(e)][0] is e):
+                    sp.replaceSpannedElement(e, replacements[id(e)][1])
+        # remove the sites (and spanner sites) of the source
+        for unused, new in replacements.values():
+            new.purgeOrphans(excludeStorageStreams=False)
+
     #---------------------------------------------------------------------------
     def _addElementPreProcess(self, element, checkRedundancy=True):
         '''
@@ -1444,12 +1934,22 @@ class Stream(base.Music21Object):
             # are still inserted
             if self.isSorted is True and self.highestTime <= offset:
                 storeSorted = True
+                # a zero-length element at this offset may need to sort
+                # after the new element
+                if len(self._elements) > 0:
+                    last = self._elements[-1]
+                    if (last.getOffsetBySite(self) == offset and
+                        (last.priority, last.classSortOrder,
+                        not last.isGrace) > (element.priority,
+                        element.classSortOrder, not element.isGrace)):
+                        storeSorted = False
         element.sites.add(self, float(offset))
         # need to explicitly set the activeSite of the element
         if setActiveSite:
             element.activeSite = self
         # will be sorted later if necessary
         self._elements.append(element)
+        self._updateClassIndex(element)
         return storeSorted
 
 
@@ -1554,14 +2054,108 @@ class Stream(base.Music21Object):
         # main insert procedure here
         storeSorted = self._insertCore(offset, element,
                      ignoreSort=ignoreSort, setActiveSite=setActiveSite)
+        if storeSorted and not ignoreSort:
+            # inserted after all other elements: sorted status is unchanged
+            self._elementsAppended([element])
+            return
         updateIsFlat = False
         if element.isStream:
             updateIsFlat = True
-        self._elementsChanged(updateIsFlat=updateIsFlat)
+        self._elementsChanged(updateIsFlat=updateIsFlat, keepClassIndex=True)
         if ignoreSort is False:
             self.isSorted = storeSorted
 
 
+    def _insertManyCore(self, offsetsAndElements, setActiveSite=True):
+        '''
+        Low level insertion of many elements; like `_insertCore`, does not
+        error check. `offsetsAndElements` is a list of (offset, element)
+        pairs.
+
+        Unlike `_insertCore`, the caller does not need to call
+        Stream._elementsChanged: it is called once after all elements are
+        inserted, and the Stream is sorted, if necessary, only when next
+        accessed.
+
+        >>> s = stream.Stream()
+        >>> s._insertManyCore([(2, note.Note('E')), (0, note.Note('C'))])
+        >>> s.isSorted
+        False
+        >>> [(n.offset, n.name) for n in s]
+        [(0.0, 'C'), (2.0, 'E')]
+        '''
+        for offset, element in offsetsAndElements:
+            self._insertCore(offset, element, ignoreSort=True,
+                setActiveSite=setActiveSite)
+        # isFlat is updated from all elements, as Streams built with
+        # _insertCore or _appendCore may not yet have updated it
+        self._elementsChanged(keepClassIndex=True)
+
+
+    def insertMany(self, offsetsAndElements, setActiveSite=True):
+        '''
+        Inserts many elements at once, given a list of (offset, element)
+        pairs.
+
+        The result is the same as calling :meth:`~music21.stream.Stream.insert`
+        for each pair, but elements are checked against those already in the
+        Stream in a single pass, and cached data is cleared (and Streams that
+        depend on this Stream informed) only once, making this much faster
+        for building large Streams.
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note('C'))
+        >>> s.insertMany([(3, note.Note('F')), (1.5, note.Note('E')),
+        ...     (1, note.Note('D'))])
+        >>> [(n.offset, n.name) for n in s]
+        [(0.0, 'C'), (1.0, 'D'), (1.5, 'E'), (3.0, 'F')]
+        >>> s.highestTime
+        4.0
+
+        As with `insert`, an element cannot be added twice:
+
+        >>> n = note.Note('G')
+        >>> s.insertMany([(4, n), (5, n)])
+        Traceback (most recent call last):
+        StreamException: the object (<music21.note.Note G>, id()=...) is already found in this Stream (<music21.stream.Stream ...>, id()=...)
+
+        OMIT_FROM_DOCS
+
+        Nothing is inserted if any pair is in error
+
+        >>> len(s)
+        4
+        >>> s.insertMany([(5, note.Note('A')), ('x', note.Note('B'))])
+        Traceback (most recent call last):
+        StreamException: offset x must be a number
+        >>> len(s)
+        4
+        '''
+        storedIds = set([id(e) for e in self._elements])
+        storedIds.update([id(e) for e in self._endElements])
+        pairs = []
+        for offset, element in offsetsAndElements:
+            try: # using float conversion instead of isNum for performance
+                offset = float(offset)
+            except (ValueError, TypeError):
+                if offset is None:
+                    offset = 0.0
+                else:
+                    raise StreamException("offset %s must be a number" % offset)
+            if not isinstance(element, base.Music21Object):
+                raise StreamException('to put a non Music21Object in a stream, create a music21.ElementWrapper for the item')
+            if element is self:
+                raise StreamException("this Stream cannot be contained within itself")
+            if id(element) in storedIds:
+                raise StreamException('the object (%s, id()=%s) is already found in this Stream (%s, id()=%s)' % (element, id(element), self, id(self)))
+            storedIds.add(id(element))
+            pairs.append((offset, element))
+
+        for unused_offset, element in pairs:
+            self._addElementPreProcess(element, checkRedundancy=False)
+        self._insertManyCore(pairs, setActiveSite=setActiveSite)
+
+
     def _appendCore(self, element):
         '''
         Low level appending; like `_insertCore` does not error check,
@@ -1576,6 +2170,7 @@ class Stream(base.Music21Object):
         # need to explicitly set the activeSite of the element
         element.activeSite = self
         self._elements.append(element)
+        self._updateClassIndex(element)
         # does not change sorted state
         if element.duration is not None:
             self._setHighestTime(self.highestTime +
@@ -1764,11 +2359,9 @@ class Stream(base.Music21Object):
         if not common.isListLike(others):
             # back into a list for list processing if single
             others = [others]
-        updateIsFlat = False
         for e in others:
             try:
-                if e.isStream: # any on that is a Stream req update
-                    updateIsFlat = True
+                e.isStream # only Music21Objects have this attribute
             except AttributeError:
                 raise StreamException("The object you tried to add to the Stream, %r, is not a Music21Object.  Use an ElementWrapper object if this is what you intend" % e)
             self._addElementPreProcess(e)
@@ -1778,17 +2371,15 @@ class Stream(base.Music21Object):
             # need to explicitly set the activeSite of the element
             e.activeSite = self
             self._elements.append(e)
+            self._updateClassIndex(e)
 
             # TODO: may need to be replaced with a common almost equal
             if e.duration.quarterLength != 0:
                 #environLocal.printDebug(['incrementing highest time', 'e.duration.quarterLength', e.duration.quarterLength])
                 highestTime += e.duration.quarterLength
 
-        # does not change sorted state
-        storeSorted = self.isSorted
-        # we cannot keep the index cache here b/c we might
-        self._elementsChanged(updateIsFlat=updateIsFlat)
-        self.isSorted = storeSorted
+        # does not change sorted state; cached data is updated, not cleared
+        self._elementsAppended(others)
         self._setHighestTime(highestTime) # call after to store in cache
 
 
@@ -1804,6 +2395,7 @@ class Stream(base.Music21Object):
         # could also do self.elements = self.elements + [element]
         #self._elements.append(element)
         self._endElements.append(element)
+        self._updateClassIndex(element, atEnd=True)
 
 
     def storeAtEnd(self, itemOrList, ignoreSort=False):
@@ -1853,7 +2445,7 @@ class Stream(base.Music21Object):
 
         self._storeAtEndCore(element)
         # Streams cannot reside in end elements, thus do not update is flat
-        self._elementsChanged(updateIsFlat=False)
+        self._elementsChanged(updateIsFlat=False, keepClassIndex=True)
 
 
     #---------------------------------------------------------------------------
@@ -2472,14 +3064,32 @@ class Stream(base.Music21Object):
         >>> len(foundList)
         25
 
+        If `returnStreamSubClass` == 'view' then a read-only
+        :class:`~music21.stream.streamView.StreamView` is returned: it finds
+        its elements only when first used, and does not add itself to
+        their sites, but can be used as a Stream in most contexts.
 
+        >>> foundView = a.getElementsByClass('Rest', returnStreamSubClass='view')
+        >>> len(foundView)
+        10
+        >>> r = foundView[0]
+        >>> siteCount = r.sites.getSiteCount()
+        >>> len(a.getElementsByClass('Rest', returnStreamSubClass='view'))
+        10
+        >>> r.sites.getSiteCount() == siteCount
+        True
+        >>> found = a.getElementsByClass('Rest')
+        >>> r.sites.isSite(found)
+        True
         '''
         # TODO: could add `domain` parameter to allow searching only _elements,
         # or _endElements, or both; possible performance hit
         # NOTE: this is a performance critical operation
         returnList = False
 
-        if returnStreamSubClass:
+        if returnStreamSubClass == 'view':
+            return streamView.StreamView(self, classFilterList=classFilterList)
+        elif returnStreamSubClass:
             try:
                 found = self.__class__()
                 # Copy measure number if measure object...
@@ -2504,12 +3114,17 @@ class Stream(base.Music21Object):
         if not isinstance(classFilterList, (list, tuple)):
             classFilterList = tuple([classFilterList])
 
+        # class names given as strings can be looked up in the class index,
+        # so that the cost is proportional to the number of matches;
+        # class objects need isinstance() and are matched by a full pass
+        allClassStrings = True
+        for className in classFilterList:
+            if not isinstance(className, str):
+                allClassStrings = False
+                break
+
         # if we are sure that this Stream does not have a class
-        singleClassString = False
-        if (len(classFilterList) == 1 and
-            isinstance(classFilterList[0], str)):
-            singleClassString = True
-        if singleClassString:
+        if allClassStrings and len(classFilterList) == 1:
             if not self.hasElementOfClass(classFilterList[0]):
                 found.isSorted = self.isSorted
                 return found
@@ -2520,6 +3135,26 @@ class Stream(base.Music21Object):
         if returnList is False:
             found.isSorted = self.isSorted
 
+        if allClassStrings:
+            elementsIndex, endElementsIndex = self._getClassIndex()
+            for positions, elements, isEnd in (
+                (self._getClassIndexPositions(elementsIndex, classFilterList),
+                    self._elements, False),
+                (self._getClassIndexPositions(endElementsIndex,
+                    classFilterList), self._endElements, True)):
+                for i in positions:
+                    e = elements[i]
+                    if returnList is True:
+                        found.append(e)
+                    elif isEnd:
+                        found._storeAtEndCore(e)
+                    else:
+                        found._insertCore(e.getOffsetBySite(self), e,
+                            ignoreSort=True)
+            if returnList is False:
+                found._elementsChanged()
+            return found
+
         # to use class cache, class must be provided as a string,
         # and there must be only one class
 #         if canUseClassCache:
@@ -2550,6 +3185,20 @@ class Stream(base.Music21Object):
             found._elementsChanged()
         return found
 
+    def _getClassIndexPositions(self, classIndex, classNames):
+        '''
+        Given one of the dictionaries returned by `_getClassIndex` and a
+        list of class names, return a sorted list of the positions of all
+        elements matching any of the names.
+        '''
+        if len(classNames) == 1:
+            return classIndex.get(classNames[0], [])
+        positions = set()
+        for className in classNames:
+            if className in classIndex:
+                positions.update(classIndex[className])
+        return sorted(positions)
+
     def getElementsNotOfClass(self, classFilterList, returnStreamSubClass = True):
         '''
         Return a list of all Elements that do not
@@ -2816,6 +3465,89 @@ class Stream(base.Music21Object):
 #        return max([g.priority for g in found])
 
 
+    def _getOffsetIndex(self):
+        '''
+        Return a tuple of the elements of this Stream (as in `.elements`)
+        and an :class:`~music21.stream.offsetIndex.OffsetIndex` of their
+        offsets and end times, or None if an index is not worth building.
+
+        A single linear search is cheaper than building the index, so the
+        index is only built the second time it is requested after the
+        elements of the Stream have changed. It is stored in the cache,
+        and is discarded by `_elementsChanged` or when the offset or
+        Duration (or the length of the Duration) of a contained element
+        is set.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> s._getOffsetIndex() is None
+        True
+        >>> elements, oi = s._getOffsetIndex()
+        >>> len(elements), len(oi)
+        (4, 4)
+        >>> s[2].offset = 20.0
+        >>> s._getOffsetIndex() is None
+        True
+        >>> elements, oi = s._getOffsetIndex()
+        >>> s[0].duration.quarterLength = 10
+        >>> s._getOffsetIndex() is None
+        True
+        '''
+        if not self.isSorted and self.autoSort:
+            self.sort() # will set isSorted to True
+        cached = self._cache.get('offsetIndex', False)
+        if cached is False:
+            # mark as requested; build on the next request
+            self._cache['offsetIndex'] = None
+            return None
+        if (cached is not None and cached[0][0] is self._elements and
+            cached[0][1] is self._endElements):
+            return cached[1:]
+
+        elements = self._elements + self._endElements
+        intervals = []
+        for i, e in enumerate(elements):
+            offset = e.getOffsetBySite(self)
+            intervals.append((offset, offset + e.duration.quarterLength, i))
+        self._cache['offsetIndex'] = ((self._elements, self._endElements),
+            elements, offsetIndex.OffsetIndex(intervals))
+        return self._cache['offsetIndex'][1:]
+
+    def _getOffsetIndexCandidatesBefore(self, offset, classList=None,
+        excludeOffset=False):
+        '''
+        Used by getElementAtOrBefore and getElementBeforeOffset: return,
+        in order of `.elements`, all elements that could be the last
+        element (of a class in `classList`) at or before `offset`,
+        or before it if `excludeOffset` is True.
+        '''
+        elementsAndIndex = self._getOffsetIndex()
+        if elementsAndIndex is None:
+            return self.elements
+        elements, oi = elementsAndIndex
+        i = oi.lastStartingAtOrBefore(offset + _OFFSET_INDEX_TOLERANCE)
+        positions = []
+        lastStart = None
+        while i >= 0:
+            start = oi.starts[i]
+            if lastStart is not None and start < lastStart - _OFFSET_INDEX_TOLERANCE:
+                break
+            position = oi.positions[i]
+            i -= 1
+            e = elements[position]
+            if classList is not None and not e.isClassOrSubclass(classList):
+                continue
+            span = offset - start
+            if excludeOffset and span <= 0:
+                continue
+            elif span < -.000000001:
+                continue
+            positions.append(position)
+            if lastStart is None:
+                lastStart = start
+        positions.sort()
+        return [elements[p] for p in positions]
+
     def getElementsByOffset(self, offsetStart, offsetEnd=None,
                     includeEndBoundary=True, mustFinishInSpan=False,
                     mustBeginInSpan=True, includeElementsThatEndAtStart = True, classList=None ):
@@ -2962,7 +3694,25 @@ class Stream(base.Music21Object):
         found.derivationMethod = 'getElementsByOffset'
 
         # need both _elements and _endElements
-        for e in self.elements:
+        elementsAndIndex = self._getOffsetIndex()
+        if elementsAndIndex is None:
+            candidates = self.elements
+        else:
+            # the index gives a superset of the matching elements; those
+            # are then filtered below exactly as in a linear search
+            elements, oi = elementsAndIndex
+            if mustBeginInSpan:
+                positions = oi.startingBetween(
+                    offsetStart - _OFFSET_INDEX_TOLERANCE,
+                    offsetEnd + _OFFSET_INDEX_TOLERANCE)
+            else:
+                positions = oi.overlapping(
+                    offsetStart - _OFFSET_INDEX_TOLERANCE,
+                    offsetEnd + _OFFSET_INDEX_TOLERANCE)
+            positions.sort()
+            candidates = [elements[i] for i in positions]
+
+        for e in candidates:
             if classList is not None:
                 if not e.isClassOrSubclass(classList):
                     continue
@@ -3118,7 +3868,7 @@ class Stream(base.Music21Object):
         nearestTrailSpan = offset # start with max time
 
         # need both _elements and _endElements
-        for e in self.elements:
+        for e in self._getOffsetIndexCandidatesBefore(offset, classList):
             #eClasses = e.classes  # store once, as this is property call
             if classList is not None:
                 if not e.isClassOrSubclass(classList):
@@ -3211,7 +3961,8 @@ class Stream(base.Music21Object):
         nearestTrailSpan = offset # start with max time
 
         # need both _elements and _endElements
-        for e in self.elements:
+        for e in self._getOffsetIndexCandidatesBefore(offset, classList,
+            excludeOffset=True):
             #eClasses = e.classes  # store once, as this is property call
             if classList is not None:
                 if not e.isClassOrSubclass(classList):
@@ -4319,6 +5070,7 @@ class Stream(base.Music21Object):
         '''
         if inPlace == True:
             returnStream = self
+            returnStream.unshareElements()
         else:
             returnStream = copy.deepcopy(self)
 
@@ -4864,17 +5616,24 @@ class Stream(base.Music21Object):
             onAndOffOffsets = self.flat.notesAndRests._uniqueOffsetsAndEndTimes()
             #environLocal.printDebug(['makeChords: useExactOffsets=True; onAndOffOffsets:', onAndOffOffsets])
 
+            # gather the notes and chords starting in each span in a single
+            # pass; the chords made below are inserted at the start of their
+            # span, so they would never be gathered again
+            spanNotes = [[] for unused in range(len(onAndOffOffsets))]
+            for n in returnObj.getElementsByClass(matchClasses):
+                nOffset = common.cleanupFloat(n.getOffsetBySite(returnObj))
+                i = bisect.bisect_right(onAndOffOffsets, nOffset) - 1
+                if i >= 0:
+                    spanNotes[i].append(n)
+            removeList = []
+            madeChord = False
+
             for i in range(len(onAndOffOffsets) - 1):
                 # get all notes within the start and the minwindow size
                 oStart = onAndOffOffsets[i]
                 oEnd = onAndOffOffsets[i+1]
-                sub = returnObj.getElementsByOffset(oStart, oEnd,
-                        includeEndBoundary=False, mustFinishInSpan=False, mustBeginInSpan=True)
-                # get once for speed
-
-                subNotes = sub.getElementsByClass(matchClasses)
+                subNotes = spanNotes[i]
                 #environLocal.printDebug(['subNotes', subNotes])
-                #subNotes.show('t')
 
                 # make subNotes into a chord
                 if len(subNotes) > 0:
@@ -4909,18 +5668,31 @@ class Stream(base.Music21Object):
                     if gatherExpressions:
                         for n in subNotes:
                             c.expressions += n.expressions
-                    # always remove all the previous elements
-                    for n in subNotes:
-                        returnObj.remove(n)
-                    # remove all rests found in source
-                    for r in returnObj.getElementsByClass('Rest'):
-                        returnObj.remove(r)
+                    # always remove all the previous elements, below
+                    removeList += subNotes
+                    madeChord = True
 
                     if removeRedundantPitches:
                         c.removeRedundantPitches(inPlace=True)
                     # insert chord at start location
                     returnObj._insertCore(oStart, c)
 
+            # remove gathered notes, and all rests found in source once any
+            # chord has been made, in one pass
+            if madeChord:
+                removeList += returnObj.getElementsByClass('Rest').elements
+            if removeList:
+                removeIds = set(id(n) for n in removeList)
+                for elementList in (returnObj._elements,
+                    returnObj._endElements):
+                    for n in elementList:
+                        if id(n) in removeIds:
+                            n.removeLocationBySite(returnObj)
+                    elementList[:] = [n for n in elementList
+                        if id(n) not in removeIds]
+                # removing objects will never change the sort status
+                returnObj._elementsChanged(clearIsSorted=False)
+
         # makeRests to fill any gaps produced by stripping
         #environLocal.printDebug(['pre makeRests show()'])
         if makeRests:
@@ -4933,7 +5705,7 @@ class Stream(base.Music21Object):
 
     def chordify(self, addTies=True, displayTiedAccidentals=False,
         addPartIdAsGroup=False, removeRedundantPitches=True,
-        toSoundingPitch=True):
+        toSoundingPitch=True, materialize=True):
         '''
         Create a chordal reduction of polyphonic music, where each
         change to a new pitch results in a new chord. If a Score or
@@ -4967,6 +5739,15 @@ class Stream(base.Music21Object):
         more transpositions will be transposed to sounding pitch before chordification.
         True by default.
 
+        If `materialize` is False, the Stream is not copied or changed and
+        no Stream is returned. Instead, a generator gives a
+        :class:`~music21.timespans.VerticalitySpan` for each span of time
+        in which the same notes and rests sound. Each record gives the
+        span's offset, quarterLength, pitches (the Pitch objects of this
+        Stream, at written pitch) and source parts; its toChord() method
+        makes a Chord when one is needed. Spans in which nothing sounds are
+        skipped, and the other arguments are ignored.
+
         ::
 
             >>> s = stream.Score()
@@ -4999,6 +5780,19 @@ class Stream(base.Music21Object):
             C#4 ['part1']
             D-4 ['part2']
 
+        Without making a Stream:
+
+        ::
+
+            >>> for span in s.chordify(materialize=False):
+            ...     print span, [str(part.id) for part in span.parts]
+            <VerticalitySpan 2.12:4.0 {D-4}> ['part2']
+            <VerticalitySpan 4.0:4.12 {C#4 D-4}> ['part1', 'part2']
+            <VerticalitySpan 4.12:5.0 {C#4}> ['part1']
+            <VerticalitySpan 5.3:5.5 {}> ['part1']
+            <VerticalitySpan 5.5:6.3 {}> ['part1', 'part2']
+            <VerticalitySpan 6.3:6.5 {}> ['part2']
+
         ::
 
             >>> s = stream.Stream()
@@ -5055,8 +5849,10 @@ class Stream(base.Music21Object):
         # TODO: need to handle voices
         # even if those component Stream do not have Measures
 
-        # TODO: make chordify have an option where the Pitches are not deepcopied from the original, but
-        #       are the same.
+        if not materialize:
+            from music21 import timespans
+            tree = timespans.streamToTimespanCollection(self, ['GeneralNote'])
+            return tree.iterateVerticalitySpans()
 
         # for makeChords, below        
         transferGroupsToPitches = False
@@ -5130,6 +5926,9 @@ class Stream(base.Music21Object):
         # assume we can manipulate this these measures as already have deepcopy
         # the Part may not have had any Measures;
         if len(mStream) > 0:
+            postNotesAndRests = post.notesAndRests.elements
+            # these are flat offset values
+            postOffsets = [e.getOffsetBySite(post) for e in postNotesAndRests]
             for i, m in enumerate(mStream.getElementsByClass('Measure')):
                 # get highest time before removal
                 mQl = m.duration.quarterLength
@@ -5141,17 +5940,15 @@ class Stream(base.Music21Object):
                 mOffsetEnd = mOffsetStart + mQl
                 # not sure if this properly manages padding
 
-                # place all notes in their new location if offsets match
-                # TODO: this iterates over all notes at each iteration; can be faster
-                for e in post.notesAndRests:
-                    # these are flat offset values
-                    o = e.getOffsetBySite(post)
-                    #environLocal.printDebug(['iterating elements', o, e])
-                    if o >= mOffsetStart and o < mOffsetEnd:
-                        # get offset in relation to inside of Measure
-                        localOffset = o - mOffsetStart
-                        #environLocal.printDebug(['inserting element', e, 'at', o, 'in', m, 'localOffset', localOffset])
-                        m.insert(localOffset, e)
+                # place all notes in their new location if offsets match;
+                # the flat offsets are sorted, so those in the measure are
+                # found by bisection
+                low = bisect.bisect_left(postOffsets, mOffsetStart)
+                high = bisect.bisect_left(postOffsets, mOffsetEnd)
+                for j in range(low, high):
+                    # get offset in relation to inside of Measure
+                    m._insertCore(postOffsets[j] - mOffsetStart,
+                        postNotesAndRests[j])
                 # call for each measure
                 m._elementsChanged()
             # call this post now
@@ -5444,6 +6241,7 @@ class Stream(base.Music21Object):
             returnObj = copy.deepcopy(self)
         else:
             returnObj = self
+            returnObj.unshareElements()
 
         # need to reset these lists unless values explicitly provided
         if pitchPast is None:
@@ -5681,6 +6479,7 @@ class Stream(base.Music21Object):
             returnObj = copy.deepcopy(self)
         else:
             returnObj = self
+            returnObj.unshareElements([objName])
 
         # Should we do this?  or just return an exception if not there.
         # this cannot work unless we use a sorted representation
@@ -5890,13 +6689,19 @@ class Stream(base.Music21Object):
                 # dur sum should always be greater than zero
                 if durSum == 0:
                     raise StreamException('aggregated ties have a zero duration sum')
+                # the first note is changed; it must not be shared
+                nFirst = notes[posConnected[0]]
+                nFirstUnshared = returnObj.unshareElement(nFirst)
+                if nFirstUnshared is not nFirst:
+                    notes.replace(nFirst, nFirstUnshared, allTargetSites=False)
+                    nFirst = nFirstUnshared
                 # change the duration of the first note to be self + sum
                 # of all others
-                qLen = notes[posConnected[0]].quarterLength
-                notes[posConnected[0]].quarterLength = qLen + durSum
+                qLen = nFirst.quarterLength
+                nFirst.quarterLength = qLen + durSum
 
                 # set tie to None on first note
-                notes[posConnected[0]].tie = None
+                nFirst.tie = None
                 posConnected = [] # resset to empty
 
         # all results have been processed
@@ -5970,6 +6775,7 @@ class Stream(base.Music21Object):
         # take all flat elements; this will remove all voices; just use offset
         # position
         # do not need to worry about ._endElements
+        self.unshareElements()
         srcFlat = self.flat.notes
         for i, e in enumerate(srcFlat._elements):
             pSrc = []
@@ -6048,8 +6854,11 @@ class Stream(base.Music21Object):
                     cmp(x.classSortOrder, y.classSortOrder)
                 )
             # as sorting changes order, elements have changed;
-            # need to clear cache, but flat status is the same
-            self._elementsChanged(updateIsFlat=False, clearIsSorted=False)
+            # need to clear cache, but flat status is the same; as the
+            # elements and their offsets are unchanged, Streams that
+            # depend on this Stream do not need to be informed
+            self._elementsChanged(updateIsFlat=False, clearIsSorted=False,
+                notify=False)
             self.isSorted = True
             #environLocal.printDebug(['_elements', self._elements])
 
@@ -6058,6 +6867,8 @@ class Stream(base.Music21Object):
             shallowElements = copy.copy(self._elements) # already a copy
             shallowEndElements = copy.copy(self._endElements) # already a copy
             s = copy.copy(self)
+            # the copy must not share the cache dictionary of this Stream
+            s._cache = {}
             # assign directly to _elements, as we do not need to call
             # _elementsChanged()
             s._elements = shallowElements
@@ -6269,14 +7080,15 @@ class Stream(base.Music21Object):
         sNew._elements = []
         sNew._endElements = []
         sNew._elementsChanged() # clear caches
-        for e in self._elements:
-            # if this element is a Stream, recurse
+        # the semiflat form holds all elements at their flat offsets;
+        # only the retained containers need to be removed
+        for e in sf._elements:
             #if hasattr(e, "elements"):
             if e.isStream:
                 continue
-            sNew._insertCore(e.getOffsetBySite(self), e)
+            sNew._insertCore(e.getOffsetBySite(sf), e)
         # endElements should never be Streams
-        for e in self._endElements:
+        for e in sf._endElements:
             #sNew.storeAtEnd(e)
             sNew._storeAtEndCore(e)
         sNew._elementsChanged()
@@ -6485,6 +7297,27 @@ class Stream(base.Music21Object):
 
         ''')
 
+    def _getFlatView(self):
+        return streamView.StreamView(self, flat=True)
+
+    flatView = property(_getFlatView, doc='''
+        Returns a read-only :class:`~music21.stream.streamView.StreamView`
+        of the elements that `.flat` would contain. Unlike `.flat`, no new
+        Stream is created (unless the view is later used in a way that
+        requires one), so the elements are not given a new site, and
+        nothing is done until the view is first used.
+
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> sv = s.flatView
+        >>> len(sv.notes) == len(s.flat.notes)
+        True
+        >>> [n.nameWithOctave for n in sv.notes[:4]] == [
+        ...     n.nameWithOctave for n in s.flat.notes[:4]]
+        True
+        >>> sv.notes.getOffsetByElement(sv.notes[4])
+        0.5
+        ''')
+
 
     def _getSemiFlat(self):
         if 'semiFlat' not in self._cache or self._cache['semiFlat'] is None:
@@ -7485,6 +8318,8 @@ class Stream(base.Music21Object):
 #         for e in post.getElementsByClass(classFilterList=classFilterList):
 #             e.transpose(value, inPlace=True)
 
+        # elements shared with the source of a shared copy must be copied
+        post.unshareElements(classFilterList)
         # this will get all elements at this level and downward.
         for e in post._yieldElementsDownward(streamsOnly=False,
                 restoreActiveSites=True,
@@ -7595,6 +8430,7 @@ class Stream(base.Music21Object):
             returnObj = copy.deepcopy(self)
         else:
             returnObj = self
+            returnObj.unshareElements()
 
         for e in returnObj._elements:
             # check if its a Stream, first, as duration is dependent
@@ -7729,6 +8565,7 @@ class Stream(base.Music21Object):
             returnStream = copy.deepcopy(self)
         else:
             returnStream = self
+            returnStream.unshareElements()
 
         useStreams = [returnStream]
         if recurse is True:
@@ -7983,7 +8820,8 @@ class Stream(base.Music21Object):
             if len(cutPoints) > 0:
                 # remove old
                 #eProc = returnObj.remove(e)
-                eNext = e
+                # e is changed; it must not be shared
+                eNext = returnObj.unshareElement(e)
                 oStartNext = oStart
                 for o in cutPoints:
                     oCut = o - oStartNext
@@ -9857,6 +10695,7 @@ class Stream(base.Music21Object):
             returnObj = copy.deepcopy(self)
         else:
             returnObj = self
+            returnObj.unshareElements()
 
         # Define Lists to cache variants
         elongationVariants = []
@@ -10340,6 +11179,7 @@ class Stream(base.Music21Object):
 
         if inPlace is True:
             returnObj = self
+            returnObj.unshareElements()
         else:
             returnObj = copy.deepcopy(self)
 
@@ -10561,6 +11401,7 @@ class Stream(base.Music21Object):
 
         if inPlace is True:
             returnObj = self
+            returnObj.unshareElements()
             returnPart = containedPart
         else:
             returnObj = copy.deepcopy(self)
@@ -11362,6 +12203,7 @@ class Part(Stream):
             returnObj = copy.deepcopy(self)
         else:
             returnObj = self
+            returnObj.unshareElements()
         # process make accidentals for each measure
         measureStream = returnObj.getElementsByClass('Measure')
         ksLast = None
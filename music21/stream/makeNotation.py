@@ -82,6 +82,7 @@ def makeBeams(s, inPlace=False):
         returnObj = copy.deepcopy(s)
     else:
         returnObj = s
+        returnObj.unshareElements()
 
     #if s.isClass(Measure):
     if 'Measure' in s.classes:
@@ -798,6 +799,7 @@ def makeTies(
         returnObj = copy.deepcopy(s)
     else:
         returnObj = s
+        returnObj.unshareElements()
     if len(returnObj) == 0:
         raise stream.StreamException('cannot process an empty stream')
 
@@ -971,6 +973,7 @@ def makeTupletBrackets(s, inPlace=True):
         returnObj = copy.deepcopy(s)
     else:
         returnObj = s
+        returnObj.unshareElements()
 
     isOpen = False
     tupletCount = 0
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------
+# Name:         offsetIndex.py
+# Purpose:      interval index of element offsets for fast Stream queries
+#
+# Authors:      music21 contributors
+#
+# Copyright:    Copyright © 2026 the music21 Project
+# License:      LGPL, see license.txt
+#------------------------------------------------------------------------------
+'''
+A static interval index over the elements of a
+:class:`~music21.stream.Stream`, used by
+:meth:`~music21.stream.Stream.getElementsByOffset`,
+:meth:`~music21.stream.Stream.getElementAtOrBefore` and
+:meth:`~music21.stream.Stream.getElementBeforeOffset` to avoid a linear pass
+over all elements.
+
+The index is built lazily, stored in the cache of the Stream, and is
+discarded whenever the Stream's elements change.
+'''
+
+import bisect
+import unittest
+
+from music21 import environment
+
+environLocal = environment.Environment(__file__)
+
+
+#------------------------------------------------------------------------------
+
+
+class OffsetIndex(object):
+    '''
+    An index of intervals (start and end offsets) sorted by start offset,
+    augmented with an implicit binary tree of maximum end offsets, so
+    that both "which intervals start between a and b" and "which intervals
+    overlap a and b" can be answered in O(log n + k) time.
+
+    Each interval is given as a tuple of (start, end, position), where
+    `position` is the index position of the element in the source
+    Stream's `.elements`; positions are returned from all queries.
+
+    >>> from music21.stream import offsetIndex
+    >>> oi = offsetIndex.OffsetIndex([(0.0, 4.0, 0), (1.0, 2.0, 1),
+    ...     (2.0, 2.0, 2), (3.0, 5.0, 3)])
+    >>> len(oi)
+    4
+    >>> oi.startingBetween(1.0, 2.0)
+    [1, 2]
+    >>> oi.overlapping(2.5, 3.0)
+    [0, 3]
+    >>> oi.lastStartingAtOrBefore(2.5)
+    2
+    >>> oi.lastStartingAtOrBefore(-1.0)
+    -1
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        'ends',
+        'positions',
+        'starts',
+        '_leafCount',
+        '_maxEnds',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, intervals):
+        # sort by start, keeping the order of positions for equal starts
+        intervals = sorted(intervals, key=lambda x: (x[0], x[2]))
+        self.starts = [x[0] for x in intervals]
+        self.ends = [x[1] for x in intervals]
+        self.positions = [x[2] for x in intervals]
+        # build an implicit binary tree, stored in a list, where each node
+        # holds the maximum end offset of all intervals beneath it
+        leafCount = 1
+        while leafCount < len(intervals):
+            leafCount *= 2
+        maxEnds = [None] * (2 * leafCount)
+        for i, end in enumerate(self.ends):
+            maxEnds[leafCount + i] = end
+        for node in range(leafCount - 1, 0, -1):
+            left = maxEnds[2 * node]
+            right = maxEnds[2 * node + 1]
+            if right is None or (left is not None and left >= right):
+                maxEnds[node] = left
+            else:
+                maxEnds[node] = right
+        self._leafCount = leafCount
+        self._maxEnds = maxEnds
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self):
+        return len(self.starts)
+
+    ### PUBLIC METHODS ###
+
+    def startingBetween(self, offsetStart, offsetEnd):
+        '''
+        Return the positions of all intervals that start at or after
+        `offsetStart` and at or before `offsetEnd`, in order of start.
+        '''
+        low = bisect.bisect_left(self.starts, offsetStart)
+        high = bisect.bisect_right(self.starts, offsetEnd)
+        return self.positions[low:high]
+
+    def overlapping(self, offsetStart, offsetEnd):
+        '''
+        Return the positions of all intervals that start at or before
+        `offsetEnd` and end at or after `offsetStart`, in order of start.
+        '''
+        high = bisect.bisect_right(self.starts, offsetEnd)
+        if high == 0:
+            return []
+        maxEnds = self._maxEnds
+        leafCount = self._leafCount
+        found = []
+        # depth-first search, visiting left children first, pruning
+        # subtrees whose maximum end is before offsetStart or whose first
+        # leaf starts after offsetEnd
+        stack = [(1, 0, leafCount)]
+        while stack:
+            node, first, size = stack.pop()
+            if first >= high:
+                continue
+            maxEnd = maxEnds[node]
+            if maxEnd is None or maxEnd < offsetStart:
+                continue
+            if size == 1:
+                found.append(self.positions[first])
+                continue
+            half = size // 2
+            stack.append((2 * node + 1, first + half, half))
+            stack.append((2 * node, first, half))
+        return found
+
+    def lastStartingAtOrBefore(self, offset):
+        '''
+        Return the sorted index (not the position) of the last interval that
+        starts at or before `offset`, or -1 if there is none.
+        '''
+        return bisect.bisect_right(self.starts, offset) - 1
+
+
+
+#------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+    '''
+    Note: all Stream tests are found in test/testStream.py
+    '''
+
+    def runTest(self):
+        pass
+
+
+#------------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
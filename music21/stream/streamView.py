@@ -0,0 +1,559 @@
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------
+# Name:         streamView.py
+# Purpose:      lightweight read-only views of the elements of a Stream
+#
+# Authors:      music21 contributors
+#
+# Copyright:    Copyright © 2026 the music21 Project
+# License:      LGPL, see license.txt
+#------------------------------------------------------------------------------
+'''
+A :class:`~music21.stream.streamView.StreamView` gives read-only access to
+the elements of a :class:`~music21.stream.Stream`, optionally flattened
+and/or filtered by class, without creating a new Stream.
+
+Creating a new Stream, as `.flat` and
+:meth:`~music21.stream.Stream.getElementsByClass` do, adds the new Stream
+to the :class:`~music21.base.Sites` of every element found; a StreamView
+does not, and collects its elements only when first accessed. A view is
+obtained with :attr:`~music21.stream.Stream.flatView` or by calling
+:meth:`~music21.stream.Stream.getElementsByClass` with
+`returnStreamSubClass='view'`.
+'''
+
+import unittest
+
+from music21 import duration
+from music21 import environment
+
+environLocal = environment.Environment(__file__)
+
+
+#------------------------------------------------------------------------------
+
+
+class StreamView(object):
+    '''
+    A read-only view of the elements of `srcStream`; if `flat` is True, the
+    elements of all contained Streams are included (but not the contained
+    Streams themselves), as in `.flat`. If `classFilterList` is given, only
+    elements matching one of these classes are included, as in
+    :meth:`~music21.stream.Stream.getElementsByClass`.
+
+    Elements are found, at their offsets relative to `srcStream`, when the
+    view is first accessed; changes to `srcStream` after that are not
+    seen. Iterating over a view, unlike iterating over a Stream, does not
+    change the activeSite of the elements; offsets in the view must be
+    obtained from :meth:`getOffsetByElement` or :meth:`offsetsAndElements`.
+
+    >>> s = stream.Score()
+    >>> p = stream.Part()
+    >>> p.repeatAppend(note.Note('E4'), 3)
+    >>> p.insert(1, clef.BassClef())
+    >>> s.insert(2, p)
+    >>> sv = s.flatView
+    >>> sv
+    <music21.stream.streamView.StreamView of <music21.stream.Score ...>: flat>
+    >>> len(sv)
+    4
+    >>> [(o, e.classes[0]) for o, e in sv.offsetsAndElements()]
+    [(2.0, 'Note'), (3.0, 'BassClef'), (3.0, 'Note'), (4.0, 'Note')]
+
+    Views can be filtered further; the last Note is found at offset 4:
+
+    >>> notes = sv.getElementsByClass('Note')
+    >>> len(notes)
+    3
+    >>> notes.getOffsetByElement(notes[-1])
+    4.0
+
+    No Stream has been created, so the Sites of the elements are unchanged:
+
+    >>> len(notes[0].sites)
+    2
+
+    The offsets and duration of a view are found from its elements, also
+    without creating a Stream:
+
+    >>> notes.highestTime
+    5.0
+    >>> notes.lowestOffset
+    2.0
+    >>> notes.duration.quarterLength
+    5.0
+
+    Any other attribute or method of a Stream, such as a method that
+    changes the Stream, is called on a real Stream; this Stream is created
+    the first time it is needed, and is the same as the one that calling
+    `.flat` and `getElementsByClass` would have returned. From then on,
+    the view shows the contents of that Stream.
+
+    >>> notes.append(note.Note('G4'))
+    >>> len(notes)
+    4
+    >>> notes.stream()
+    <music21.stream.Score ...>
+    >>> len(s.flat.notes)
+    3
+    '''
+    def __init__(self, srcStream, flat=False, classFilterList=None):
+        self.srcStream = srcStream
+        # a list of ('flat', None) and ('class', classFilterList) steps,
+        # applied to srcStream in order
+        self._steps = []
+        if flat:
+            self._steps.append(('flat', None))
+        if classFilterList is not None:
+            self._steps.append(('class',
+                _normalizeClassFilterList(classFilterList)))
+        # a list of (offset, element) pairs, created when first needed
+        self._entries = None
+        # the Stream created from this view, if any
+        self._stream = None
+
+    def __repr__(self):
+        msg = []
+        for step, classFilterList in self._steps:
+            if step == 'flat':
+                msg.append('flat')
+            else:
+                msg.append(', '.join([_className(c)
+                    for c in classFilterList]))
+        return '<%s.%s of %r: %s>' % (self.__module__,
+            self.__class__.__name__, self.srcStream, '; '.join(msg))
+
+    def __getattr__(self, name):
+        # only called for attributes not found on the view itself
+        if name.startswith('__') or name in ('_entries', '_stream',
+            '_steps', 'srcStream'):
+            raise AttributeError(name)
+        return getattr(self.stream(), name)
+
+    def _getEntries(self):
+        '''
+        Return, creating if necessary, the list of (offset, element) pairs
+        of this view.
+        '''
+        if self._entries is None:
+            steps = self._steps
+            if len(steps) == 0:
+                entries = _classEntries(self.srcStream, None)
+            elif steps[0][0] == 'flat':
+                entries = _flatEntries(self.srcStream)
+                steps = steps[1:]
+            else:
+                entries = _classEntries(self.srcStream, steps[0][1])
+                steps = steps[1:]
+            for step, classFilterList in steps:
+                entries = self._applyStep(entries, step, classFilterList)
+            self._entries = entries
+        return self._entries
+
+    def _applyStep(self, entries, step, classFilterList):
+        '''
+        Return the (offset, element) pairs found by applying one step to
+        `entries`.
+        '''
+        if step == 'class':
+            return [(o, e) for o, e in entries
+                if e.isClassOrSubclass(classFilterList)]
+        # as in .flat, the end elements stay at the end
+        endIds = self._endElementIds()
+        post = []
+        endEntries = []
+        for o, e in entries:
+            if id(e) in endIds:
+                endEntries.append((o, e))
+            elif e.isStream:
+                for offsetSub, eSub in _flatEntries(e):
+                    post.append((offsetSub + o, eSub))
+            else:
+                post.append((o, e))
+        _sortedByOffset(post)
+        post.extend(endEntries)
+        return post
+
+    def _endElementIds(self):
+        '''
+        Return the ids of the end elements of the source Stream: these are
+        the only elements that the Streams returned by `.flat` and
+        `getElementsByClass` store at the end.
+        '''
+        return set([id(e) for e in self.srcStream._endElements])
+
+    def _derive(self, step, classFilterList=None):
+        '''
+        Return a new view that applies one more step to this view.
+        '''
+        post = self.__class__(self.srcStream)
+        post._steps = self._steps + [(step, classFilterList)]
+        if self._entries is not None:
+            post._entries = self._applyStep(self._entries, step,
+                classFilterList)
+        return post
+
+    def __len__(self):
+        if self._stream is not None:
+            return len(self._stream)
+        return len(self._getEntries())
+
+    def __iter__(self):
+        if self._stream is not None:
+            return iter(self._stream)
+        return iter([e for unused_offset, e in self._getEntries()])
+
+    def __getitem__(self, key):
+        '''
+        Return an element by index, or a list of elements for a slice.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('C'), 3)
+        >>> s.append(note.Rest())
+        >>> sv = s.getElementsByClass('Note', returnStreamSubClass='view')
+        >>> sv[-1] is s[2]
+        True
+        >>> len(sv[1:])
+        2
+        '''
+        if self._stream is not None:
+            return self._stream[key]
+        entries = self._getEntries()
+        if isinstance(key, slice):
+            return [e for unused_offset, e in entries[key]]
+        return entries[key][1]
+
+    def __contains__(self, element):
+        if self._stream is not None:
+            return self._stream.hasElement(element)
+        for unused_offset, e in self._getEntries():
+            if e is element:
+                return True
+        return False
+
+    def _getElements(self):
+        return tuple(self)
+
+    elements = property(_getElements, doc='''
+        A tuple of the elements of this view.
+        ''')
+
+    def offsetsAndElements(self):
+        '''
+        Return a list of (offset, element) pairs, where offsets are
+        relative to the source Stream.
+        '''
+        if self._stream is not None:
+            return [(e.getOffsetBySite(self._stream), e)
+                for e in self._stream]
+        return list(self._getEntries())
+
+    def getOffsetByElement(self, obj):
+        '''
+        Return the offset of `obj` relative to the source Stream, or None if
+        it is not in this view.
+
+        >>> s = stream.Stream()
+        >>> m = stream.Measure()
+        >>> n = note.Note()
+        >>> m.insert(1.5, n)
+        >>> s.insert(3, m)
+        >>> s.flatView.getOffsetByElement(n)
+        4.5
+        >>> s.flatView.getOffsetByElement(m) is None
+        True
+        '''
+        if self._stream is not None:
+            return self._stream.getOffsetByElement(obj)
+        for offset, e in self._getEntries():
+            if e is obj:
+                return offset
+        return None
+
+    def getElementsByClass(self, classFilterList):
+        '''
+        Return a new view of the elements of this view that match one or
+        more classes in `classFilterList`.
+        '''
+        if self._stream is not None:
+            return self._stream.getElementsByClass(classFilterList)
+        return self._derive('class',
+            _normalizeClassFilterList(classFilterList))
+
+    def _getFlat(self):
+        if self._stream is not None:
+            return self._stream.flat
+        return self._derive('flat')
+
+    flat = property(_getFlat, doc='''
+        A view of the elements of this view and of the Streams it
+        contains, as in :attr:`~music21.stream.Stream.flat`.
+
+        >>> p = stream.Part()
+        >>> for i in range(2):
+        ...     m = stream.Measure()
+        ...     m.repeatAppend(note.Note('D4'), 4)
+        ...     p.append(m)
+        >>> mv = p.getElementsByClass('Measure', returnStreamSubClass='view')
+        >>> mv.flat
+        <music21.stream.streamView.StreamView of <music21.stream.Part ...>: Measure; flat>
+        >>> len(mv.flat.notes)
+        8
+        >>> mv.flat.notes.getOffsetByElement(p[1][0])
+        4.0
+        ''')
+
+    def _getNotes(self):
+        return self.getElementsByClass('NotRest')
+
+    notes = property(_getNotes, doc='''
+        A view of the :class:`~music21.note.NotRest` objects (Notes,
+        Chords, etc.) in this view, as in
+        :attr:`~music21.stream.Stream.notes`.
+        ''')
+
+    def _getNotesAndRests(self):
+        return self.getElementsByClass('GeneralNote')
+
+    notesAndRests = property(_getNotesAndRests, doc='''
+        A view of the :class:`~music21.note.GeneralNote` objects in this
+        view, as in :attr:`~music21.stream.Stream.notesAndRests`.
+        ''')
+
+    def _getTimedEntries(self):
+        '''
+        Return the (offset, element) pairs of this view other than end
+        elements, which a Stream leaves out of its offsets and highestTime.
+        '''
+        endIds = self._endElementIds()
+        return [(o, e) for o, e in self._getEntries() if id(e) not in endIds]
+
+    def _getHighestTime(self):
+        if self._stream is not None:
+            return self._stream.highestTime
+        highestTime = 0.0
+        for o, e in self._getTimedEntries():
+            endTime = o + e.duration.quarterLength
+            if endTime > highestTime:
+                highestTime = endTime
+        return highestTime
+
+    highestTime = property(_getHighestTime, doc='''
+        The largest offset plus duration of the elements in this view, as
+        in :attr:`~music21.stream.Stream.highestTime`.
+        ''')
+
+    def _getHighestOffset(self):
+        if self._stream is not None:
+            return self._stream.highestOffset
+        offsets = [o for o, unused_e in self._getTimedEntries()]
+        if len(offsets) == 0:
+            return 0.0
+        return max(offsets)
+
+    highestOffset = property(_getHighestOffset, doc='''
+        The largest offset of the elements in this view, as in
+        :attr:`~music21.stream.Stream.highestOffset`.
+        ''')
+
+    def _getLowestOffset(self):
+        if self._stream is not None:
+            return self._stream.lowestOffset
+        offsets = [o for o, unused_e in self._getTimedEntries()]
+        if len(offsets) == 0:
+            return 0.0
+        return min(offsets)
+
+    lowestOffset = property(_getLowestOffset, doc='''
+        The smallest offset of the elements in this view, as in
+        :attr:`~music21.stream.Stream.lowestOffset`.
+        ''')
+
+    def _getDuration(self):
+        if self._stream is not None:
+            return self._stream.duration
+        return duration.Duration(quarterLength=self.highestTime)
+
+    duration = property(_getDuration, doc='''
+        A new :class:`~music21.duration.Duration` lasting the highestTime
+        of this view, as in :attr:`~music21.stream.Stream.duration`.
+        ''')
+
+    def _hasSourceMeasures(self):
+        '''
+        Return True if this view is not flat and has all the Measures of
+        the source Stream.
+        '''
+        for step, unused_classFilterList in self._steps:
+            if step == 'flat':
+                return False
+        measureCount = 0
+        for unused_offset, e in self._getEntries():
+            if e.isClassOrSubclass(('Measure',)):
+                measureCount += 1
+        return measureCount > 0 and measureCount == len(
+            _classEntries(self.srcStream, ('Measure',)))
+
+    def measures(self, numberStart, numberEnd, *arguments, **keywords):
+        '''
+        Return a Stream of the Measures numbered `numberStart` to
+        `numberEnd`, as :meth:`~music21.stream.Stream.measures` does.
+
+        If the view has all the Measures of the source Stream, they are
+        taken from the source Stream, along with the context objects and
+        Spanners gathered with them, without creating a Stream for the
+        view.
+
+        >>> p = corpus.parse('bach/bwv66.6').parts[0]
+        >>> mv = p.getElementsByClass('Measure', returnStreamSubClass='view')
+        >>> len(mv.measures(2, 3).getElementsByClass('Measure'))
+        2
+        >>> mv.measure(4)
+        <music21.stream.Measure 4 offset=0.0>
+        >>> mv._stream is None
+        True
+        '''
+        if self._stream is None and self._hasSourceMeasures():
+            return self.srcStream.measures(numberStart, numberEnd,
+                *arguments, **keywords)
+        return self.stream().measures(numberStart, numberEnd,
+            *arguments, **keywords)
+
+    def measure(self, measureNumber, *arguments, **keywords):
+        '''
+        Return a single Measure, as :meth:`~music21.stream.Stream.measure`
+        does; see :meth:`measures`.
+        '''
+        if self._stream is None and self._hasSourceMeasures():
+            return self.srcStream.measure(measureNumber,
+                *arguments, **keywords)
+        return self.stream().measure(measureNumber, *arguments, **keywords)
+
+    def stream(self):
+        '''
+        Return a real Stream with the elements of this view, as returned
+        by the `.flat` and `getElementsByClass` calls that the view stands
+        for; the Stream is created the first time this is called.
+        '''
+        if self._stream is None:
+            post = self.srcStream
+            for step, classFilterList in self._steps:
+                if step == 'flat':
+                    post = post.flat
+                else:
+                    post = post.getElementsByClass(classFilterList)
+            self._stream = post
+            self._entries = None
+        return self._stream
+
+
+#------------------------------------------------------------------------------
+
+
+def _normalizeClassFilterList(classFilterList):
+    if not isinstance(classFilterList, (list, tuple)):
+        return (classFilterList,)
+    return tuple(classFilterList)
+
+
+def _className(classObj):
+    if isinstance(classObj, str):
+        return classObj
+    return classObj.__name__
+
+
+def _sortedByOffset(entries):
+    '''
+    Sort (offset, element) pairs in place in the order used by
+    :meth:`~music21.stream.Stream.sort`; the sort is stable.
+    '''
+    entries.sort(key=lambda oe: (oe[0], oe[1].priority,
+        oe[1].classSortOrder, not oe[1].isGrace))
+    return entries
+
+
+def _endEntries(srcStream, endElements):
+    '''
+    Return (offset, element) pairs for end elements, in the order used by
+    :meth:`~music21.stream.Stream.sort`.
+    '''
+    entries = [(e.getOffsetBySite(srcStream), e) for e in endElements]
+    entries.sort(key=lambda oe: (oe[1].priority, oe[1].classSortOrder))
+    return entries
+
+
+def _classEntries(srcStream, classFilterList):
+    '''
+    Return (offset, element) pairs for the elements of `srcStream` that
+    match `classFilterList`, or all elements if it is None.
+    '''
+    if srcStream.autoSort:
+        srcStream.sort()
+    if classFilterList is None:
+        elements = srcStream._elements
+        endElements = srcStream._endElements
+    else:
+        allClassStrings = True
+        for className in classFilterList:
+            if not isinstance(className, str):
+                allClassStrings = False
+                break
+        if allClassStrings:
+            elementsIndex, endElementsIndex = srcStream._getClassIndex()
+            elements = [srcStream._elements[i] for i in
+                srcStream._getClassIndexPositions(elementsIndex,
+                classFilterList)]
+            endElements = [srcStream._endElements[i] for i in
+                srcStream._getClassIndexPositions(endElementsIndex,
+                classFilterList)]
+        else:
+            elements = [e for e in srcStream._elements
+                if e.isClassOrSubclass(classFilterList)]
+            endElements = [e for e in srcStream._endElements
+                if e.isClassOrSubclass(classFilterList)]
+    entries = [(e.getOffsetBySite(srcStream), e) for e in elements]
+    entries.extend(_endEntries(srcStream, endElements))
+    return entries
+
+
+def _flatEntries(srcStream):
+    '''
+    Return (offset, element) pairs for all elements of `srcStream` and of
+    the Streams it contains, in the order of `srcStream.flat`.
+
+    As in `.flat`, offsets of elements in contained Streams are found by
+    adding the offset of the contained Stream to their flat offsets in
+    that Stream, and the end elements of contained Streams become
+    regular elements.
+    '''
+    entries = []
+    for e in srcStream._elements:
+        if e.isStream:
+            recurseStreamOffset = e.getOffsetBySite(srcStream)
+            for offsetSub, eSub in _flatEntries(e):
+                entries.append((offsetSub + recurseStreamOffset, eSub))
+        else:
+            entries.append((e.getOffsetBySite(srcStream), e))
+    _sortedByOffset(entries)
+    entries.extend(_endEntries(srcStream, srcStream._endElements))
+    return entries
+
+
+#------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+    '''
+    Note: all Stream tests are found in test/testStream.py
+    '''
+
+    def runTest(self):
+        pass
+
+
+#------------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
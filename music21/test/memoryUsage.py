@@ -1,15 +1,96 @@
+import sys
+
 from music21 import exceptions21
 from music21 import corpus
 
+
+def sitesBytesPerNote(workName, iterations=10):
+    '''
+    Parse `workName` from the corpus, get `.flat` and `.sorted` of each
+    Part `iterations` times (discarding the results, as in typical
+    analysis code), and return the mean number of bytes used by the Sites
+    object of each Note, including its references.
+    '''
+    s = corpus.parse(workName)
+    for unused in range(iterations):
+        for p in s.parts:
+            unused_flat = p.flat
+            unused_sorted = p.sorted
+            p._elementsChanged()  # clear cached representations
+    totalBytes = 0
+    totalRefs = 0
+    notes = s.flat.notes
+    for n in notes:
+        sites = n.sites
+        totalBytes += sys.getsizeof(sites)
+        totalBytes += sys.getsizeof(sites._definedContexts)
+        totalBytes += sys.getsizeof(sites._locationKeys)
+        for siteRef in sites._definedContexts.values():
+            totalBytes += sys.getsizeof(siteRef)
+        totalRefs += len(sites._definedContexts)
+    return (float(totalBytes) / len(notes), float(totalRefs) / len(notes),
+        len(notes))
+
+
+def copyCost(workName, iterations=5):
+    '''
+    Parse `workName` from the corpus and copy it `iterations` times with
+    copy.deepcopy and with Stream.sharedCopy. Return a list of (method,
+    seconds per copy, new objects per copy, bytes of new objects per copy)
+    tuples; objects are those tracked by the garbage collector, and bytes
+    are their sys.getsizeof sizes.
+    '''
+    import copy
+    import gc
+    import time
+
+    s = corpus.parse(workName)
+    post = []
+    for method in ('deepcopy', 'sharedCopy'):
+        gc.collect()
+        oldIds = set(id(obj) for obj in gc.get_objects())
+        copies = []
+        t = time.time()
+        for unused in range(iterations):
+            if method == 'deepcopy':
+                copies.append(copy.deepcopy(s))
+            else:
+                copies.append(s.sharedCopy())
+        seconds = time.time() - t
+        gc.collect()
+        newObjects = [obj for obj in gc.get_objects() if id(obj) not in oldIds]
+        totalBytes = sum(sys.getsizeof(obj) for obj in newObjects)
+        post.append((method, seconds / iterations,
+            len(newObjects) // iterations, totalBytes // iterations))
+        del newObjects
+        del copies
+    return post
+
+
+
 if __name__ == '__main__':
-    try:
-        import guppy
-    except ImportError:
-        raise exceptions21.Music21Exception("memoryUsage.py requires guppy")
-
-    hp = guppy.hpy()
-    hp.setrelheap()
-    x = corpus.parse('bwv66.6')
-    h = hp.heap()
-    print h
-    
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == 'sites':
+        # python memoryUsage.py sites [workName ...]
+        workNames = sys.argv[2:] or ['bach/bwv66.6', 'beethoven/opus132']
+        for workName in workNames:
+            bytesPerNote, refsPerNote, noteCount = sitesBytesPerNote(workName)
+            print '%s: %s Notes, %.1f site references and %.1f bytes of Sites per Note' % (
+                workName, noteCount, refsPerNote, bytesPerNote)
+    elif len(sys.argv) > 1 and sys.argv[1] == 'copy':
+        # python memoryUsage.py copy [workName ...]
+        workNames = sys.argv[2:] or ['bach/bwv66.6', 'beethoven/opus132']
+        for workName in workNames:
+            for method, seconds, objectCount, totalBytes in copyCost(workName):
+                print '%s %s: %.3f sec, %s objects, %s bytes per copy' % (
+                    workName, method, seconds, objectCount, totalBytes)
+    else:
+        try:
+            import guppy
+        except ImportError:
+            raise exceptions21.Music21Exception("memoryUsage.py requires guppy")
+
+        hp = guppy.hpy()
+        hp.setrelheap()
+        x = corpus.parse('bwv66.6')
+        h = hp.heap()
+        print h
@@ -392,12 +392,304 @@ class Test(unittest.TestCase):
 
 
 
+#-------------------------------------------------------------------------------
+def musicxmlImportThroughput(xmlBackends=('sax', 'etree')):
+    '''
+    Parse every MusicXML file in the core corpus into mxObjects with each
+    of the given xmlBackends of
+    :class:`~music21.musicxml.xmlHandler.Document`, and return a list of
+    (xmlBackend, files per second) pairs. Files are read (and unzipped)
+    before timing begins.
+    '''
+    from music21 import converter
+    from music21.musicxml import xmlHandler
+
+    dataList = []
+    for fp in corpus.getCorePaths('musicxml'):
+        arch = converter.ArchiveManager(fp)
+        if arch.isArchive():
+            dataList.append(arch.getData())
+        else:
+            f = open(fp)
+            dataList.append(f.read())
+            f.close()
+
+    post = []
+    for xmlBackend in xmlBackends:
+        t = common.Timer()
+        t.start()
+        for data in dataList:
+            d = xmlHandler.Document(xmlBackend=xmlBackend)
+            d.read(data)
+        t.stop()
+        post.append((xmlBackend, len(dataList) / t()))
+    return post
+
+
+def musicxmlExportThroughput(workNames=('bach/bwv66.6', 'luca/gloria',
+    'beethoven/opus59no2/movement3', 'haydn/opus74no1/movement3',
+    'mozart/k80/movement1', 'monteverdi/madrigal.3.1.xml')):
+    '''
+    Parse each of `workNames` from the corpus, translate it to mxObjects,
+    and write it out both through a minidom document
+    (:meth:`~music21.xmlnode.XMLNode.toxml`) and directly
+    (:meth:`~music21.xmlnode.XMLNode.xmlWrite`); then parse the written
+    MusicXML again, to check the round trip. Returns a list of (method,
+    seconds) pairs for writing all the works.
+    '''
+    import copy
+    import io
+    from music21 import converter
+    from music21.musicxml import toMxObjects
+
+    mxScores = []
+    for workName in workNames:
+        s = corpus.parse(workName)
+        mxScores.append(toMxObjects.streamToMx(copy.deepcopy(s)))
+
+    post = []
+    for method in ('toxml', 'xmlWrite'):
+        t = common.Timer()
+        t.start()
+        dataList = []
+        for mxScore in mxScores:
+            if method == 'toxml':
+                dataList.append(mxScore.toxml(None, None, True))
+            else:
+                f = io.BytesIO()
+                mxScore.xmlWrite(f)
+                dataList.append(f.getvalue())
+        t.stop()
+        post.append((method, t()))
+    for data in dataList:
+        converter.parse(data)
+    return post
+
+
+def musicxmlCopyOnWriteExport(workNames=('bach/bwv66.6', 'luca/gloria',
+    'mozart/k80/movement1', 'monteverdi/madrigal.3.1.xml'), repeat=3):
+    '''
+    Parse each of `workNames` from the corpus and export it to a MusicXML
+    string `repeat` times, copying the whole Stream first and with
+    `copyOnWrite` (see :func:`~music21.musicxml.m21ToString.fromStream`).
+    Returns a list of (copyOnWrite, seconds) pairs.
+    '''
+    from music21.musicxml import m21ToString
+
+    streams = [corpus.parse(workName) for workName in workNames]
+    post = []
+    for copyOnWrite in (False, True):
+        t = common.Timer()
+        t.start()
+        for unused in range(repeat):
+            for s in streams:
+                m21ToString.fromStream(s, copyOnWrite=copyOnWrite)
+        t.stop()
+        post.append((copyOnWrite, t()))
+    return post
+
+
+def midiReadScaling(noteCounts=(5000, 10000, 20000, 40000), trackCount=4,
+    columnar=False):
+    '''
+    Build MIDI files of `trackCount` tracks of each of `noteCounts` notes,
+    read each with :meth:`~music21.midi.MidiFile.readstr`, and return a
+    list of (notes per track, bytes, seconds) triples. Reading time should
+    grow linearly with the number of notes.
+
+    If `columnar` is True, tracks are read as
+    :class:`~music21.midi.ColumnarMidiTrack` objects.
+    '''
+    from music21 import midi
+
+    post = []
+    for noteCount in noteCounts:
+        mf = midi.MidiFile()
+        mf.ticksPerQuarterNote = 1024
+        for i in range(trackCount):
+            mt = midi.MidiTrack(i)
+            for j in range(noteCount):
+                for velocity in (90, 0):
+                    dt = midi.DeltaTime(mt)
+                    dt.time = 512 * (velocity == 0)
+                    me = midi.MidiEvent(mt)
+                    me.type = 'NOTE_ON'
+                    me.channel = i + 1
+                    me.pitch = 48 + j % 24
+                    me.velocity = velocity
+                    mt.events.extend([dt, me])
+            dt = midi.DeltaTime(mt)
+            dt.time = 0
+            me = midi.MidiEvent(mt)
+            me.type = 'END_OF_TRACK'
+            me.data = ''
+            mt.events.extend([dt, me])
+            mf.tracks.append(mt)
+        midiStr = mf.writestr()
+
+        t = common.Timer()
+        t.start()
+        midi.MidiFile().readstr(midiStr, columnar=columnar)
+        t.stop()
+        post.append((noteCount, len(midiStr), t()))
+    return post
+
+
+def midiWriteScaling(partCounts=(4, 8, 16), noteCount=1000):
+    '''
+    Build Scores of each of `partCounts` Parts of `noteCount` notes and
+    chords (some with microtones, which need pitch bends on their own
+    channels), write each with
+    :func:`~music21.midi.translate.streamToMidiFile`, and return a list of
+    (parts, bytes, seconds) triples.
+    '''
+    from music21 import stream
+    from music21 import note
+    from music21 import chord
+    from music21 import instrument
+    from music21.midi import translate
+
+    instrumentClasses = [instrument.Violin, instrument.Viola,
+        instrument.Violoncello, instrument.Flute, instrument.Oboe,
+        instrument.Clarinet, instrument.Bassoon, instrument.Horn]
+    post = []
+    for partCount in partCounts:
+        s = stream.Score()
+        for i in range(partCount):
+            p = stream.Part()
+            p.append(instrumentClasses[i % len(instrumentClasses)]())
+            for j in range(noteCount):
+                quarterLength = (0.5, 1.0, 2.0, 0.25)[(i + j) % 4]
+                if j % 7 == 0:
+                    n = chord.Chord([48 + j % 12, 55 + j % 12, 64 + j % 5],
+                        quarterLength=quarterLength)
+                else:
+                    n = note.Note(40 + (i * 5 + j * 3) % 40,
+                        quarterLength=quarterLength)
+                    if (j + 11 * i) % 97 == 0:
+                        n.pitch.microtone = 25
+                p.append(n)
+            s.insert(0, p)
+
+        t = common.Timer()
+        t.start()
+        midiStr = translate.streamToMidiFile(s).writestr()
+        t.stop()
+        post.append((partCount, len(midiStr), t()))
+    return post
+
+
+def segmentSimilarityScaling(scoreCounts=(5, 10, 20)):
+    '''
+    Index the first of each of `scoreCounts` Bach chorales with
+    :func:`~music21.search.segment.indexScoreFilePaths`, compare all of
+    their segments with both
+    :func:`~music21.search.segment.scoreSimilarity` (with difflib) and
+    :func:`~music21.search.segment.scoreSimilarityMatrix`, and return a list
+    of (scores, segments, seconds, matrix seconds) tuples.
+    '''
+    from music21 import corpus
+    from music21.search import segment
+
+    filePaths = corpus.getBachChorales()
+    post = []
+    for scoreCount in scoreCounts:
+        scoreDict = segment.indexScoreFilePaths(filePaths[:scoreCount])
+
+        t = common.Timer()
+        t.start()
+        segment.scoreSimilarity(scoreDict, forceDifflib=True)
+        t.stop()
+        similaritySeconds = t()
+
+        t = common.Timer()
+        t.start()
+        segmentList, unused = segment.scoreSimilarityMatrix(scoreDict)
+        t.stop()
+        post.append((scoreCount, len(segmentList), similaritySeconds, t()))
+    return post
+
+
+def verticalSliceThroughput(workNames=('bach/bwv66.6', 'luca/gloria',
+    'mozart/k80/movement1', 'monteverdi/madrigal.3.1.xml')):
+    '''
+    Parse each of `workNames` from the corpus and find its vertical slices
+    with :func:`~music21.theoryAnalysis.theoryAnalyzer.getVerticalSlices`.
+    Returns a list of (workName, slices, seconds) triples.
+    '''
+    from music21.theoryAnalysis import theoryAnalyzer
+
+    post = []
+    for workName in workNames:
+        s = corpus.parse(workName)
+        t = common.Timer()
+        t.start()
+        verticalSlices = theoryAnalyzer.getVerticalSlices(s)
+        t.stop()
+        post.append((workName, len(verticalSlices), t()))
+    return post
+
+
+def chordifyThroughput(workNames=('bach/bwv66.6', 'luca/gloria',
+    'mozart/k80/movement1', 'monteverdi/madrigal.3.1.xml')):
+    '''
+    Parse each of `workNames` from the corpus and chordify it, both making
+    a Stream of Chords and with `materialize` False (see
+    :meth:`~music21.stream.Stream.chordify`). Returns a list of
+    (materialize, seconds) pairs.
+    '''
+    streams = [corpus.parse(workName) for workName in workNames]
+    post = []
+    for materialize in (True, False):
+        t = common.Timer()
+        t.start()
+        for s in streams:
+            if materialize:
+                s.chordify()
+            else:
+                for unused in s.chordify(materialize=False):
+                    pass
+        t.stop()
+        post.append((materialize, t()))
+    return post
+
+
 if __name__ == "__main__":
     import sys
 
     if len(sys.argv) == 1: # normal conditions
         # sys.arg test options will be used in mainTest()
         music21.mainTest(Test)
+    elif sys.argv[1] == 'musicxml':
+        for xmlBackend, filesPerSecond in musicxmlImportThroughput():
+            print('%s: %.2f files/sec' % (xmlBackend, filesPerSecond))
+    elif sys.argv[1] == 'musicxmlwrite':
+        for method, seconds in musicxmlExportThroughput():
+            print('%s: %.2f sec' % (method, seconds))
+    elif sys.argv[1] == 'musicxmlcopy':
+        for copyOnWrite, seconds in musicxmlCopyOnWriteExport():
+            print('copyOnWrite=%s: %.2f sec' % (copyOnWrite, seconds))
+    elif sys.argv[1] == 'midi':
+        for columnar in (False, True):
+            for noteCount, byteCount, seconds in midiReadScaling(
+                    columnar=columnar):
+                print('%s notes per track, %s bytes, columnar %s: %.2f sec' % (
+                    noteCount, byteCount, columnar, seconds))
+    elif sys.argv[1] == 'midiwrite':
+        for partCount, byteCount, seconds in midiWriteScaling():
+            print('%s parts, %s bytes: %.2f sec' % (partCount, byteCount,
+                seconds))
+    elif sys.argv[1] == 'segment':
+        for scoreCount, segmentCount, seconds, matrixSeconds in (
+                segmentSimilarityScaling()):
+            print('%s scores, %s segments: %.2f sec, matrix %.2f sec' % (
+                scoreCount, segmentCount, seconds, matrixSeconds))
+    elif sys.argv[1] == 'verticalities':
+        for workName, sliceCount, seconds in verticalSliceThroughput():
+            print('%s, %s slices: %.2f sec' % (workName, sliceCount, seconds))
+    elif sys.argv[1] == 'chordify':
+        for materialize, seconds in chordifyThroughput():
+            print('materialize=%s: %.2f sec' % (materialize, seconds))
 
 
 #------------------------------------------------------------------------------
@@ -3005,7 +3005,7 @@ class Test(unittest.TestCase):
         # this adds to elements list
         m1.leftBarline = b1
         self.assertEqual(len(m1), 2)
-        self.assertEqual(m1[1], b1) # this is on elements
+        self.assertEqual(m1[0], b1) # this is on elements, before the ts
         self.assertEqual(m1.rightBarline, None) # this is on elements
 
         b2 = bar.Barline('heavy')
@@ -4868,6 +4868,40 @@ class Test(unittest.TestCase):
         #post.show()
         self.assertEqual(len(post.flat.getElementsByClass('Chord')), 8)
 
+    def testChordifyNotMaterialized(self):
+        from music21 import corpus
+        from music21 import stream
+        s = corpus.parse('bach/bwv66.6')
+        noteCount = len(s.flat.notes)
+        chords = s.chordify().flat.notesAndRests
+        spans = list(s.chordify(materialize=False))
+        self.assertEqual(len(spans), len(chords))
+        for span, c in zip(spans, chords):
+            self.assertEqual(span.startOffset, c.offset)
+            self.assertEqual(span.quarterLength, c.quarterLength)
+            self.assertEqual(
+                sorted(p.nameWithOctave for p in span.toChord().pitches),
+                sorted(p.nameWithOctave for p in c.pitches))
+        # the pitches are those of the source, which is not changed
+        firstNote = s.parts[0].flat.notes[0]
+        self.assertTrue(spans[0].pitches[0] is firstNote.pitch)
+        self.assertEqual(firstNote.quarterLength, 0.5)
+        self.assertEqual(len(s.flat.notes), noteCount)
+
+        # a voice with an unchanged note sounds in both spans
+        s1 = stream.Stream()
+        m1 = stream.Measure()
+        v1 = stream.Voice()
+        v1.append(note.Note('g4', quarterLength=2))
+        v2 = stream.Voice()
+        v2.repeatAppend(note.Note('c4', quarterLength=1), 2)
+        m1.insert(0, v1)
+        m1.insert(0, v2)
+        s1.append(m1)
+        spans = list(s1.chordify(materialize=False))
+        self.assertEqual([len(span.pitches) for span in spans], [2, 2])
+        self.assertTrue(spans[0].elements[0] is spans[1].elements[0])
+
 
     def testOpusSearch(self):
         from music21 import corpus
@@ -5500,8 +5534,9 @@ class Test(unittest.TestCase):
         self.assertEqual(p1FlatNotes.derivationChain, [p1Flat, p1])
 
 
-        # we cannot do this, as each call to flat produces a new Stream
-        self.assertEqual(p1.flat.notesAndRests.derivesFrom is p1.flat, False)
+        # the flat representation is cached and kept across sorting, so
+        # repeated calls to flat return the same Stream
+        self.assertEqual(p1.flat.notesAndRests.derivesFrom is p1.flat, True)
         # chained calls to .derives from can be used
         self.assertEqual(p1.flat.notesAndRests.derivesFrom.derivesFrom is p1, True)
         
@@ -5705,12 +5740,19 @@ class Test(unittest.TestCase):
         self.assertEqual(len(rElements), 4)
 
 
-        s = corpus.parse('bwv66.6')
+        s = corpus.parse('bwv66.6', forceSource=True)
         m1 = s[2][1] # cannot use parts here as breaks active site
         rElements = m1.recurse(direction='upward')
         self.assertEqual([str(e.classes[0]) for e in rElements], ['Measure', 'Instrument', 'Part', 'Metadata', 'Part', 'Score', 'Part', 'Part', 'StaffGroup', 'Measure', 'Measure', 'Measure', 'Measure', 'Measure', 'Measure', 'Measure', 'Measure', 'Measure'])
         self.assertEqual(len(rElements), 18)
 
+        # in a Stream from the Stream cache, the activeSite of each Part is
+        # the Score, not the StaffGroup that was made after the Parts
+        s = corpus.parse('bwv66.6')
+        m1 = s[2][1]
+        rElements = m1.recurse(direction='upward')
+        self.assertEqual([str(e.classes[0]) for e in rElements], ['Measure', 'Instrument', 'Part', 'Metadata', 'Score', 'Part', 'Part', 'Part', 'StaffGroup', 'Measure', 'Measure', 'Measure', 'Measure', 'Measure', 'Measure', 'Measure', 'Measure', 'Measure'])
+
 
 
     def testRecurseB(self):
@@ -7334,6 +7376,336 @@ class Test(unittest.TestCase):
         #s.show()
 
 
+    def testGetElementsByClassIndex(self):
+        from music21 import stream, dynamics
+
+        s = stream.Stream()
+        s.append(meter.TimeSignature('4/4'))
+        s.repeatAppend(note.Note('C4'), 4)
+        s.insert(2, dynamics.Dynamic('p'))
+        s.storeAtEnd(bar.Barline('final'))
+        # index is built by the first call and agrees with a linear scan
+        self.assertEqual(len(s.getElementsByClass('Note')), 4)
+        self.assertEqual(len(s.getElementsByClass(note.Note)), 4)
+        self.assertEqual([e.classes[0] for e in s.getElementsByClass(
+            ['Dynamic', 'TimeSignature', 'Barline'])],
+            ['TimeSignature', 'Dynamic', 'Barline'])
+        # appending updates the index incrementally
+        s.append(note.Rest())
+        self.assertEqual(len(s.getElementsByClass('GeneralNote')), 5)
+        self.assertEqual(s.getElementsByClass('Rest')[0].offset, 4.0)
+        # inserting out of order, and removing, rebuild the index
+        n = note.Note('D4')
+        s.insert(0.5, n)
+        self.assertEqual([x.offset for x in s.getElementsByClass('Note')],
+            [0.0, 0.5, 1.0, 2.0, 3.0])
+        s.remove(n)
+        self.assertEqual(len(s.getElementsByClass('Note')), 4)
+        self.assertEqual(s.hasElementOfClass('Dynamic'), True)
+        s.removeByClass('Dynamic')
+        self.assertEqual(s.hasElementOfClass('Dynamic'), False)
+        self.assertEqual(len(s.getElementsByClass('Dynamic')), 0)
+        # a sorted copy keeps a separate index
+        s.autoSort = False
+        s.insert(0, note.Note('E4'))
+        self.assertEqual(len(s.sorted.getElementsByClass('Note')), 5)
+        self.assertEqual(len(s.getElementsByClass('Note')), 5)
+
+
+    def testGetElementsByOffsetIndex(self):
+        from music21 import stream
+
+        s = stream.Stream()
+        s.insert(0, clef.TrebleClef())
+        for i, ql in enumerate([4, 1, 0.5, 2, 1.5, 3]):
+            n = note.Note('C4', quarterLength=ql)
+            s.insert(i * 1.5, n)
+        s.insert(3.0, meter.TimeSignature('3/4'))
+
+        def check():
+            # compare every query to the linear search
+            results = []
+            for start, end in [(0, None), (1, 3), (3, None), (2.5, 4.5),
+                (7.5, 9), (0, 20)]:
+                for mustBegin in (True, False):
+                    for endBoundary in (True, False):
+                        post = s.getElementsByOffset(start, end,
+                            mustBeginInSpan=mustBegin,
+                            includeEndBoundary=endBoundary)
+                        results.append([id(e) for e in post])
+                results.append(id(s.getElementAtOrBefore(start, ['Note'])))
+                results.append(id(s.getElementAtOrBefore(start,
+                    ['TimeSignature'])))
+                results.append(id(s.getElementBeforeOffset(start, ['Note'])))
+            return results
+
+        unused = check() # first call marks the index as needed
+        indexed = check()
+        self.assertNotEqual(s._cache['offsetIndex'], None)
+        s._cache = {}
+        s._getOffsetIndex = lambda: None
+        self.assertEqual(indexed, check())
+        del s._getOffsetIndex
+
+        # changing an offset or duration discards the index
+        check()
+        self.assertNotEqual(s._cache['offsetIndex'], None)
+        n = s.getElementsByClass('Note')[1]
+        n.setOffsetBySite(s, 10.0)
+        self.assertEqual('offsetIndex' in s._cache, False)
+        check()
+        self.assertEqual(s.getElementsByOffset(10.0)[0], n)
+        n.duration = duration.Duration(8)
+        self.assertEqual('offsetIndex' in s._cache, False)
+        check()
+        self.assertEqual(n in s.getElementsByOffset(17.0,
+            mustBeginInSpan=False), True)
+
+    def testOffsetIndexDurationEditedInPlace(self):
+        from music21 import note
+        for setLength in (
+            lambda n: setattr(n, 'quarterLength', 10),
+            lambda n: setattr(n.duration, 'quarterLength', 10),
+            lambda n: setattr(n.duration, 'type', 'breve'),
+            ):
+            s = Stream()
+            s.repeatAppend(note.Note(), 8)
+            for unused in range(3): # build the index
+                s.getElementsByOffset(5, 6, mustBeginInSpan=False)
+            setLength(s[0])
+            post = s.getElementsByOffset(5, 6, mustBeginInSpan=False)
+            self.assertEqual([e.offset for e in post], [0.0, 4.0, 5.0, 6.0])
+            post = s.getElementsByOffset(5, 6, mustBeginInSpan=False)
+            self.assertEqual([e.offset for e in post], [0.0, 4.0, 5.0, 6.0])
+
+
+    def testIncrementalCacheInvalidation(self):
+        from music21 import stream
+
+        # appending keeps and extends cached values
+        m = stream.Measure()
+        m.append(note.Note('C4', quarterLength=2))
+        mFlat = m.flat
+        mFlat.sort()
+        self.assertEqual(m.highestTime, 2.0)
+        m.append(note.Note('D4'))
+        self.assertEqual(m._cache['HighestTime'], 3.0)
+        self.assertEqual(m.flat is mFlat, True)
+        self.assertEqual([n.offset for n in mFlat.notes], [0.0, 2.0])
+
+        # an insert before the end clears the caches
+        m.insert(1.0, note.Note('E4'))
+        self.assertEqual(m.flat is mFlat, False)
+        self.assertEqual([n.name for n in m.flat.notes], ['C', 'E', 'D'])
+
+        # enclosing Streams are informed at the end of a batchEdit block
+        p = stream.Part()
+        p.append(m)
+        self.assertEqual(len(p.flat.notes), 3)
+        with m.batchEdit():
+            with m.batchEdit():
+                m.append(note.Note('F4'))
+            self.assertEqual(len(m.notes), 4)
+            m.append(note.Note('G4'))
+        self.assertEqual(len(p.flat.notes), 5)
+        self.assertEqual(p.flat.highestTime, 5.0)
+
+
+    def testInsertMany(self):
+        from music21 import stream
+
+        def build(useInsertMany):
+            s = stream.Stream()
+            s.insert(0, clef.BassClef())
+            pairs = [(2, note.Note('E')), (0, meter.TimeSignature('2/4')),
+                (0, note.Note('C')), (1, stream.Voice())]
+            if useInsertMany:
+                s.insertMany(pairs)
+            else:
+                for offset, e in pairs:
+                    s.insert(offset, e)
+            return s
+
+        s1 = build(False)
+        s2 = build(True)
+        self.assertEqual([(e.offset, e.classes[0]) for e in s1],
+            [(e.offset, e.classes[0]) for e in s2])
+        self.assertEqual(s2.isFlat, False)
+        self.assertEqual(s2.highestTime, 3.0)
+        self.assertEqual(len(s2.getElementsByClass('Note')), 2)
+        for e in s2:
+            self.assertEqual(e.activeSite is s2, True)
+
+        # isFlat is updated even if only non-Stream elements are inserted
+        s3 = stream.Stream()
+        s3._appendCore(stream.Measure())
+        s3._insertManyCore([(0, clef.BassClef())])
+        self.assertEqual(s3.isFlat, False)
+
+
+    def testStreamView(self):
+        from music21 import stream
+
+        s = stream.Score()
+        for partOffset in (0, 0.5):
+            p = stream.Part()
+            for i in range(3):
+                m = stream.Measure()
+                m.append(note.Note('C4', quarterLength=1.5))
+                m.append(note.Rest())
+                m.rightBarline = 'final'
+                p.append(m)
+            p.storeAtEnd(bar.Barline('double'))
+            s.insert(partOffset, p)
+        s.insert(0, clef.TrebleClef())
+
+        sFlat = s.flat
+        sv = s.flatView
+        self.assertEqual([(e.getOffsetBySite(sFlat), id(e)) for e in sFlat],
+            [(o, id(e)) for o, e in sv.offsetsAndElements()])
+        self.assertEqual(len(sv.notesAndRests), 12)
+        self.assertEqual(len(sv.getElementsByClass(['Note', 'Rest'])), 12)
+
+        p = s.parts[0]
+        measures = p.getElementsByClass('Measure')
+        mv = p.getElementsByClass('Measure', returnStreamSubClass='view')
+        self.assertEqual(list(mv), list(measures))
+        self.assertEqual(mv[1] in mv, True)
+        self.assertEqual(mv.getOffsetByElement(mv[1]), 2.5)
+        # a view does not add a site to its elements
+        n = sv.notes[0]
+        siteCount = n.sites.getSiteCount()
+        self.assertEqual(len(s.flatView.notes), 6)
+        self.assertEqual(n.sites.getSiteCount(), siteCount)
+
+        # flat views of views, and read-only properties, match the Streams
+        # they stand for without creating them
+        pFlat = p.flat
+        self.assertEqual([(e.getOffsetBySite(pFlat), id(e)) for e in pFlat],
+            [(o, id(e)) for o, e in p.flatView.offsetsAndElements()])
+        measuresFlat = measures.flat
+        self.assertEqual([(e.getOffsetBySite(measuresFlat), id(e))
+            for e in measuresFlat],
+            [(o, id(e)) for o, e in mv.flat.offsetsAndElements()])
+        self.assertEqual(len(mv.flat.notes), 3)
+        for view, src in ((mv, measures), (mv.flat.notes, measuresFlat.notes),
+            (p.flatView, pFlat), (s.flatView.notes, s.flat.notes),
+            (s.flatView.getElementsByClass('Barline'),
+                s.flat.getElementsByClass('Barline'))):
+            self.assertEqual(view.highestTime, src.highestTime)
+            self.assertEqual(view.highestOffset, src.highestOffset)
+            self.assertEqual(view.lowestOffset, src.lowestOffset)
+            self.assertEqual(view.duration.quarterLength,
+                src.duration.quarterLength)
+            self.assertEqual(view._stream, None)
+        self.assertEqual(mv.measure(2) is p.measure(2), True)
+        self.assertEqual(len(mv.measures(2, 3)), len(p.measures(2, 3)))
+        self.assertEqual(mv._stream, None)
+
+        from music21 import corpus
+        chorale = corpus.parse('bach/bwv66.6')
+        soprano = chorale.parts[0]
+        self.assertEqual(len(soprano.getElementsByClass('Measure',
+            returnStreamSubClass='view').flat.notes), 37)
+        self.assertEqual(len(chorale.flatView.getElementsByClass('Part')), 0)
+        self.assertEqual(len(chorale.getElementsByClass('Part',
+            returnStreamSubClass='view').flat.notes),
+            len(chorale.flat.notes))
+
+        # mutating a view creates a Stream, leaving the source unchanged
+        mv.append(stream.Measure())
+        self.assertEqual(len(mv), 4)
+        self.assertEqual(mv.stream().derivesFrom is p, True)
+        self.assertEqual(len(p.getElementsByClass('Measure')), 3)
+
+
+    def testSharedCopy(self):
+        from music21 import corpus
+        from music21 import stream
+        from music21 import spanner
+
+        def contents(s):
+            sFlat = s.flat
+            return [(e.getOffsetBySite(sFlat), repr(e), e.duration.quarterLength,
+                getattr(e, 'tie', None) is not None) for e in sFlat]
+
+        p = stream.Part()
+        p.append(note.Note('C4', quarterLength=6))
+        p.append(note.Note('E4', quarterLength=1.5))
+        p.append(note.Note('F4', quarterLength=0.5))
+        p = p.makeNotation()
+        notes = p.flat.notes
+        p.insert(0, spanner.Slur(notes[0], notes[-1]))
+        before = contents(p)
+
+        p2 = p.sharedCopy()
+        self.assertEqual(contents(p2), before)
+        self.assertEqual(p2.flat.notes[1] is notes[1], True)
+
+        # the tied note is copied and changed; the others stay shared
+        p2.stripTies(inPlace=True, retainContainers=True)
+        self.assertEqual(contents(p), before)
+        self.assertEqual(contents(p2),
+            contents(copy.deepcopy(p).stripTies(retainContainers=True)))
+        self.assertEqual(p2.flat.notes[0] is notes[0], False)
+        self.assertEqual(p2.flat.notes[-1] is notes[-1], True)
+        slur = p2.getElementsByClass('Slur')[0]
+        self.assertEqual(slur.getFirst() is p2.flat.notes[0], True)
+        self.assertEqual(p.getElementsByClass('Slur')[0].getFirst() is notes[0],
+            True)
+
+        p3 = p.sharedCopy()
+        p3.sliceByBeat(inPlace=True)
+        self.assertEqual(contents(p), before)
+        self.assertEqual(contents(p3), contents(p.sliceByBeat()))
+
+        p4 = p.sharedCopy()
+        p4.transpose('P5', inPlace=True)
+        self.assertEqual(contents(p), before)
+        self.assertEqual([n.nameWithOctave for n in p4.flat.notes],
+            ['G4', 'G4', 'B4', 'C5'])
+
+        # methods that change many elements in place unshare them first
+        from music21 import converter
+        p = converter.parse("f#8 f# g a b- b- c' d'", '2/4').makeMeasures()
+        def noteContents(s):
+            return [(n.offset, n.nameWithOctave, n.quarterLength,
+                n.beams.getTypes(), n.pitch.accidental is not None and
+                n.pitch.accidental.displayStatus) for n in s.flat.notes]
+        before = noteContents(p)
+        for method, args in (('makeBeams', ()), ('makeAccidentals', ()),
+                ('augmentOrDiminish', (2,)), ('makeTies', ())):
+            p6 = p.sharedCopy()
+            getattr(p6, method)(*args, inPlace=True)
+            self.assertEqual(noteContents(p), before)
+            expected = copy.deepcopy(p)
+            getattr(expected, method)(*args, inPlace=True)
+            self.assertEqual(noteContents(p6), noteContents(expected))
+
+        # and so do Streams derived from the copy
+        s = corpus.parse('bach/bwv66.6')
+        def sourceContents():
+            return [(n.nameWithOctave, str(n.beams), n.tie)
+                for n in s.flat.notes]
+        before = sourceContents()
+        s2 = s.sharedCopy()
+        s2.parts[0].makeNotation(inPlace=True)
+        self.assertEqual(sourceContents(), before)
+        s2 = s.sharedCopy()
+        s2.parts[0].getElementsByClass('Measure').makeBeams(inPlace=True)
+        self.assertEqual(sourceContents(), before)
+        s2 = s.sharedCopy()
+        s2.flat.transpose('M2', inPlace=True)
+        self.assertEqual(sourceContents(), before)
+        self.assertEqual([n.nameWithOctave for n in s2.flat.notes],
+            [n.nameWithOctave for n in s.flat.transpose('M2').notes])
+
+        # a copy of a shared copy shares nothing
+        p5 = copy.deepcopy(p.sharedCopy())
+        self.assertEqual(p5.flat.notes[-1] is notes[-1], False)
+        self.assertEqual(p5._sharedCopyState, None)
+
+
 
 #------------------------------------------------------------------------------
 
@@ -143,6 +143,7 @@ from music21 import voiceLeading
 from music21 import roman
 from music21 import chord
 from music21 import key
+from music21 import timespans
 from music21.theoryAnalysis import theoryResult
 
 import string
@@ -264,30 +265,39 @@ def getVerticalSlices(score, classFilterList=['Note', 'Chord', 'Harmony', 'Rest'
     if 'VerticalSlices' in score.analysisData and score.analysisData['VerticalSlices'] != None:
         return score.analysisData['VerticalSlices']
 
-    # if elements exist at same offset, return both 
-
-    # If speed is an issue, could try using offset maps...
-    
-    chordifiedSc = score.chordify()
-    
-    for c in chordifiedSc.flat.getElementsByClass('Chord'):
+    # index the notes and rests of each part in one pass; as in chordify, a
+    # slice is taken at each offset where a note or rest starts or stops
+    # and something other than a rest is sounding
+    if len(score.parts) > 1:
+        partFlats = [part.flat for part in score.parts]
+    else:
+        partFlats = [score.flat]
+    classList = ['GeneralNote'] + list(classFilterList)
+    partTrees = [timespans.streamToTimespanCollection(partFlat, classList)
+        for partFlat in partFlats]
+    allOffsets = set()
+    for tree in partTrees:
+        allOffsets.update(tree.allOffsets())
+
+    for offset in sorted(allOffsets):
         contentDict = defaultdict(list)
-        partNum= 0
-        
-        if len(score.parts) > 1:
-            for part in score.parts:
-                elementStream = part.flat.getElementsByOffset(c.offset,mustBeginInSpan=False, classList=classFilterList)
-                #el = part.flat.getElementAtOrBefore(c.offset,classList=['Note','Rest', 'Chord', 'Harmony'])
-                for el in elementStream.elements:
-                    contentDict[partNum].append(el)    
-                partNum+=1
-        else:
-            elementStream = score.flat.getElementsByOffset(c.offset,mustBeginInSpan=False, classList=classFilterList)
-            #el = part.flat.getElementAtOrBefore(c.offset,classList=['Note','Rest', 'Chord', 'Harmony'])
-            for el in elementStream.elements:
-                contentDict[partNum].append(el)    
-            partNum+=1
-                    
+        isSounding = False
+        for partNum, tree in enumerate(partTrees):
+            # elements sounding across the offset, or starting at it, in
+            # the order of the flat part
+            found = tree.findTimespansOverlapping(offset) + \
+                tree.findTimespansStartingAt(offset)
+            for timespan in found:
+                el = timespan.element
+                if not el.isClassOrSubclass(['Rest']) and \
+                    el.isClassOrSubclass(['GeneralNote']):
+                    isSounding = True
+                if el.isClassOrSubclass(classFilterList):
+                    # offsets of elements in slices are those of the score
+                    el.activeSite = partFlats[partNum]
+                    contentDict[partNum].append(el)
+        if not isSounding:
+            continue
         vs = voiceLeading.VerticalSlice(contentDict)
         vsList.append(vs)
     if classFilterList==['Note', 'Chord', 'Harmony', 'Rest']:
@@ -0,0 +1,703 @@
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------
+# Name:         timespans.py
+# Purpose:      indexed timespans of the elements of a Score
+#
+# Authors:      music21 contributors
+#
+# Copyright:    Copyright © 2026 the music21 Project
+# License:      LGPL, see license.txt
+#------------------------------------------------------------------------------
+'''
+Tools for finding what is sounding when in a Score, without changing or
+copying it.
+
+:func:`~music21.timespans.streamToTimespanCollection` makes, in a single
+pass over a Stream and all the Streams in it, an
+:class:`~music21.timespans.ElementTimespan` for each Note and Chord (or
+other element) with its start and stop offsets in the whole Stream. The
+:class:`~music21.timespans.TimespanCollection` of these answers "what starts
+at", "what stops at", "what is sounding at", and "what sounds in" any
+offsets in O(log n + k) time, and gives a
+:class:`~music21.timespans.Verticality` for any offset, or for each start
+offset in turn.
+
+>>> score = corpus.parse('bach/bwv66.6')
+>>> tree = timespans.streamToTimespanCollection(score)
+>>> verticality = tree.getVerticalityAt(6.5)
+>>> verticality
+<Verticality 6.5 {E3 D4 G#4 B4}>
+>>> for timespan in verticality.startAndOverlapTimespans:
+...     print timespan
+<ElementTimespan 6.0:7.0 <music21.note.Note B> in Soprano>
+<ElementTimespan 6.0:7.0 <music21.note.Note G#> in Alto>
+<ElementTimespan 6.0:7.0 <music21.note.Note E> in Bass>
+<ElementTimespan 6.5:7.0 <music21.note.Note D> in Tenor>
+'''
+
+import bisect
+import copy
+import unittest
+
+from music21 import common
+from music21 import exceptions21
+from music21.stream import offsetIndex
+
+from music21 import environment
+environLocal = environment.Environment('timespans')
+
+
+#------------------------------------------------------------------------------
+
+
+class TimespanException(exceptions21.Music21Exception):
+    pass
+
+
+#------------------------------------------------------------------------------
+
+
+class ElementTimespan(object):
+    '''
+    The span of time, from `startOffset` to `stopOffset`, taken by
+    `element`. The offsets are those in the outermost Stream; `parentage`
+    is a tuple of the Streams that contain `element`, innermost first, and
+    `part` is the one of them that is a Part of the outermost Stream (or
+    the outermost Stream, if it has no Parts).
+
+    The element is not copied or changed.
+
+    >>> n = note.Note('C4', quarterLength=2)
+    >>> m = stream.Measure()
+    >>> m.insert(1.0, n)
+    >>> p = stream.Part()
+    >>> p.insert(4.0, m)
+    >>> timespan = timespans.ElementTimespan(n, (m, p), 5.0, 7.0, p)
+    >>> timespan
+    <ElementTimespan 5.0:7.0 <music21.note.Note C>>
+    >>> timespan.quarterLength
+    2.0
+    >>> timespan.pitches
+    (<music21.pitch.Pitch C4>,)
+    >>> timespan.pitches[0] is n.pitch
+    True
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        'element',
+        'parentage',
+        'part',
+        'startOffset',
+        'stopOffset',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, element, parentage, startOffset, stopOffset,
+        part=None):
+        self.element = element
+        self.parentage = tuple(parentage)
+        self.part = part
+        self.startOffset = startOffset
+        self.stopOffset = stopOffset
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        if self.part is not None and self.part.id is not None and \
+            not isinstance(self.part.id, (int, long)):
+            return '<ElementTimespan %s:%s %r in %s>' % (self.startOffset,
+                self.stopOffset, self.element, self.part.id)
+        return '<ElementTimespan %s:%s %r>' % (self.startOffset,
+            self.stopOffset, self.element)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def measureNumber(self):
+        '''
+        The number of the innermost Measure containing the element, or None.
+        '''
+        for container in self.parentage:
+            if 'Measure' in container.classes:
+                return container.number
+        return None
+
+    @property
+    def pitches(self):
+        '''
+        The Pitch objects of the element (not copies), or an empty tuple.
+        '''
+        if hasattr(self.element, 'pitches'):
+            return tuple(self.element.pitches)
+        return ()
+
+    @property
+    def quarterLength(self):
+        return self.stopOffset - self.startOffset
+
+
+#------------------------------------------------------------------------------
+
+
+class Verticality(object):
+    '''
+    The ElementTimespans of a TimespanCollection that start at, sound
+    through, and stop at one offset, as found by
+    :meth:`~music21.timespans.TimespanCollection.getVerticalityAt`.
+
+    >>> score = corpus.parse('bach/bwv66.6')
+    >>> tree = timespans.streamToTimespanCollection(score)
+    >>> verticality = tree.getVerticalityAt(1.0)
+    >>> verticality.startOffset
+    1.0
+    >>> len(verticality.startTimespans), len(verticality.stopTimespans)
+    (4, 4)
+    >>> verticality.overlapTimespans
+    ()
+    >>> verticality.pitches
+    (<music21.pitch.Pitch A4>, <music21.pitch.Pitch F#4>, <music21.pitch.Pitch C#4>, <music21.pitch.Pitch F#3>)
+    >>> verticality.nextVerticality
+    <Verticality 2.0 {G#3 B3 E4 B4}>
+    >>> verticality.previousVerticality
+    <Verticality 0.5 {G#3 B3 E4 B4}>
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        'overlapTimespans',
+        'startOffset',
+        'startTimespans',
+        'stopTimespans',
+        'timespanCollection',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, timespanCollection=None, startOffset=None,
+        startTimespans=(), overlapTimespans=(), stopTimespans=()):
+        self.timespanCollection = timespanCollection
+        self.startOffset = startOffset
+        self.startTimespans = tuple(startTimespans)
+        self.overlapTimespans = tuple(overlapTimespans)
+        self.stopTimespans = tuple(stopTimespans)
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        pitches = sorted(self.pitches, key=lambda p: (p.ps, p.nameWithOctave))
+        return '<Verticality %s {%s}>' % (self.startOffset,
+            ' '.join(p.nameWithOctave for p in pitches))
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def nextStartOffset(self):
+        '''
+        The first start offset after this one in the TimespanCollection, or
+        None.
+        '''
+        return self.timespanCollection.getStartOffsetAfter(self.startOffset)
+
+    @property
+    def nextVerticality(self):
+        '''
+        The Verticality at the next start offset, or None.
+        '''
+        offset = self.nextStartOffset
+        if offset is None:
+            return None
+        return self.timespanCollection.getVerticalityAt(offset)
+
+    @property
+    def pitches(self):
+        '''
+        The Pitch objects (not copies) of all the elements sounding at this
+        offset, in the order of startAndOverlapTimespans.
+        '''
+        post = []
+        for timespan in self.startAndOverlapTimespans:
+            post.extend(timespan.pitches)
+        return tuple(post)
+
+    @property
+    def previousVerticality(self):
+        '''
+        The Verticality at the previous start offset, or None.
+        '''
+        offset = self.timespanCollection.getStartOffsetBefore(
+            self.startOffset)
+        if offset is None:
+            return None
+        return self.timespanCollection.getVerticalityAt(offset)
+
+    @property
+    def startAndOverlapTimespans(self):
+        '''
+        All the ElementTimespans sounding at this offset (those starting
+        at it or before it and stopping after it), in order of start offset.
+        '''
+        return self.overlapTimespans + self.startTimespans
+
+
+#------------------------------------------------------------------------------
+
+
+class VerticalitySpan(object):
+    '''
+    The ElementTimespans sounding from `startOffset` to `stopOffset`, a span
+    of time in which none of them starts or stops: a record of one Chord of
+    :meth:`~music21.stream.Stream.chordify`, made without copying anything.
+
+    Make a Chord (or Rest) only when one is needed, with
+    :meth:`~music21.timespans.VerticalitySpan.toChord`.
+
+    >>> score = corpus.parse('bach/bwv66.6')
+    >>> tree = timespans.streamToTimespanCollection(score)
+    >>> spans = list(tree.iterateVerticalitySpans())
+    >>> span = [x for x in spans if x.startOffset == 6.5][0]
+    >>> span
+    <VerticalitySpan 6.5:7.0 {E3 D4 G#4 B4}>
+    >>> span.quarterLength
+    0.5
+    >>> for part in span.parts:
+    ...     print part.id
+    Soprano
+    Alto
+    Tenor
+    Bass
+    >>> span.pitches[0] is span.elements[0].pitch
+    True
+    >>> c = span.toChord()
+    >>> c
+    <music21.chord.Chord B4 G#4 D4 E3>
+    >>> c.quarterLength
+    0.5
+    >>> c.pitches[0] is span.pitches[0]
+    False
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        'startOffset',
+        'stopOffset',
+        'timespans',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, startOffset, stopOffset, timespans=()):
+        self.startOffset = startOffset
+        self.stopOffset = stopOffset
+        self.timespans = tuple(timespans)
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        pitches = sorted(self.pitches, key=lambda p: (p.ps, p.nameWithOctave))
+        return '<VerticalitySpan %s:%s {%s}>' % (self.startOffset,
+            self.stopOffset, ' '.join(p.nameWithOctave for p in pitches))
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def elements(self):
+        '''
+        The elements sounding in this span (not copies).
+        '''
+        return tuple(timespan.element for timespan in self.timespans)
+
+    @property
+    def parts(self):
+        '''
+        The Parts (or other Streams) the elements sounding in this span come
+        from, without duplicates.
+        '''
+        post = []
+        for timespan in self.timespans:
+            if timespan.part is not None and timespan.part not in post:
+                post.append(timespan.part)
+        return tuple(post)
+
+    @property
+    def pitches(self):
+        '''
+        The Pitch objects (not copies) of all the elements sounding in this
+        span.
+        '''
+        post = []
+        for timespan in self.timespans:
+            post.extend(timespan.pitches)
+        return tuple(post)
+
+    @property
+    def quarterLength(self):
+        return self.stopOffset - self.startOffset
+
+    ### PUBLIC METHODS ###
+
+    def toChord(self, removeRedundantPitches=True):
+        '''
+        Return a new :class:`~music21.chord.Chord` of copies of the pitches
+        sounding in this span, as long as the span, or a
+        :class:`~music21.note.Rest` if no pitches sound. Ties, articulations
+        and expressions are not added.
+        '''
+        from music21 import chord
+        from music21 import note
+        pitches = [copy.deepcopy(p) for p in self.pitches]
+        if not pitches:
+            return note.Rest(quarterLength=self.quarterLength)
+        c = chord.Chord(pitches)
+        c.quarterLength = self.quarterLength
+        if removeRedundantPitches:
+            c.removeRedundantPitches(inPlace=True)
+        return c
+
+
+#------------------------------------------------------------------------------
+
+
+class TimespanCollection(object):
+    '''
+    An index of ElementTimespans by their start and stop offsets.
+
+    Timespans starting at the same offset are kept in the order given.
+
+    >>> n1 = note.Note('C4', quarterLength=4)
+    >>> n2 = note.Note('E4', quarterLength=2)
+    >>> n3 = note.Note('G4', quarterLength=2)
+    >>> tree = timespans.TimespanCollection([
+    ...     timespans.ElementTimespan(n1, (), 0.0, 4.0),
+    ...     timespans.ElementTimespan(n2, (), 0.0, 2.0),
+    ...     timespans.ElementTimespan(n3, (), 2.0, 4.0)])
+    >>> len(tree)
+    3
+    >>> tree.allOffsets()
+    (0.0, 2.0, 4.0)
+    >>> tree.findTimespansStartingAt(2.0)
+    (<ElementTimespan 2.0:4.0 <music21.note.Note G>>,)
+    >>> tree.findTimespansStoppingAt(2.0)
+    (<ElementTimespan 0.0:2.0 <music21.note.Note E>>,)
+    >>> tree.findTimespansOverlapping(2.0)
+    (<ElementTimespan 0.0:4.0 <music21.note.Note C>>,)
+    >>> tree.findTimespansInRange(1.0, 2.0)
+    (<ElementTimespan 0.0:4.0 <music21.note.Note C>>, <ElementTimespan 0.0:2.0 <music21.note.Note E>>)
+    >>> for verticality in tree.iterateVerticalities():
+    ...     print verticality
+    <Verticality 0.0 {C4 E4}>
+    <Verticality 2.0 {C4 G4}>
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_index',
+        '_stopOffsets',
+        '_stopOrder',
+        '_timespans',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, timespans=()):
+        self._timespans = list(timespans)
+        self._index = offsetIndex.OffsetIndex(
+            [(timespan.startOffset, timespan.stopOffset, i)
+                for i, timespan in enumerate(self._timespans)])
+        self._stopOrder = sorted(range(len(self._timespans)),
+            key=lambda i: (self._timespans[i].stopOffset, i))
+        self._stopOffsets = [self._timespans[i].stopOffset
+            for i in self._stopOrder]
+
+    ### SPECIAL METHODS ###
+
+    def __iter__(self):
+        timespans = self._timespans
+        for i in self._index.positions:
+            yield timespans[i]
+
+    def __len__(self):
+        return len(self._timespans)
+
+    ### PRIVATE METHODS ###
+
+    def _getTimespans(self, positions):
+        timespans = self._timespans
+        return tuple(timespans[i] for i in positions)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def startOffset(self):
+        '''
+        The earliest start offset, or None if there are no timespans.
+        '''
+        if not self._timespans:
+            return None
+        return self._index.starts[0]
+
+    @property
+    def stopOffset(self):
+        '''
+        The latest stop offset, or None if there are no timespans.
+        '''
+        if not self._timespans:
+            return None
+        return self._stopOffsets[-1]
+
+    ### PUBLIC METHODS ###
+
+    def allOffsets(self):
+        '''
+        All the start and stop offsets, sorted, without duplicates.
+        '''
+        return tuple(sorted(set(self._index.starts) | set(self._stopOffsets)))
+
+    def allStartOffsets(self):
+        '''
+        All the start offsets, sorted, without duplicates.
+        '''
+        return tuple(sorted(set(self._index.starts)))
+
+    def allStopOffsets(self):
+        '''
+        All the stop offsets, sorted, without duplicates.
+        '''
+        return tuple(sorted(set(self._stopOffsets)))
+
+    def findTimespansInRange(self, startOffset, stopOffset):
+        '''
+        All the timespans sounding between `startOffset` and `stopOffset`:
+        those starting before `stopOffset` and stopping after
+        `startOffset`, and those of no length at or after `startOffset` and
+        before `stopOffset`; in order of start offset.
+        '''
+        post = []
+        for i in self._index.overlapping(startOffset, stopOffset):
+            timespan = self._timespans[i]
+            if timespan.startOffset == timespan.stopOffset:
+                if startOffset <= timespan.startOffset < stopOffset:
+                    post.append(timespan)
+            elif (timespan.startOffset < stopOffset and
+                timespan.stopOffset > startOffset):
+                post.append(timespan)
+        return tuple(post)
+
+    def findTimespansOverlapping(self, offset):
+        '''
+        All the timespans that start before `offset` and stop after it, in
+        order of start offset.
+        '''
+        post = []
+        for i in self._index.overlapping(offset, offset):
+            timespan = self._timespans[i]
+            if timespan.startOffset < offset < timespan.stopOffset:
+                post.append(timespan)
+        return tuple(post)
+
+    def findTimespansStartingAt(self, offset):
+        '''
+        All the timespans that start at `offset`.
+        '''
+        return self._getTimespans(self._index.startingBetween(offset, offset))
+
+    def findTimespansStoppingAt(self, offset):
+        '''
+        All the timespans that stop at `offset`.
+        '''
+        low = bisect.bisect_left(self._stopOffsets, offset)
+        high = bisect.bisect_right(self._stopOffsets, offset)
+        return self._getTimespans(self._stopOrder[low:high])
+
+    def getStartOffsetAfter(self, offset):
+        '''
+        The first start offset after `offset`, or None.
+        '''
+        starts = self._index.starts
+        i = bisect.bisect_right(starts, offset)
+        if i < len(starts):
+            return starts[i]
+        return None
+
+    def getStartOffsetBefore(self, offset):
+        '''
+        The last start offset before `offset`, or None.
+        '''
+        starts = self._index.starts
+        i = bisect.bisect_left(starts, offset)
+        if i > 0:
+            return starts[i - 1]
+        return None
+
+    def getVerticalityAt(self, offset):
+        '''
+        Return a Verticality of the timespans starting at, sounding
+        through, and stopping at `offset`.
+        '''
+        return Verticality(
+            timespanCollection=self,
+            startOffset=offset,
+            startTimespans=self.findTimespansStartingAt(offset),
+            overlapTimespans=self.findTimespansOverlapping(offset),
+            stopTimespans=self.findTimespansStoppingAt(offset),
+            )
+
+    def iterateVerticalities(self, reverse=False):
+        '''
+        Yield a Verticality for each start offset in turn (or in reverse
+        order, if `reverse` is True), each made only when it is needed.
+        '''
+        offsets = self.allStartOffsets()
+        if reverse:
+            offsets = reversed(offsets)
+        for offset in offsets:
+            yield self.getVerticalityAt(offset)
+
+    def iterateVerticalitySpans(self):
+        '''
+        Yield a VerticalitySpan for each span of time, between two
+        consecutive offsets, in which some timespan sounds, each made only
+        when it is needed. The timespans of each span are in the order in
+        which they were given to the collection.
+        '''
+        offsets = self.allOffsets()
+        timespans = self._timespans
+        for i in range(len(offsets) - 1):
+            startOffset = offsets[i]
+            stopOffset = offsets[i + 1]
+            found = []
+            for position in sorted(
+                self._index.overlapping(startOffset, stopOffset)):
+                timespan = timespans[position]
+                if timespan.startOffset == timespan.stopOffset:
+                    if timespan.startOffset == startOffset:
+                        found.append(timespan)
+                elif (timespan.startOffset < stopOffset and
+                    timespan.stopOffset > startOffset):
+                    found.append(timespan)
+            if found:
+                yield VerticalitySpan(startOffset, stopOffset, found)
+
+
+#------------------------------------------------------------------------------
+
+
+def streamToTimespanCollection(inputStream, classList=('Note', 'Chord')):
+    '''
+    Return a :class:`~music21.timespans.TimespanCollection` of an
+    :class:`~music21.timespans.ElementTimespan` for each element of one of
+    the classes of `classList` in `inputStream` or in any Stream in it,
+    found in a single pass. Nothing is copied or changed. Offsets are
+    cleaned up with :func:`~music21.common.cleanupFloat`.
+
+    >>> score = corpus.parse('bach/bwv66.6')
+    >>> tree = timespans.streamToTimespanCollection(score)
+    >>> len(tree) == len(score.flat.notes)
+    True
+    >>> tree.stopOffset
+    36.0
+    >>> timespan = tree.findTimespansStartingAt(0.0)[0]
+    >>> timespan
+    <ElementTimespan 0.0:0.5 <music21.note.Note C#> in Soprano>
+    >>> timespan.measureNumber
+    0
+    >>> timespan.parentage[0].number, timespan.parentage[1] is score.parts[0]
+    (0, True)
+    >>> rests = timespans.streamToTimespanCollection(score, ['Rest'])
+    >>> len(rests)
+    0
+    '''
+    timespans = []
+
+    def recurse(container, containerOffset, parentage, part):
+        for element in container:
+            offset = containerOffset + element.getOffsetBySite(container)
+            if element.isStream:
+                if part is None:
+                    elementPart = element
+                else:
+                    elementPart = part
+                recurse(element, offset, (element,) + parentage, elementPart)
+            elif element.isClassOrSubclass(classList):
+                # as in getElementsByOffset, remove the rounding errors of
+                # summed offsets, so that equal offsets compare equal
+                startOffset = common.cleanupFloat(offset)
+                stopOffset = common.cleanupFloat(
+                    offset + element.duration.quarterLength)
+                timespans.append(ElementTimespan(element, parentage,
+                    startOffset, stopOffset, part))
+
+    if inputStream.hasPartLikeStreams():
+        part = None
+    else:
+        part = inputStream
+    recurse(inputStream, 0.0, (inputStream,), part)
+    return TimespanCollection(timespans)
+
+
+#------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+
+    def runTest(self):
+        pass
+
+    def testAgainstGetElementsByOffset(self):
+        from music21 import corpus
+        score = corpus.parse('bach/bwv66.6')
+        flatNotes = score.flat.notes
+        tree = streamToTimespanCollection(score)
+        self.assertEqual(len(tree), len(flatNotes))
+        for offset in tree.allOffsets():
+            found = flatNotes.getElementsByOffset(offset,
+                mustBeginInSpan=False)
+            verticality = tree.getVerticalityAt(offset)
+            self.assertEqual(
+                set(id(x.element)
+                    for x in verticality.startAndOverlapTimespans),
+                set(id(x) for x in found))
+            self.assertEqual(
+                set(id(x.element) for x in verticality.stopTimespans),
+                set(id(x) for x in flatNotes
+                    if x.offset + x.quarterLength == offset))
+        for startOffset, stopOffset in [(0.0, 1.0), (2.5, 7.0),
+            (30.0, 40.0)]:
+            found = flatNotes.getElementsByOffset(startOffset,
+                stopOffset, mustBeginInSpan=False, includeEndBoundary=False,
+                includeElementsThatEndAtStart=False)
+            self.assertEqual(
+                [id(x.element) for x in
+                    tree.findTimespansInRange(startOffset, stopOffset)],
+                [id(x) for x in found])
+
+    def testReverseVerticalities(self):
+        from music21 import note
+        timespans = []
+        for i in range(4):
+            n = note.Note(60 + i)
+            timespans.append(ElementTimespan(n, (), float(i), i + 1.0))
+        tree = TimespanCollection(timespans)
+        offsets = [x.startOffset
+            for x in tree.iterateVerticalities(reverse=True)]
+        self.assertEqual(offsets, [3.0, 2.0, 1.0, 0.0])
+        self.assertEqual(tree.getStartOffsetAfter(3.0), None)
+        self.assertEqual(tree.getStartOffsetBefore(0.0), None)
+        self.assertEqual(tree.getVerticalityAt(4.0).stopTimespans,
+            (timespans[3],))
+
+
+#------------------------------------------------------------------------------
+# define presented order in documentation
+_DOC_ORDER = [streamToTimespanCollection, TimespanCollection, Verticality,
+    VerticalitySpan, ElementTimespan]
+
+
+if __name__ == "__main__":
+    import music21
+    music21.mainTest(Test)
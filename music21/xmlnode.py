@@ -15,6 +15,7 @@ also by environment.py.
 '''
 
 import copy
+import io
 import xml.dom.minidom
 
 
@@ -70,6 +71,20 @@ def fixed_writexml(self, writer, indent="", addindent="", newl=""):
 
 
 
+def _escapeXml(data):
+    '''
+    Escape text for XML as xml.dom.minidom does when writing.
+
+    >>> xmlnode._escapeXml('a < b & "c"')
+    'a &lt; b &amp; &quot;c&quot;'
+    '''
+    if data:
+        data = data.replace("&", "&amp;").replace("<", "&lt;"). \
+                    replace("\"", "&quot;").replace(">", "&gt;")
+    return data
+
+
+
 #-------------------------------------------------------------------------------
 class XMLNodeException(exceptions21.Music21Exception):
     pass
@@ -549,7 +564,129 @@ class XMLNode(object):
 
     def xmlStr(self):
         '''Shortcut method to provide quick xml out.'''
-        return self.toxml(None, None, 1)
+        f = io.BytesIO()
+        self.xmlWrite(f)
+        return f.getvalue()
+
+    def xmlWrite(self, fileLike):
+        '''
+        Write this node as a complete XML document, encoded as utf-8, to
+        `fileLike` (a file, or anything else with a `write` method),
+        without building a DOM tree. The document is written in pieces as
+        it is made, so that large documents never need to be in memory
+        all at once as strings. The output is the same as that of
+        `self.toxml(None, None, True)`.
+
+        >>> from music21.musicxml import mxObjects
+        >>> a = mxObjects.Pitch()
+        >>> a.set('step', 'E')
+        >>> a.set('alter', -1)
+        >>> a.set('octave', 3)
+        >>> import io
+        >>> f = io.BytesIO()
+        >>> a.xmlWrite(f)
+        >>> print f.getvalue()
+        <?xml version="1.0" encoding="utf-8"?>
+        <!DOCTYPE score-partwise
+          PUBLIC '-//Recordare//DTD MusicXML 2.0 Partwise//EN'
+          'http://www.musicxml.org/dtds/partwise.dtd'>
+        <pitch>
+          <step>E</step>
+          <alter>-1</alter>
+          <octave>3</octave>
+        </pitch>
+        <BLANKLINE>
+        >>> f.getvalue() == a.toxml(None, None, True)
+        True
+        '''
+        pieces = [u'<?xml version="1.0" encoding="utf-8"?>\n']
+        if self._doctypeName != None:
+            pieces.append('<!DOCTYPE ' + self._doctypeName)
+            if self._doctypePublic:
+                pieces.append("\n  PUBLIC '%s'\n  '%s'" % (
+                    self._doctypePublic, self._doctypeSystem))
+            elif self._doctypeSystem:
+                pieces.append("\n  SYSTEM '%s'" % self._doctypeSystem)
+            pieces.append('>\n')
+
+        def flush():
+            fileLike.write(u''.join(pieces).encode('utf-8'))
+            del pieces[:]
+
+        self._xmlWriteNode(pieces, '', flush)
+        flush()
+
+    def _xmlWriteNode(self, pieces, indent, flush):
+        '''
+        Append the pieces of the XML of this node, as toxml would have
+        pretty-printed it at `indent`, to the list `pieces`, calling `flush`
+        to write them out when there are many.
+        '''
+        attributes = {}
+        for name, value in self._getAttributes():
+            if value in [None, '']: continue
+            attributes[name] = str(value)
+
+        # strings are text, tuples are simple elements
+        children = []
+        if self.charData != None:
+            try:
+                children.append(str(self.charData))
+            except UnicodeEncodeError:
+                # try raw data
+                children.append(self.charData)
+        for component in self._getComponents():
+            if component == None: continue
+            elif isinstance(component, tuple):
+                unused_tag, content = component
+                if content == None: continue
+                if type(content) == bool and content == False:
+                    continue
+                children.append(component)
+            elif isinstance(component, XMLNode):
+                children.append(component)
+            elif isinstance(component, list):
+                print(['cannot process component object', component])
+            else:
+                raise XMLNodeException(
+                    'cannot process component object: %s' % component)
+
+        pieces.append(indent + '<' + self._tag)
+        for name in sorted(attributes):
+            pieces.append(' %s="' % name)
+            pieces.append(_escapeXml(attributes[name]))
+            pieces.append('"')
+        if not children:
+            pieces.append('/>\n')
+            return
+        pieces.append('>')
+        if len(children) == 1 and isinstance(children[0], basestring):
+            pieces.append(_escapeXml(children[0]))
+        else:
+            pieces.append('\n')
+            childIndent = indent + '  '
+            for child in children:
+                if isinstance(child, basestring):
+                    pieces.append(_escapeXml(childIndent + child + '\n'))
+                elif isinstance(child, tuple):
+                    tag, content = child
+                    if type(content) == bool and content == True:
+                        pieces.append(childIndent + '<' + tag + '/>\n')
+                        continue
+                    try:
+                        entry = unicode(content, errors='replace')
+                    except TypeError:
+                        entry = u"%s" % content
+                    except RuntimeError:  # IronPython
+                        entry = u"%s" % content
+                    pieces.append(childIndent + '<' + tag + '>' +
+                        _escapeXml(entry) + '</' + tag + '>\n')
+                else:
+                    child._xmlWriteNode(pieces, childIndent, flush)
+                    if len(pieces) > 4096:
+                        flush()
+            pieces.append(indent)
+        pieces.append('</%s>\n' % self._tag)
 
 
 